@@ -5,15 +5,25 @@ Includes deduplication logic to show each tender only once with best access link
 """
 
 import asyncio
+import contextvars
+import functools
 import aiohttp
-from bs4 import BeautifulSoup
+import httpx
+from selectolax.lexbor import LexborHTMLParser
+from html_utils import select_all, select_descendant
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 import os
-from datetime import datetime, timedelta
-from urllib.parse import quote_plus, urljoin
+import random
+from datetime import datetime, timedelta, timezone
+from urllib.parse import quote_plus, urljoin, urlparse
+from email.utils import parsedate_to_datetime
 import re
 import logging
 import hashlib
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
 from playwright.async_api import async_playwright
 
@@ -136,6 +146,203 @@ PLATFORM_PRIORITY = {
     'simap.ch (Schweiz)': 90,
 }
 
+# CSS selectors shared by the platform scrapers. Selector groups match in
+# document order, so each distinct group is defined once here.
+TITLE_SELECTOR = 'a, h2, h3, .title'
+TITLE_SELECTOR_SHORT = 'a, .title'
+TITLE_SELECTOR_EXTENDED = 'a, h2, h3, .title, .tender-title'
+DESCRIPTION_SELECTOR = '.description, p, .summary'
+LISTING_SELECTOR = 'table tr, .tender-item, article, .ausschreibung, .search-result'
+TENDER_LIST_SELECTOR = '.tender-item, article, .publication, table tr, .search-result'
+PUBLICATION_SELECTOR = 'table tr, .publication-item, article'
+PUBLICATION_SEARCH_SELECTOR = 'table tr, .publication-item, .searchResult, article'
+
+# Conditional-request cache shared by all scraper runs of this process
+# (the server re-runs the scraper every minute): url -> (validators, body).
+# PARSE_CACHE keeps the tenders parsed from exactly that body, so a 304
+# skips both the download and the parse. Bodies over HTTP_CACHE_MAX_BODY_BYTES
+# are not cached, which keeps the cache under ~256 MiB of page bodies.
+HTTP_CACHE_MAX_ENTRIES = 256
+HTTP_CACHE_MAX_BODY_BYTES = 1024 * 1024
+HTTP_CACHE = {}
+PARSE_CACHE = {}
+
+# Listing pages are parsed on these threads instead of the event loop
+PARSE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='html-parse')
+
+# Label of the platform scraper running in the current task, set by _run_scraper
+# so fetches can be credited to their platform
+CURRENT_SCRAPER = contextvars.ContextVar('current_scraper', default=None)
+
+# General construction and public tender terms - expanded list
+GENERAL_RELEVANCE_TERMS = [
+    'projektsteuerung', 'projektsteuerungsleistung', 'projektsteuerungsleistungen',
+    'baumanagement', 'generalplanung', 'objektplanung',
+    'fachplanung', 'technische ausrüstung', 'tragwerksplanung', 'bauphysik',
+    'architekten', 'ingenieur', 'planung', 'bau', 'neubau', 'sanierung',
+    'modernisierung', 'erweiterung', 'umbau', 'hochbau', 'tiefbau',
+    'dienstleistung', 'beratung', 'consulting', 'management',
+    # Bauwesen and Building Construction terms
+    'bauwesen', 'bauleistung', 'bauleistungen', 'bauarbeiten', 'bauauftrag',
+    'bauwerk', 'bauvorhaben', 'bauprojekt', 'building construction',
+    'rohbau', 'ausbau', 'anbau', 'erweiterungsbau',
+    # Additional broad terms to capture more relevant tenders
+    'ausschreibung', 'vergabe', 'auftrag', 'lieferung', 'leistung',
+    'deutschland', 'öffentlich', 'beschaffung', 'rahmenvertrag',
+    'infrastruktur', 'gebäude',
+    'krankenhaus', 'klinik', 'schule', 'universität', 'rathaus',
+    'renovierung', 'instandsetzung', 'wartung', 'installation',
+    'elektro', 'heizung', 'lüftung', 'sanitär', 'dach', 'fassade',
+    'architekturbüro', 'planungsbüro', 'ingenieurbüro',
+    # Messe/Exhibition specific
+    'messe', 'messebau', 'messegelände', 'exhibition', 'kongresszentrum',
+    # TED Europa / EU tender terms (English)
+    'construction management', 'project management', 'architectural', 'engineering',
+    'ted notice', 'eu tender', 'cpv'
+]
+
+# Everything is_relevant_tender accepts - service keywords, CPV base codes and
+# the general terms - as one alternation, so a title is scanned once
+RELEVANCE_RE = re.compile('|'.join(
+    re.escape(term) for term in sorted(
+        {kw for keywords in SERVICE_KEYWORDS.values() for kw in keywords}
+        | set(CPV_CODES_BASE)
+        | set(GENERAL_RELEVANCE_TERMS),
+        key=len, reverse=True
+    )
+))
+
+def _compile_keyword_table(table: dict) -> list:
+    """One alternation per entry, kept in table order (the first matching entry wins)"""
+    return [
+        (name, re.compile('|'.join(re.escape(kw) for kw in keywords)))
+        for name, keywords in table.items()
+    ]
+
+SERVICE_PATTERNS = _compile_keyword_table(SERVICE_KEYWORDS)
+TYPOLOGY_PATTERNS = _compile_keyword_table(TYPOLOGY_KEYWORDS)
+
+def _first_match(patterns: list, text: str):
+    for name, pattern in patterns:
+        if pattern.search(text):
+            return name
+    return None
+
+# The same tender is republished across aggregators and Land portals, so
+# categorization is memoized on the normalized text
+@functools.lru_cache(maxsize=50_000)
+def categorize_text(text: str) -> tuple:
+    """Return (category, building_typology) for lowercased, whitespace-collapsed text"""
+    return _first_match(SERVICE_PATTERNS, text), _first_match(TYPOLOGY_PATTERNS, text)
+
+# Status fields every newly scraped tender starts with
+NEW_TENDER_FIELDS = {
+    'status': 'New',
+    'is_applied': False,
+    'application_status': 'Not Applied',
+}
+
+def tender_source_id(platform_source: str, title: str) -> str:
+    """Stable per-platform tender id; unlike hash() it is the same in every process"""
+    digest = hashlib.blake2b(title.encode('utf-8'), digest_size=8).hexdigest()
+    return f"{platform_source}_{digest}"
+
+# Search URL templates per platform, used to build application links
+APPLICATION_URL_TEMPLATES = {
+    'Vergabe Bayern': "https://www.auftraege.bayern.de/NetServer/PublicationSearchControllerServlet?searchText={q}",
+    'e-Vergabe NRW': "https://www.evergabe.nrw.de/VMPSatellite/public/search?q={q}",
+    'Vergabeplattform Berlin': "https://www.berlin.de/vergabeplattform/veroeffentlichungen/bekanntmachungen/?q={q}",
+    'Hamburg Vergabe': "https://fbhh-evergabe.web.hamburg.de/evergabe.bieter/eva/supplierportal/fhh/subproject/search?searchText={q}",
+    'Sachsen Vergabe': "https://www.sachsen-vergabe.de/vergabe/bekanntmachung/?search={q}",
+    'Vergabe Baden-Württemberg': "https://vergabe.landbw.de/NetServer/PublicationSearchControllerServlet?searchText={q}",
+    'HAD Hessen': "https://www.had.de/NetServer/PublicationSearchControllerServlet?searchText={q}",
+    'Vergabe Niedersachsen': "https://vergabe.niedersachsen.de/NetServer/PublicationSearchControllerServlet?searchText={q}",
+    'Vergabe Bremen': "https://www.vergabe.bremen.de/NetServer/PublicationSearchControllerServlet?searchText={q}",
+    'Vergabemarktplatz Brandenburg': "https://vergabemarktplatz.brandenburg.de/VMPSatellite/public/search?q={q}",
+    'Vergabe Rheinland-Pfalz': "https://www.vergabe.rlp.de/VMPSatellite/public/search?q={q}",
+    'Vergabe Saarland': "https://vergabe.saarland/NetServer/PublicationSearchControllerServlet?searchText={q}",
+    'eVergabe Sachsen-Anhalt': "https://www.evergabe.sachsen-anhalt.de/NetServer/PublicationSearchControllerServlet?searchText={q}",
+    'e-Vergabe Schleswig-Holstein': "https://www.e-vergabe-sh.de/NetServer/PublicationSearchControllerServlet?searchText={q}",
+    'Vergabe Thüringen': "https://www.thueringen.de/vergabe?search={q}",
+    'Bund.de': "https://www.service.bund.de/Content/DE/Ausschreibungen/Suche/Ergebnis.html?searchText={q}",
+    'TED Europa': "https://ted.europa.eu/de/search/result?q={q}",
+    'DTVP': "https://www.dtvp.de/Center/common/project/search.do?search={q}",
+    'Öffentliche Vergabe': "https://www.oeffentlichevergabe.de/search?q={q}",
+    'Ausschreibungen Deutschland': "https://ausschreibungen-deutschland.de/?search={q}",
+    'e-Vergabe Online': "https://www.evergabe-online.de/search?q={q}",
+    'ibau': "https://www.ibau.de/ausschreibungen/?q={q}",
+    'Charité': "https://vergabeplattform.charite.de/search?q={q}",
+    'Vivantes': "https://www.vivantes.de/unternehmen/ausschreibungen?search={q}",
+    'UKE Hamburg': "https://www.uke.de/organisationsstruktur/tochtergesellschaften/kfe/ausschreibungen?search={q}",
+    'Fraunhofer': "https://vergabe.fraunhofer.de/?search={q}",
+    'simap.ch (Schweiz)': "https://www.simap.ch/en/search?q={q}",
+}
+
+def decode_body(raw: bytes, charset: str = None):
+    """Keep UTF-8 (or undeclared) bodies as bytes for Lexbor to decode natively;
+    only bodies with another declared charset are decoded up front."""
+    if charset and charset.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+        try:
+            return raw.decode(charset, errors='replace')
+        except LookupError:
+            pass
+    return raw
+
+def parse_html(html) -> LexborHTMLParser:
+    """Parse a fetched page; byte input honours <meta charset> and BOMs"""
+    return LexborHTMLParser(html, encoding=True)
+
+def extract_listing_rows(html, item_selector: str, title_selector: str,
+                         description_selector: str = None, min_title_length: int = 15) -> tuple:
+    """Parse a listing page and return (item count, [(title, href, description), ...]).
+    Runs in PARSE_POOL, so it only touches its arguments; Lexbor releases the GIL
+    while building the tree."""
+    tree = parse_html(html)
+    items = select_all(tree, item_selector)
+    rows = []
+    seen_titles = set()
+    
+    for item in items:
+        title_elem = select_descendant(item, title_selector)
+        # Childless elements (icon links, empty cells) have no text to walk
+        if not title_elem or title_elem.child is None:
+            continue
+        
+        title = title_elem.text(strip=True)
+        if len(title) <= min_title_length:
+            continue
+        # Overlapping selectors (rows, nested links) yield the same title repeatedly
+        if title in seen_titles:
+            continue
+        seen_titles.add(title)
+        
+        href = (title_elem.attributes.get('href') or '') if title_elem.tag == 'a' else ''
+        description = ""
+        if description_selector:
+            desc_elem = select_descendant(item, description_selector)
+            description = desc_elem.text(strip=True) if desc_elem else ""
+        rows.append((title, href, description))
+    
+    return len(items), rows
+
+def extract_dtvp_rows(html) -> tuple:
+    """Parse a DTVP result page and return (item count, [(title, href), ...]).
+    Titles are read in full and duplicates kept; scrape_dtvp dedups by tender ID."""
+    tree = parse_html(html)
+    items = select_all(tree, '.searchResult, article, .tender-item, table tr, .project-row')
+    rows = []
+    
+    for item in items:
+        title_elem = select_descendant(item, 'a, h2, .title, td a')
+        if not title_elem or title_elem.child is None:
+            continue
+        title = title_elem.text(strip=True)
+        if len(title) > 15:
+            href = (title_elem.attributes.get('href') or '') if title_elem.tag == 'a' else ''
+            rows.append((title, href))
+    
+    return len(items), rows
+
 class ComprehensiveScraper:
     # Minimum publication date - only tenders published on or after this date will be saved
     MIN_PUBLICATION_DATE = datetime(2026, 1, 1)
@@ -146,15 +353,444 @@ class ComprehensiveScraper:
     # Number of pages to scrape per platform
     PAGES_TO_SCRAPE = 5
     
+    # Time budget per single-listing platform scraper, so one hung portal can't stall
+    # the whole run; a scraper that times out contributes no tenders
+    SCRAPER_TIMEOUT = 300
+    
+    # Platform scrapers running at once; the Playwright scrapers each hold a browser
+    MAX_CONCURRENT_SCRAPERS = 5
+    
+    # With scrape_all(skip_recent=True), platforms whose tenders were saved more
+    # recently than this are skipped; the scheduler starts a run every minute, far
+    # more often than portals change
+    CHECKPOINT_MAX_AGE = timedelta(minutes=10)
+    
+    # Set once the tenders indexes exist, so repeated runs skip create_index
+    _indexes_ready = False
+    
+    # Upper bound on in-flight HTTP requests across all platforms, and attempts per request
+    MAX_CONCURRENT_REQUESTS = 10
+    FETCH_RETRIES = 4
+    
+    # Statuses meaning the host is under pressure: retried after Retry-After (or a
+    # randomized 8-15s delay, doubled per attempt, at most RETRY_MAX_DELAY)
+    RETRY_STATUSES = (429, 503)
+    RETRY_MAX_DELAY = 60
+    
+    # Listing pages are a few hundred KB; anything far larger is not a result page
+    MAX_PAGE_BYTES = 16 * 1024 * 1024
+    
+    # Listing-style platforms handled by _scrape_platform. Each entry describes
+    # where to fetch, how to find items and which fixed fields to stamp on them.
+    # 'link_base' resolves relative links (None keeps them as-is), 'direct_link'
+    # False omits the link, and a missing 'platform_url' means the fetched URL.
+    PLATFORMS = [
+        # German federal platforms
+        {
+            'name': 'e-Vergabe Online',
+            'urls': ["https://www.evergabe-online.de/"],
+            'items': TENDER_LIST_SELECTOR,
+            'title': TITLE_SELECTOR,
+            'link_base': 'https://www.evergabe-online.de',
+            'description_prefix': 'e-Vergabe Ausschreibung: ',
+            'location': 'Deutschland',
+            'project_type': 'Federal Tender',
+            'contracting_authority': 'Bundesauftraggeber',
+            'platform_source': 'e-Vergabe Online',
+            'platform_url': 'https://www.evergabe-online.de',
+        },
+        {
+            'name': 'Öffentliche Vergabe',
+            'urls': ["https://www.oeffentlichevergabe.de/"],
+            'items': '.tender-item, article, .publication, table tr, .search-result, .vergabe-item',
+            'title': TITLE_SELECTOR,
+            'link_base': 'https://www.oeffentlichevergabe.de',
+            'description_prefix': 'Öffentliche Vergabe: ',
+            'location': 'Deutschland',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Öffentlicher Auftraggeber',
+            'platform_source': 'Öffentliche Vergabe',
+            'platform_url': 'https://www.oeffentlichevergabe.de',
+        },
+        {
+            'name': 'ibau',
+            'urls': ["https://www.ibau.de/ausschreibungen/"],
+            'items': LISTING_SELECTOR,
+            'title': TITLE_SELECTOR,
+            'link_base': 'https://www.ibau.de',
+            'description_prefix': 'ibau Ausschreibung: ',
+            'location': 'Deutschland',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Öffentlicher Auftraggeber',
+            'platform_source': 'ibau',
+            'platform_url': 'https://www.ibau.de',
+        },
+        {
+            'name': 'evergabe.de',
+            'urls': ["https://www.evergabe.de/"],
+            'items': TENDER_LIST_SELECTOR,
+            'title': TITLE_SELECTOR,
+            'link_base': None,
+            'description_prefix': 'eVergabe Ausschreibung: ',
+            'location': 'Deutschland',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Öffentlicher Auftraggeber',
+            'platform_source': 'eVergabe.de',
+            'platform_url': 'https://www.evergabe.de',
+        },
+        # German state platforms
+        {
+            'name': 'NRW',
+            'urls': ["https://www.evergabe.nrw.de/VMPSatellite/public/search"],
+            'items': 'table.searchResults tr, .publication-item, .tender-row, article',
+            'title': TITLE_SELECTOR_SHORT,
+            'min_title_length': 20,
+            'description': '.description, td:nth-child(2)',
+            'link_base': 'https://www.evergabe.nrw.de',
+            'description_prefix': 'Ausschreibung NRW: ',
+            'location': 'Nordrhein-Westfalen',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Land NRW',
+            'platform_source': 'e-Vergabe NRW',
+            'platform_url': 'https://www.evergabe.nrw.de',
+        },
+        {
+            'name': 'Berlin',
+            'urls': [
+                "https://www.berlin.de/vergabeplattform/veroeffentlichungen/bekanntmachungen/",
+                "https://my.vergabeplattform.berlin.de/"
+            ],
+            'items': 'article, .list-item, table tr, .modul-teaser, .tender-item',
+            'title': 'h2 a, h3 a, .title a, a.link',
+            'description': 'p, .description, .text',
+            'link_base': 'https://www.berlin.de',
+            'description_prefix': 'Ausschreibung Berlin: ',
+            'location': 'Berlin',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Land Berlin',
+            'platform_source': 'Vergabeplattform Berlin',
+            'platform_url': 'https://www.berlin.de/vergabeplattform',
+        },
+        {
+            'name': 'Hamburg',
+            'urls': [
+                "https://fbhh-evergabe.web.hamburg.de/evergabe.bieter/eva/supplierportal/fhh/tabs/home",
+                "https://www.hamburg.de/wirtschaft/ausschreibungen-wirtschaft/"
+            ],
+            'items': TENDER_LIST_SELECTOR,
+            'title': TITLE_SELECTOR_SHORT,
+            'link_base': None,
+            'description_prefix': 'Ausschreibung Hamburg: ',
+            'location': 'Hamburg',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Freie und Hansestadt Hamburg',
+            'platform_source': 'Hamburg Vergabe',
+        },
+        {
+            'name': 'Baden-Württemberg',
+            'urls': [
+                "https://vergabe.landbw.de/NetServer/PublicationSearchControllerServlet",
+                "https://www.service-bw.de/web/guest/suche/-/leistungen/category/1005"
+            ],
+            'items': 'table tr, .publication-item, article, .search-result',
+            'title': TITLE_SELECTOR_SHORT,
+            'direct_link': False,
+            'description_prefix': 'Ausschreibung Baden-Württemberg: ',
+            'location': 'Baden-Württemberg',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Land Baden-Württemberg',
+            'platform_source': 'Vergabe Baden-Württemberg',
+        },
+        {
+            'name': 'Hessen HAD',
+            'urls': ["https://www.had.de/NetServer/PublicationSearchControllerServlet"],
+            'items': 'table tr, .publication-item',
+            'title': TITLE_SELECTOR_SHORT,
+            'direct_link': False,
+            'description_prefix': 'Ausschreibung Hessen: ',
+            'location': 'Hessen',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Land Hessen',
+            'platform_source': 'HAD Hessen',
+            'platform_url': 'https://www.had.de',
+        },
+        {
+            'name': 'Brandenburg',
+            'urls': [
+                "https://vergabemarktplatz.brandenburg.de/VMPSatellite/public/search",
+                "https://www.aumass.de/ausschreibungen/brandenburg"
+            ],
+            'items': PUBLICATION_SEARCH_SELECTOR,
+            'title': TITLE_SELECTOR_SHORT,
+            'direct_link': False,
+            'description_prefix': 'Ausschreibung Brandenburg: ',
+            'location': 'Brandenburg',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Land Brandenburg',
+            'platform_source': 'Vergabemarktplatz Brandenburg',
+        },
+        {
+            'name': 'Niedersachsen',
+            'urls': ["https://vergabe.niedersachsen.de/NetServer/PublicationSearchControllerServlet"],
+            'items': PUBLICATION_SELECTOR,
+            'title': TITLE_SELECTOR_SHORT,
+            'direct_link': False,
+            'description_prefix': 'Ausschreibung Niedersachsen: ',
+            'location': 'Niedersachsen',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Land Niedersachsen',
+            'platform_source': 'Vergabe Niedersachsen',
+            'platform_url': 'https://vergabe.niedersachsen.de',
+        },
+        {
+            'name': 'Rheinland-Pfalz',
+            'urls': [
+                "https://www.vergabe.rlp.de/VMPSatellite/public/search",
+                "https://www.rlp.vergabekommunal.de/"
+            ],
+            'items': PUBLICATION_SEARCH_SELECTOR,
+            'title': TITLE_SELECTOR_SHORT,
+            'direct_link': False,
+            'description_prefix': 'Ausschreibung Rheinland-Pfalz: ',
+            'location': 'Rheinland-Pfalz',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Land Rheinland-Pfalz',
+            'platform_source': 'Vergabe Rheinland-Pfalz',
+        },
+    ] + [
+        # Other German states
+        {
+            'name': state,
+            'urls': [url],
+            'items': PUBLICATION_SELECTOR,
+            'title': TITLE_SELECTOR_SHORT,
+            'direct_link': False,
+            'description_prefix': f'Ausschreibung {state}: ',
+            'location': state,
+            'project_type': 'Public Tender',
+            'contracting_authority': f'Land {state}',
+            'platform_source': f'Vergabe {state}',
+        }
+        for state, url in {
+            'Saarland': 'https://vergabe.saarland/NetServer/PublicationSearchControllerServlet',
+            'Sachsen-Anhalt': 'https://www.evergabe.sachsen-anhalt.de/NetServer/PublicationSearchControllerServlet',
+            'Schleswig-Holstein': 'https://www.e-vergabe-sh.de/NetServer/PublicationSearchControllerServlet',
+            'Sachsen': 'https://www.sachsen-vergabe.de/vergabe/bekanntmachung/',
+            'Bremen': 'https://www.vergabe.bremen.de/NetServer/PublicationSearchControllerServlet',
+            'Thüringen': 'https://www.thueringen.de/vergabe/',
+        }.items()
+    ] + [
+        # Hospital/Klinik platforms
+        {
+            'name': hospital,
+            'urls': [url],
+            'items': LISTING_SELECTOR,
+            'title': TITLE_SELECTOR,
+            'link_base': url,
+            'description_prefix': f'{hospital} Ausschreibung: ',
+            'location': 'Deutschland',
+            'project_type': 'Hospital Tender',
+            'contracting_authority': hospital,
+            'building_typology': 'Healthcare',
+            'platform_source': hospital,
+        }
+        for hospital, url in {
+            'Charité': 'https://vergabeplattform.charite.de',
+            'Vivantes': 'https://www.vivantes.de/unternehmen/ausschreibungen',
+            'UKE Hamburg': 'https://www.uke.de/organisationsstruktur/tochtergesellschaften/kfe/ausschreibungen',
+            'Pfalzklinikum': 'https://www.pfalzklinikum.de/ueber-uns/ausschreibungen',
+            'KMG Kliniken': 'https://kmg-kliniken.de/ausschreibungen-und-vergaben',
+            'Klinikverbund Südwest': 'https://www.klinikverbund-suedwest.de/der-klinikverbund-suedwest/ansprechpartner/gebaeudemanagement-technische-infrastruktur/ausschreibungen',
+            'Sana Kliniken': 'https://www.sana.de/',
+            'Helios Kliniken': 'https://www.helios-gesundheit.de/',
+            'Asklepios Kliniken': 'https://www.asklepios.com',
+            'Ammerland Klinik': 'https://www.ammerland-klinik.de/ausschreibungen',
+        }.items()
+    ] + [
+        {
+            'name': 'Fraunhofer',
+            'urls': ["https://vergabe.fraunhofer.de/"],
+            'items': 'table tr, .tender-item, article, .ausschreibung',
+            'title': TITLE_SELECTOR,
+            'link_base': None,
+            'description_prefix': 'Fraunhofer Ausschreibung: ',
+            'location': 'Deutschland',
+            'project_type': 'Research Institution Tender',
+            'contracting_authority': 'Fraunhofer Gesellschaft',
+            'platform_source': 'Fraunhofer',
+        },
+        # Additional German platforms (user requested)
+        {
+            'name': 'Tender Impulse',
+            'urls': [
+                "https://www.tenderimpulse.com/germany-tenders",
+                "https://www.tenderimpulse.com/germany-public-projects"
+            ],
+            'items': '.tender-item, .project-item, article, table tr, .search-result, .card',
+            'title': TITLE_SELECTOR_EXTENDED,
+            'description': DESCRIPTION_SELECTOR,
+            'link_base': 'https://www.tenderimpulse.com',
+            'description_prefix': 'Tender Impulse: ',
+            'location': 'Deutschland',
+            'project_type': 'Public Project',
+            'contracting_authority': 'Public Authority Germany',
+            'platform_source': 'Tender Impulse',
+            'platform_url': 'https://www.tenderimpulse.com',
+        },
+        {
+            'name': 'vergabe24.de',
+            'urls': ["https://www.vergabe24.de/"],
+            'items': '.tender-item, .vergabe-item, article, table tr, .search-result, .ausschreibung',
+            'title': TITLE_SELECTOR,
+            'link_base': 'https://www.vergabe24.de',
+            'description_prefix': 'vergabe24 Ausschreibung: ',
+            'location': 'Deutschland',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Öffentlicher Auftraggeber',
+            'platform_source': 'vergabe24',
+            'platform_url': 'https://www.vergabe24.de',
+        },
+        {
+            'name': 'DTAD',
+            'urls': ["https://www.dtad.de/"],
+            'items': '.tender-item, .ausschreibung, article, table tr, .search-result, .project-card',
+            'title': TITLE_SELECTOR_EXTENDED,
+            'link_base': 'https://www.dtad.de',
+            'description_prefix': 'DTAD Ausschreibung: ',
+            'location': 'Deutschland',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Öffentlicher Auftraggeber',
+            'platform_source': 'DTAD',
+            'platform_url': 'https://www.dtad.de',
+        },
+        {
+            'name': 'CWC Tenders',
+            'urls': ["https://www.cwctenders.com/de/index.php"],
+            'items': '.tender-item, article, table tr, .search-result, .tender-row',
+            'title': TITLE_SELECTOR,
+            'link_base': 'https://www.cwctenders.com',
+            'description_prefix': 'CWC Tender: ',
+            'location': 'Deutschland',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Public Authority',
+            'platform_source': 'CWC Tenders',
+            'platform_url': 'https://www.cwctenders.com',
+        },
+        {
+            'name': 'BiddingSource',
+            'urls': ["https://www.biddingsource.com/tenders/"],
+            'items': '.tender-item, article, table tr, .search-result, .card, .tender-card',
+            'title': TITLE_SELECTOR_EXTENDED,
+            'link_base': 'https://www.biddingsource.com',
+            'description_prefix': 'BiddingSource: ',
+            'location': 'Deutschland',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Public Authority',
+            'platform_source': 'BiddingSource',
+            'platform_url': 'https://www.biddingsource.com',
+        },
+        {
+            'name': 'A24 Sales Cloud',
+            'urls': ["https://a24salescloud.de/"],
+            'items': '.tender-item, article, table tr, .search-result, .project-card, .ausschreibung',
+            'title': TITLE_SELECTOR,
+            'link_base': 'https://a24salescloud.de',
+            'description_prefix': 'A24 Sales Cloud: ',
+            'location': 'Deutschland',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Öffentlicher Auftraggeber',
+            'platform_source': 'A24 Sales Cloud',
+            'platform_url': 'https://a24salescloud.de',
+        },
+        {
+            'name': 'Berlin Procurement',
+            'urls': [
+                "https://my.vergabeplattform.berlin.de/",
+                "https://www.berlin.de/vergabeplattform/"
+            ],
+            'items': '.tender-item, article, table tr, .search-result, .vergabe-item, .modul-teaser',
+            'title': TITLE_SELECTOR,
+            'link_base': 'https://www.berlin.de',
+            'description_prefix': 'Berlin Procurement: ',
+            'location': 'Berlin',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Land Berlin',
+            'platform_source': 'Berlin Procurement Cooperation',
+        },
+        {
+            'name': 'LZBW',
+            'urls': ["https://www.lzbw.de/ausschreibungen"],
+            'items': '.tender-item, article, table tr, .search-result, .ausschreibung, .content-item',
+            'title': TITLE_SELECTOR,
+            'link_base': 'https://www.lzbw.de',
+            'description_prefix': 'LZBW Ausschreibung: ',
+            'location': 'Baden-Württemberg',
+            'project_type': 'State Tender',
+            'contracting_authority': 'Logistikzentrum Baden-Württemberg',
+            'platform_source': 'LZBW',
+            'platform_url': 'https://www.lzbw.de',
+        },
+        {
+            'name': 'D&E BauNetzwerk',
+            'urls': ["https://www.de-baunetzwerk.de/"],
+            'items': '.tender-item, .project-item, article, table tr, .search-result, .bauvorhaben',
+            'title': 'a, h2, h3, .title, .project-title',
+            'description': DESCRIPTION_SELECTOR,
+            'link_base': 'https://www.de-baunetzwerk.de',
+            'description_prefix': 'D&E BauNetzwerk: ',
+            'location': 'Deutschland',
+            'project_type': 'Construction Project',
+            'contracting_authority': 'Bauherr',
+            'platform_source': 'D&E BauNetzwerk',
+            'platform_url': 'https://www.de-baunetzwerk.de',
+        },
+        {
+            'name': 'Global Tenders Germany',
+            'urls': ["https://www.globaltenders.com/tenders-by-country/germany-tenders/"],
+            'items': '.tender-item, article, table tr, .search-result, .tender-row, .card',
+            'title': TITLE_SELECTOR_EXTENDED,
+            'link_base': 'https://www.globaltenders.com',
+            'description_prefix': 'Global Tenders: ',
+            'location': 'Deutschland',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Public Authority Germany',
+            'platform_source': 'Global Tenders Germany',
+            'platform_url': 'https://www.globaltenders.com',
+        },
+        {
+            'name': 'AUMASS',
+            'urls': [
+                "https://www.aumass.de/ausschreibungen/",
+                "https://www.aumass.de/ausschreibungen/brandenburg"
+            ],
+            'items': '.tender-item, article, table tr, .search-result, .ausschreibung-item',
+            'title': TITLE_SELECTOR,
+            'link_base': 'https://www.aumass.de',
+            'description_prefix': 'AUMASS Ausschreibung: ',
+            'location': 'Deutschland',
+            'project_type': 'Public Tender',
+            'contracting_authority': 'Öffentlicher Auftraggeber',
+            'platform_source': 'AUMASS',
+            'platform_url': 'https://www.aumass.de',
+        },
+    ]
+    
     def __init__(self, db):
         self.db = db
         self.session = None
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'de-DE,de;q=0.9,en;q=0.8'
+            'Accept-Language': 'de-DE,de;q=0.9,en;q=0.8',
+            # aiohttp decodes br transparently when Brotli is installed
+            'Accept-Encoding': 'br, gzip, deflate'
         }
         self.seen_tenders = {}  # For deduplication
+        self._request_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._scraper_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SCRAPERS)
+        self._host_ready_at = {}  # host -> loop time before which requests to it wait
+        self._completed_scrapers = {}  # label -> tenders of scrapers that finished without error
+        self._fetched_scrapers = set()  # labels of scrapers that got at least one page
     
     def is_tender_in_date_range(self, publication_date: datetime) -> bool:
         """Check if tender publication date is >= MIN_PUBLICATION_DATE (Jan 1, 2025)"""
@@ -208,20 +844,8 @@ class ComprehensiveScraper:
     
     def categorize_tender(self, title: str, description: str = "") -> dict:
         """Categorize tender based on company services"""
-        text = f"{title} {description}".lower()
-        
-        category = None
-        for cat_name, keywords in SERVICE_KEYWORDS.items():
-            if any(kw in text for kw in keywords):
-                category = cat_name
-                break
-        
-        building_typology = None
-        for typ_name, keywords in TYPOLOGY_KEYWORDS.items():
-            if any(kw in text for kw in keywords):
-                building_typology = typ_name
-                break
-        
+        text = ' '.join(f"{title} {description}".lower().split())
+        category, building_typology = categorize_text(text)
         return {'category': category, 'building_typology': building_typology}
     
     def extract_budget(self, text: str) -> str:
@@ -264,102 +888,128 @@ class ComprehensiveScraper:
     
     def is_relevant_tender(self, title: str, description: str = "") -> bool:
         """Check if tender matches company services - more permissive to capture more tenders"""
-        text = f"{title} {description}".lower()
-        
-        # Check service keywords
-        for keywords in SERVICE_KEYWORDS.values():
-            if any(kw in text for kw in keywords):
-                return True
-        
-        # Check CPV codes - these are construction/project management codes
-        for cpv_code in CPV_CODES_BASE.keys():
-            if cpv_code in text:
-                return True
-        
-        # General construction and public tender terms - expanded list
-        general_terms = [
-            'projektsteuerung', 'projektsteuerungsleistung', 'projektsteuerungsleistungen',
-            'baumanagement', 'generalplanung', 'objektplanung',
-            'fachplanung', 'technische ausrüstung', 'tragwerksplanung', 'bauphysik',
-            'architekten', 'ingenieur', 'planung', 'bau', 'neubau', 'sanierung',
-            'modernisierung', 'erweiterung', 'umbau', 'hochbau', 'tiefbau',
-            'dienstleistung', 'beratung', 'consulting', 'management',
-            # Bauwesen and Building Construction terms
-            'bauwesen', 'bauleistung', 'bauleistungen', 'bauarbeiten', 'bauauftrag',
-            'bauwerk', 'bauvorhaben', 'bauprojekt', 'building construction',
-            'rohbau', 'ausbau', 'anbau', 'erweiterungsbau',
-            # Additional broad terms to capture more relevant tenders
-            'ausschreibung', 'vergabe', 'auftrag', 'lieferung', 'leistung',
-            'deutschland', 'öffentlich', 'beschaffung', 'rahmenvertrag',
-            'infrastruktur', 'gebäude',
-            'krankenhaus', 'klinik', 'schule', 'universität', 'rathaus',
-            'renovierung', 'instandsetzung', 'wartung', 'installation',
-            'elektro', 'heizung', 'lüftung', 'sanitär', 'dach', 'fassade',
-            'architekturbüro', 'planungsbüro', 'ingenieurbüro',
-            # Messe/Exhibition specific
-            'messe', 'messebau', 'messegelände', 'exhibition', 'kongresszentrum',
-            # TED Europa / EU tender terms (English)
-            'construction management', 'project management', 'architectural', 'engineering',
-            'ted notice', 'eu tender', 'cpv'
-        ]
-        if any(term in text for term in general_terms):
-            return True
-        
-        return False
+        return RELEVANCE_RE.search(f"{title} {description}".lower()) is not None
     
     def generate_application_url(self, title: str, platform_name: str, base_url: str) -> str:
         """Generate search URL for the specific tender"""
-        encoded_title = quote_plus(title[:80])
-        
-        url_templates = {
-            'Vergabe Bayern': f"https://www.auftraege.bayern.de/NetServer/PublicationSearchControllerServlet?searchText={encoded_title}",
-            'e-Vergabe NRW': f"https://www.evergabe.nrw.de/VMPSatellite/public/search?q={encoded_title}",
-            'Vergabeplattform Berlin': f"https://www.berlin.de/vergabeplattform/veroeffentlichungen/bekanntmachungen/?q={encoded_title}",
-            'Hamburg Vergabe': f"https://fbhh-evergabe.web.hamburg.de/evergabe.bieter/eva/supplierportal/fhh/subproject/search?searchText={encoded_title}",
-            'Sachsen Vergabe': f"https://www.sachsen-vergabe.de/vergabe/bekanntmachung/?search={encoded_title}",
-            'Vergabe Baden-Württemberg': f"https://vergabe.landbw.de/NetServer/PublicationSearchControllerServlet?searchText={encoded_title}",
-            'HAD Hessen': f"https://www.had.de/NetServer/PublicationSearchControllerServlet?searchText={encoded_title}",
-            'Vergabe Niedersachsen': f"https://vergabe.niedersachsen.de/NetServer/PublicationSearchControllerServlet?searchText={encoded_title}",
-            'Vergabe Bremen': f"https://www.vergabe.bremen.de/NetServer/PublicationSearchControllerServlet?searchText={encoded_title}",
-            'Vergabemarktplatz Brandenburg': f"https://vergabemarktplatz.brandenburg.de/VMPSatellite/public/search?q={encoded_title}",
-            'Vergabe Rheinland-Pfalz': f"https://www.vergabe.rlp.de/VMPSatellite/public/search?q={encoded_title}",
-            'Vergabe Saarland': f"https://vergabe.saarland/NetServer/PublicationSearchControllerServlet?searchText={encoded_title}",
-            'eVergabe Sachsen-Anhalt': f"https://www.evergabe.sachsen-anhalt.de/NetServer/PublicationSearchControllerServlet?searchText={encoded_title}",
-            'e-Vergabe Schleswig-Holstein': f"https://www.e-vergabe-sh.de/NetServer/PublicationSearchControllerServlet?searchText={encoded_title}",
-            'Vergabe Thüringen': f"https://www.thueringen.de/vergabe?search={encoded_title}",
-            'Bund.de': f"https://www.service.bund.de/Content/DE/Ausschreibungen/Suche/Ergebnis.html?searchText={encoded_title}",
-            'TED Europa': f"https://ted.europa.eu/de/search/result?q={encoded_title}",
-            'DTVP': f"https://www.dtvp.de/Center/common/project/search.do?search={encoded_title}",
-            'Öffentliche Vergabe': f"https://www.oeffentlichevergabe.de/search?q={encoded_title}",
-            'Ausschreibungen Deutschland': f"https://ausschreibungen-deutschland.de/?search={encoded_title}",
-            'e-Vergabe Online': f"https://www.evergabe-online.de/search?q={encoded_title}",
-            'ibau': f"https://www.ibau.de/ausschreibungen/?q={encoded_title}",
-            'Charité': f"https://vergabeplattform.charite.de/search?q={encoded_title}",
-            'Vivantes': f"https://www.vivantes.de/unternehmen/ausschreibungen?search={encoded_title}",
-            'UKE Hamburg': f"https://www.uke.de/organisationsstruktur/tochtergesellschaften/kfe/ausschreibungen?search={encoded_title}",
-            'Fraunhofer': f"https://vergabe.fraunhofer.de/?search={encoded_title}",
-            'simap.ch (Schweiz)': f"https://www.simap.ch/en/search?q={encoded_title}",
-        }
-        
-        return url_templates.get(platform_name, base_url)
+        template = APPLICATION_URL_TEMPLATES.get(platform_name)
+        if template is None:
+            return base_url
+        return template.format(q=quote_plus(title[:80]))
 
-    async def fetch_page(self, url: str, timeout: int = 30) -> str:
-        """Fetch a page with error handling"""
-        try:
-            async with self.session.get(
-                url,
-                headers=self.headers,
-                ssl=False,
-                timeout=aiohttp.ClientTimeout(total=timeout)
-            ) as resp:
-                if resp.status == 200:
-                    return await resp.text()
-                else:
-                    logger.warning(f"Status {resp.status} for {url}")
+    async def fetch_page(self, url: str, timeout: int = 30):
+        """Fetch a page with error handling.
+        Pages served with ETag/Last-Modified are revalidated on later runs; a 304
+        returns the cached body object unchanged. Connection errors and timeouts
+        are retried with exponential backoff; 429/503 responses are retried after
+        the host's Retry-After, during which other requests to that host wait too.
+        Returns the raw body (bytes, or str when the server declares a non-UTF-8
+        charset) for parse_html, or "" on failure."""
+        cached = HTTP_CACHE.get(url)
+        # Session headers are merged in by aiohttp; only validators are per request
+        headers = cached[0] if cached else None
+        host = urlparse(url).netloc
+        
+        for attempt in range(self.FETCH_RETRIES):
+            await self._wait_for_host(host)
+            try:
+                async with self._request_semaphore:
+                    async with self.session.get(
+                        url,
+                        headers=headers,
+                        timeout=aiohttp.ClientTimeout(total=timeout)
+                    ) as resp:
+                        if resp.status == 304 and cached:
+                            self._page_fetched()
+                            return cached[1]
+                        if resp.status == 200:
+                            logger.debug("%s: Content-Encoding %s", url, resp.headers.get('Content-Encoding', 'identity'))
+                            body = await self._read_body(url, resp)
+                            if body is None:
+                                return ""
+                            html = decode_body(body, resp.charset)
+                            self._store_validators(url, resp.headers, html)
+                            self._page_fetched()
+                            return html
+                        if resp.status in self.RETRY_STATUSES and attempt < self.FETCH_RETRIES - 1:
+                            # Hold back every request to this host, not just this one
+                            delay = self._retry_delay(resp.headers.get('Retry-After'), attempt)
+                            ready_at = asyncio.get_running_loop().time() + delay
+                            self._host_ready_at[host] = max(self._host_ready_at.get(host, 0), ready_at)
+                            logger.warning("Status %s for %s, retrying in %.1fs", resp.status, url, delay)
+                            continue
+                        logger.warning("Status %s for %s", resp.status, url)
+                        return ""
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == self.FETCH_RETRIES - 1:
+                    logger.error("Error fetching %s after %d attempts: %s", url, self.FETCH_RETRIES, e)
                     return ""
-        except Exception as e:
-            logger.error(f"Error fetching {url}: {e}")
-            return ""
+                # Back off outside the semaphore so other requests can proceed
+                await asyncio.sleep(2 ** attempt + random.random())
+            except Exception as e:
+                logger.error("Error fetching %s: %s", url, e)
+                return ""
+        
+        return ""
+
+    def _page_fetched(self):
+        """Credit a successfully fetched page to the platform scraper of this task"""
+        label = CURRENT_SCRAPER.get()
+        if label is not None:
+            self._fetched_scrapers.add(label)
+    
+    async def _wait_for_host(self, host: str):
+        """Sleep until a host that answered 429/503 may be contacted again"""
+        delay = self._host_ready_at.get(host, 0) - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def _retry_delay(self, retry_after: str, attempt: int) -> float:
+        """Seconds to wait before retrying: the server's Retry-After (seconds or
+        HTTP date) if given, else a randomized backoff; capped at RETRY_MAX_DELAY"""
+        delay = None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    pass
+        if delay is None:
+            delay = random.uniform(8, 15) * 2 ** attempt
+        return min(max(delay, 0), self.RETRY_MAX_DELAY)
+    
+    async def _read_body(self, url: str, resp):
+        """Read the response in chunks and stop once it exceeds MAX_PAGE_BYTES;
+        returns None for oversized pages"""
+        body = bytearray()
+        async for chunk in resp.content.iter_chunked(1 << 16):
+            body += chunk
+            if len(body) > self.MAX_PAGE_BYTES:
+                logger.warning("%s: response over %d bytes, skipped", url, self.MAX_PAGE_BYTES)
+                return None
+        return bytes(body)
+    
+    def _store_validators(self, url: str, response_headers, html):
+        """Remember ETag/Last-Modified of a page for conditional requests"""
+        validators = {}
+        if response_headers.get('ETag'):
+            validators['If-None-Match'] = response_headers['ETag']
+        if response_headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = response_headers['Last-Modified']
+        
+        if not validators or len(html) > HTTP_CACHE_MAX_BODY_BYTES:
+            HTTP_CACHE.pop(url, None)
+            PARSE_CACHE.pop(url, None)
+            return
+        
+        HTTP_CACHE.pop(url, None)
+        if len(HTTP_CACHE) >= HTTP_CACHE_MAX_ENTRIES:
+            oldest = next(iter(HTTP_CACHE))
+            HTTP_CACHE.pop(oldest)
+            PARSE_CACHE.pop(oldest, None)
+        HTTP_CACHE[url] = (validators, html)
 
     # ==================== GERMAN FEDERAL PLATFORMS ====================
     
@@ -394,21 +1044,21 @@ class ComprehensiveScraper:
             if not html:
                 continue
                 
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('.searchResult, .result-item, article, .c-teaser, .teaser')
+            tree = parse_html(html)
+            items = select_all(tree, '.searchResult, .result-item, article, .c-teaser, .teaser')
             
             if len(items) == 0:
                 # Try alternative selectors
-                items = soup.select('a[href*="/Ausschreibungen/"]')
+                items = tree.css('a[href*="/Ausschreibungen/"]')
             
             logger.info(f"Bund.de ('{search_term}'): Found {len(items)} items")
             
             for item in items:
-                title_elem = item.select_one('h2 a, h3 a, .title a, a.c-teaser__headline, a')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
+                title_elem = select_descendant(item, 'h2 a, h3 a, .title a, a.c-teaser__headline, a')
+                if title_elem and title_elem.child is not None:
+                    title = title_elem.text(strip=True)
                     if len(title) > 15 and self.is_relevant_tender(title):
-                        link = title_elem.get('href', '')
+                        link = title_elem.attributes.get('href') or ''
                         if link and not link.startswith('http'):
                             link = f"https://www.service.bund.de{link}"
                         
@@ -424,8 +1074,8 @@ class ComprehensiveScraper:
                         if tender_id:
                             seen_tender_ids.add(tender_id)
                         
-                        desc_elem = item.select_one('.description, p, .c-teaser__text')
-                        original_desc = desc_elem.get_text(strip=True) if desc_elem else ""
+                        desc_elem = select_descendant(item, '.description, p, .c-teaser__text')
+                        original_desc = desc_elem.text(strip=True) if desc_elem else ""
                         
                         # Check if search term is a CPV code
                         is_cpv = search_term in CPV_CODES_BASE
@@ -464,50 +1114,12 @@ class ComprehensiveScraper:
         logger.info(f"Bund.de TOTAL: {len(tenders)} tenders")
         return tenders
 
-    async def scrape_evergabe_online(self) -> list:
-        """Scrape e-Vergabe Online - Federal e-procurement"""
-        tenders = []
-        url = "https://www.evergabe-online.de/"
-        
-        html = await self.fetch_page(url)
-        if html:
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('.tender-item, article, .publication, table tr, .search-result')
-            logger.info(f"e-Vergabe Online: Found {len(items)} items")
-            
-            for item in items:
-                title_elem = item.select_one('a, h2, h3, .title')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 15 and self.is_relevant_tender(title):
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://www.evergabe-online.de{link}"
-                        
-                        cat_info = self.categorize_tender(title)
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': f"e-Vergabe Ausschreibung: {title}",
-                            'budget': None,
-                            'deadline': datetime.utcnow() + timedelta(days=30),
-                            'location': 'Deutschland',
-                            'project_type': 'Federal Tender',
-                            'contracting_authority': 'Bundesauftraggeber',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'e-Vergabe Online',
-                            'platform_url': 'https://www.evergabe-online.de',
-                            'direct_link': link,
-                            'country': 'Germany',
-                        })
-        
-        return tenders
-
     async def scrape_dtvp(self) -> list:
         """Scrape Deutsches Vergabeportal (DTVP) with pagination"""
         tenders = []
         seen_tender_ids = set()
+        default_deadline = datetime.utcnow() + timedelta(days=30)
+        loop = asyncio.get_running_loop()
         
         # Scrape multiple pages
         for page_num in range(1, self.PAGES_TO_SCRAPE + 1):
@@ -520,102 +1132,57 @@ class ComprehensiveScraper:
             if not html:
                 break
                 
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('.searchResult, article, .tender-item, table tr, .project-row')
+            item_count, rows = await loop.run_in_executor(PARSE_POOL, extract_dtvp_rows, html)
             
-            if len(items) == 0:
+            if item_count == 0:
                 break
             
-            logger.info(f"DTVP (page {page_num}): Found {len(items)} items")
+            logger.info("DTVP (page %d): Found %d items", page_num, item_count)
             
-            for item in items:
-                title_elem = item.select_one('a, h2, .title, td a')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 15 and self.is_relevant_tender(title):
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://www.dtvp.de{link}"
-                        
-                        # Extract tender ID from link (e.g., /project/12345)
-                        tender_id = None
-                        id_match = re.search(r'/(\d{5,8})(?:/|$|\?)', link)
-                        if id_match:
-                            tender_id = id_match.group(1)
-                        
-                        # Skip duplicates
-                        if tender_id and tender_id in seen_tender_ids:
-                            continue
-                        if tender_id:
-                            seen_tender_ids.add(tender_id)
-                        
-                        cat_info = self.categorize_tender(title)
-                        
-                        # Build description with Tender ID
-                        description = f"DTVP-ID: {tender_id} | {title}" if tender_id else f"DTVP Ausschreibung: {title}"
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': description,
-                            'tender_id': tender_id,
-                            'budget': None,
-                            'deadline': datetime.utcnow() + timedelta(days=30),
-                            'location': 'Deutschland',
-                            'project_type': 'Public Tender',
-                            'contracting_authority': 'Öffentlicher Auftraggeber',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'DTVP',
-                            'platform_url': 'https://www.dtvp.de',
-                            'direct_link': link,
-                            'country': 'Germany',
-                        })
+            for title, link in rows:
+                if self.is_relevant_tender(title):
+                    if link and not link.startswith('http'):
+                        link = f"https://www.dtvp.de{link}"
+                    
+                    # Extract tender ID from link (e.g., /project/12345)
+                    tender_id = None
+                    id_match = re.search(r'/(\d{5,8})(?:/|$|\?)', link)
+                    if id_match:
+                        tender_id = id_match.group(1)
+                    
+                    # Skip duplicates
+                    if tender_id and tender_id in seen_tender_ids:
+                        continue
+                    if tender_id:
+                        seen_tender_ids.add(tender_id)
+                    
+                    cat_info = self.categorize_tender(title)
+                    
+                    # Build description with Tender ID
+                    description = f"DTVP-ID: {tender_id} | {title}" if tender_id else f"DTVP Ausschreibung: {title}"
+                    
+                    tenders.append({
+                        'title': title,
+                        'description': description,
+                        'tender_id': tender_id,
+                        'budget': None,
+                        'deadline': default_deadline,
+                        'location': 'Deutschland',
+                        'project_type': 'Public Tender',
+                        'contracting_authority': 'Öffentlicher Auftraggeber',
+                        'category': cat_info['category'] or 'Projektmanagement',
+                        'building_typology': cat_info['building_typology'],
+                        'platform_source': 'DTVP',
+                        'platform_url': 'https://www.dtvp.de',
+                        'direct_link': link,
+                        'country': 'Germany',
+                    })
             
             await asyncio.sleep(0.3)
         
         logger.info(f"DTVP TOTAL: {len(tenders)} tenders (from {self.PAGES_TO_SCRAPE} pages)")
         return tenders
 
-    async def scrape_oeffentliche_vergabe(self) -> list:
-        """Scrape oeffentlichevergabe.de"""
-        tenders = []
-        url = "https://www.oeffentlichevergabe.de/"
-        
-        html = await self.fetch_page(url)
-        if html:
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('.tender-item, article, .publication, table tr, .search-result, .vergabe-item')
-            logger.info(f"Öffentliche Vergabe: Found {len(items)} items")
-            
-            for item in items:
-                title_elem = item.select_one('a, h2, h3, .title')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 15 and self.is_relevant_tender(title):
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://www.oeffentlichevergabe.de{link}"
-                        
-                        cat_info = self.categorize_tender(title)
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': f"Öffentliche Vergabe: {title}",
-                            'budget': None,
-                            'deadline': datetime.utcnow() + timedelta(days=30),
-                            'location': 'Deutschland',
-                            'project_type': 'Public Tender',
-                            'contracting_authority': 'Öffentlicher Auftraggeber',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'Öffentliche Vergabe',
-                            'platform_url': 'https://www.oeffentlichevergabe.de',
-                            'direct_link': link,
-                            'country': 'Germany',
-                        })
-        
-        return tenders
-
     async def scrape_ausschreibungen_deutschland(self) -> list:
         """Scrape ausschreibungen-deutschland.de - All German States with PAGINATION (5 pages)
         Note: This portal lists CPV codes in tender details, so we scrape by state and the CPV codes
@@ -661,14 +1228,14 @@ class ComprehensiveScraper:
                 if not html:
                     break  # No more pages or error
                     
-                soup = BeautifulSoup(html, 'lxml')
+                tree = parse_html(html)
                 
                 # Find ALL links on the page
-                all_links = soup.find_all('a', href=True)
+                all_links = tree.css('a[href]')
                 items = []
                 
                 for link in all_links:
-                    href = link.get('href', '')
+                    href = link.attributes.get('href') or ''
                     # Match tender URLs like /2439380_Deutschland__... or /2444419_Deutschland__...
                     if href and re.match(r'^/2[0-9]{6}_', href):
                         items.append(link)
@@ -681,8 +1248,8 @@ class ComprehensiveScraper:
                 # Process all found tenders
                 for item in items:
                     # Get the EXACT original title from the portal - no modifications
-                    original_title = item.get_text(strip=True)
-                    link_href = item.get('href', '')
+                    original_title = item.text(strip=True)
+                    link_href = item.attributes.get('href') or ''
                     
                     # Skip if title is too short or empty
                     if len(original_title) < 10:
@@ -770,22 +1337,24 @@ class ComprehensiveScraper:
                 url = f"https://ted.europa.eu/en/search/result?q={cpv_code}&country={country_code}"
                 logger.info(f"TED Playwright ({country_name}, CPV: {cpv_code}): Loading {url}")
                 
-                await page.goto(url, wait_until='networkidle', timeout=30000)
+                response = await page.goto(url, wait_until='networkidle', timeout=30000)
+                if response and response.ok:
+                    self._page_fetched()
                 await asyncio.sleep(2)  # Wait for dynamic content
                 
                 # Get page content
                 content = await page.content()
-                soup = BeautifulSoup(content, 'lxml')
+                tree = LexborHTMLParser(content)
                 
                 # Look for tender links - TED uses various selectors
-                tender_items = soup.select('a[href*="/notice/"]')
+                tender_items = tree.css('a[href*="/notice/"]')
                 
                 logger.info(f"TED Playwright ({country_name}, CPV: {cpv_code}): Found {len(tender_items)} notice links")
                 
                 seen_ids = set()
                 for item in tender_items[:20]:  # Limit per search
-                    href = item.get('href', '')
-                    notice_text = item.get_text(strip=True)
+                    href = item.attributes.get('href') or ''
+                    notice_text = item.text(strip=True)
                     
                     # Skip navigation links
                     if notice_text in ['Previous', 'Next', 'Search', '']:
@@ -881,84 +1450,6 @@ class ComprehensiveScraper:
         logger.info(f"TED Europa (International) TOTAL: {len(tenders)} tenders from {len(eu_countries)} countries")
         return tenders
 
-    async def scrape_ibau(self) -> list:
-        """Scrape ibau.de"""
-        tenders = []
-        url = "https://www.ibau.de/ausschreibungen/"
-        
-        html = await self.fetch_page(url)
-        if html:
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('.tender-item, article, .ausschreibung, table tr, .search-result')
-            logger.info(f"ibau: Found {len(items)} items")
-            
-            for item in items:
-                title_elem = item.select_one('a, h2, h3, .title')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 15 and self.is_relevant_tender(title):
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://www.ibau.de{link}"
-                        
-                        cat_info = self.categorize_tender(title)
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': f"ibau Ausschreibung: {title}",
-                            'budget': None,
-                            'deadline': datetime.utcnow() + timedelta(days=30),
-                            'location': 'Deutschland',
-                            'project_type': 'Public Tender',
-                            'contracting_authority': 'Öffentlicher Auftraggeber',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'ibau',
-                            'platform_url': 'https://www.ibau.de',
-                            'direct_link': link,
-                            'country': 'Germany',
-                        })
-        
-        return tenders
-
-    async def scrape_evergabe_de(self) -> list:
-        """Scrape evergabe.de"""
-        tenders = []
-        url = "https://www.evergabe.de/"
-        
-        html = await self.fetch_page(url)
-        if html:
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('.tender-item, article, .publication, table tr, .search-result')
-            logger.info(f"evergabe.de: Found {len(items)} items")
-            
-            for item in items:
-                title_elem = item.select_one('a, h2, h3, .title')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 15 and self.is_relevant_tender(title):
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        
-                        cat_info = self.categorize_tender(title)
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': f"eVergabe Ausschreibung: {title}",
-                            'budget': None,
-                            'deadline': datetime.utcnow() + timedelta(days=30),
-                            'location': 'Deutschland',
-                            'project_type': 'Public Tender',
-                            'contracting_authority': 'Öffentlicher Auftraggeber',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'eVergabe.de',
-                            'platform_url': 'https://www.evergabe.de',
-                            'direct_link': link,
-                            'country': 'Germany',
-                        })
-        
-        return tenders
-
     # ==================== GERMAN STATE PLATFORMS ====================
 
     async def scrape_bayern(self) -> list:
@@ -973,15 +1464,15 @@ class ComprehensiveScraper:
         for url in urls:
             html = await self.fetch_page(url)
             if html:
-                soup = BeautifulSoup(html, 'lxml')
+                tree = parse_html(html)
                 
                 # Try multiple selectors
-                items = soup.select('#webTicker li.itemTicker, .tender-item, table tr, .publication, article')
+                items = select_all(tree, '#webTicker li.itemTicker, .tender-item, table tr, .publication, article')
                 logger.info(f"Bayern ({url}): Found {len(items)} items")
                 
                 for item in items:
-                    if item.name == 'li':
-                        text = item.get_text(strip=True)
+                    if item.tag == 'li':
+                        text = item.text(strip=True)
                         match = re.match(r'(.+?)\s*\(([^)]+)\)$', text)
                         if match:
                             title = match.group(1).strip()
@@ -990,8 +1481,8 @@ class ComprehensiveScraper:
                             title = text
                             authority = 'Bayern'
                     else:
-                        title_elem = item.select_one('a, .title, td:first-child a')
-                        title = title_elem.get_text(strip=True) if title_elem else ""
+                        title_elem = select_descendant(item, TITLE_SELECTOR_SHORT)
+                        title = title_elem.text(strip=True) if title_elem else ""
                         authority = 'Bayern'
                     
                     if len(title) > 15 and self.is_relevant_tender(title):
@@ -1017,993 +1508,107 @@ class ComprehensiveScraper:
         
         return tenders
 
-    async def scrape_nrw(self) -> list:
-        """Scrape e-Vergabe NRW"""
-        tenders = []
-        url = "https://www.evergabe.nrw.de/VMPSatellite/public/search"
-        
-        html = await self.fetch_page(url)
-        if html:
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('table.searchResults tr, .publication-item, .tender-row, article')
-            logger.info(f"NRW: Found {len(items)} items")
-            
-            for item in items:
-                title_elem = item.select_one('a, .title, td:first-child a')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 20 and self.is_relevant_tender(title):
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://www.evergabe.nrw.de{link}"
-                        
-                        desc_elem = item.select_one('.description, td:nth-child(2)')
-                        description = desc_elem.get_text(strip=True) if desc_elem else ""
-                        
-                        cat_info = self.categorize_tender(title, description)
-                        budget = self.extract_budget(f"{title} {description}")
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': description or f"Ausschreibung NRW: {title}",
-                            'budget': budget,
-                            'deadline': self.extract_deadline(f"{title} {description}"),
-                            'location': 'Nordrhein-Westfalen',
-                            'project_type': 'Public Tender',
-                            'contracting_authority': 'Land NRW',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'e-Vergabe NRW',
-                            'platform_url': 'https://www.evergabe.nrw.de',
-                            'direct_link': link,
-                            'country': 'Germany',
-                        })
-        
-        return tenders
+    # ==================== TABLE-DRIVEN LISTING PLATFORMS ====================
 
-    async def scrape_berlin(self) -> list:
-        """Scrape Vergabeplattform Berlin - multiple sources"""
+    async def _scrape_platform(self, platform: dict) -> list:
+        """Scrape a listing-style platform described by a PLATFORMS entry"""
         tenders = []
-        urls = [
-            "https://www.berlin.de/vergabeplattform/veroeffentlichungen/bekanntmachungen/",
-            "https://my.vergabeplattform.berlin.de/"
-        ]
+        urls = platform['urls']
+        loop = asyncio.get_running_loop()
         
         for url in urls:
             html = await self.fetch_page(url)
             if html:
-                soup = BeautifulSoup(html, 'lxml')
-                items = soup.select('article, .list-item, table tr, .modul-teaser, .tender-item')
-                logger.info(f"Berlin ({url}): Found {len(items)} items")
-                
-                for item in items:
-                    title_elem = item.select_one('h2 a, h3 a, .title a, a.link')
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        if len(title) > 15 and self.is_relevant_tender(title):
-                            link = title_elem.get('href', '')
-                            if link and not link.startswith('http'):
-                                link = f"https://www.berlin.de{link}"
-                            
-                            desc_elem = item.select_one('p, .description, .text')
-                            description = desc_elem.get_text(strip=True) if desc_elem else ""
-                            
-                            cat_info = self.categorize_tender(title, description)
-                            budget = self.extract_budget(f"{title} {description}")
-                            
-                            tenders.append({
-                                'title': title,
-                                'description': description or f"Ausschreibung Berlin: {title}",
-                                'budget': budget,
-                                'deadline': self.extract_deadline(f"{title} {description}"),
-                                'location': 'Berlin',
-                                'project_type': 'Public Tender',
-                                'contracting_authority': 'Land Berlin',
-                                'category': cat_info['category'] or 'Projektmanagement',
-                                'building_typology': cat_info['building_typology'],
-                                'platform_source': 'Vergabeplattform Berlin',
-                                'platform_url': 'https://www.berlin.de/vergabeplattform',
-                                'direct_link': link,
-                                'country': 'Germany',
-                            })
+                cached = PARSE_CACHE.get(url)
+                if cached and cached[0] is html:
+                    # Page unchanged since the last run (304): reuse its tenders
+                    page_tenders = cached[1]
+                    logger.info("%s (%s): not modified, reusing %d tenders", platform['name'], url, len(page_tenders))
+                else:
+                    # Parse off the event loop so other platforms' I/O keeps flowing
+                    item_count, rows = await loop.run_in_executor(
+                        PARSE_POOL,
+                        extract_listing_rows,
+                        html,
+                        platform['items'],
+                        platform['title'],
+                        platform.get('description'),
+                        platform.get('min_title_length', 15),
+                    )
+                    logger.info("%s (%s): Found %d items", platform['name'], url, item_count)
+                    page_tenders = self._build_platform_tenders(platform, url, rows)
+                    if url in HTTP_CACHE:
+                        PARSE_CACHE[url] = (html, page_tenders)
+                # Hand out copies: tenders are annotated and inserted later on
+                tenders.extend(dict(tender) for tender in page_tenders)
             
-            await asyncio.sleep(0.5)
+            if len(urls) > 1:
+                await asyncio.sleep(0.5)
         
         return tenders
 
-    async def scrape_hamburg(self) -> list:
-        """Scrape Hamburg Vergabe - multiple sources"""
+    def _build_platform_tenders(self, platform: dict, url: str, rows: list) -> list:
+        """Turn the (title, href, description) rows of one listing page into relevant tenders"""
         tenders = []
-        urls = [
-            "https://fbhh-evergabe.web.hamburg.de/evergabe.bieter/eva/supplierportal/fhh/tabs/home",
-            "https://www.hamburg.de/wirtschaft/ausschreibungen-wirtschaft/"
-        ]
+        link_base = platform.get('link_base')
+        with_link = platform.get('direct_link', True)
+        with_description = bool(platform.get('description'))
+        typology = platform.get('building_typology')
+        description_prefix = platform['description_prefix']
+        default_deadline = datetime.utcnow() + timedelta(days=30)
+        
+        # Fields shared by every tender of this page; per-item values are filled into a copy
+        template = {
+            'title': None,
+            'description': None,
+            'budget': None,
+            'deadline': None,
+            'location': platform['location'],
+            'project_type': platform['project_type'],
+            'contracting_authority': platform['contracting_authority'],
+            'category': None,
+            'building_typology': typology,
+            'platform_source': platform['platform_source'],
+            'platform_url': platform.get('platform_url', url),
+        }
+        if with_link:
+            template['direct_link'] = ''
+        template['country'] = 'Germany'
         
-        for url in urls:
-            html = await self.fetch_page(url)
-            if html:
-                soup = BeautifulSoup(html, 'lxml')
-                items = soup.select('table tr, .tender-item, .publication, article, .search-result')
-                logger.info(f"Hamburg ({url}): Found {len(items)} items")
-                
-                for item in items:
-                    title_elem = item.select_one('a, .title, td a')
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        if len(title) > 15 and self.is_relevant_tender(title):
-                            link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                            
-                            cat_info = self.categorize_tender(title)
-                            
-                            tenders.append({
-                                'title': title,
-                                'description': f"Ausschreibung Hamburg: {title}",
-                                'budget': None,
-                                'deadline': datetime.utcnow() + timedelta(days=30),
-                                'location': 'Hamburg',
-                                'project_type': 'Public Tender',
-                                'contracting_authority': 'Freie und Hansestadt Hamburg',
-                                'category': cat_info['category'] or 'Projektmanagement',
-                                'building_typology': cat_info['building_typology'],
-                                'platform_source': 'Hamburg Vergabe',
-                                'platform_url': url,
-                                'direct_link': link,
-                                'country': 'Germany',
-                            })
+        for title, link, description in rows:
+            if not self.is_relevant_tender(title):
+                continue
             
-            await asyncio.sleep(0.5)
+            tender = template.copy()
+            tender['title'] = title
+            
+            if with_description:
+                cat_info = self.categorize_tender(title, description)
+                tender['budget'] = self.extract_budget(f"{title} {description}")
+                tender['deadline'] = self.extract_deadline(f"{title} {description}")
+            else:
+                cat_info = self.categorize_tender(title)
+                tender['deadline'] = default_deadline
+            
+            tender['description'] = description or description_prefix + title
+            tender['category'] = cat_info['category'] or 'Projektmanagement'
+            if not typology:
+                tender['building_typology'] = cat_info['building_typology']
+            
+            if with_link:
+                if link and link_base and not link.startswith('http'):
+                    link = f"{link_base.rstrip('/')}/{link.lstrip('/')}"
+                tender['direct_link'] = link
+            
+            tenders.append(tender)
         
         return tenders
 
-    async def scrape_baden_wuerttemberg(self) -> list:
-        """Scrape Baden-Württemberg - multiple sources"""
-        tenders = []
-        urls = [
-            "https://vergabe.landbw.de/NetServer/PublicationSearchControllerServlet",
-            "https://www.service-bw.de/web/guest/suche/-/leistungen/category/1005"
-        ]
-        
-        for url in urls:
-            html = await self.fetch_page(url)
-            if html:
-                soup = BeautifulSoup(html, 'lxml')
-                items = soup.select('table tr, .publication-item, article, .search-result')
-                logger.info(f"Baden-Württemberg ({url}): Found {len(items)} items")
-                
-                for item in items:
-                    title_elem = item.select_one('a, .title')
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        if len(title) > 15 and self.is_relevant_tender(title):
-                            cat_info = self.categorize_tender(title)
-                            
-                            tenders.append({
-                                'title': title,
-                                'description': f"Ausschreibung Baden-Württemberg: {title}",
-                                'budget': None,
-                                'deadline': datetime.utcnow() + timedelta(days=30),
-                                'location': 'Baden-Württemberg',
-                                'project_type': 'Public Tender',
-                                'contracting_authority': 'Land Baden-Württemberg',
-                                'category': cat_info['category'] or 'Projektmanagement',
-                                'building_typology': cat_info['building_typology'],
-                                'platform_source': 'Vergabe Baden-Württemberg',
-                                'platform_url': url,
-                                'country': 'Germany',
-                            })
-            
-            await asyncio.sleep(0.5)
-        
-        return tenders
-
-    async def scrape_hessen(self) -> list:
-        """Scrape HAD Hessen"""
-        tenders = []
-        url = "https://www.had.de/NetServer/PublicationSearchControllerServlet"
-        
-        html = await self.fetch_page(url)
-        if html:
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('table tr, .publication-item')
-            logger.info(f"Hessen HAD: Found {len(items)} items")
-            
-            for item in items:
-                title_elem = item.select_one('a, .title')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 15 and self.is_relevant_tender(title):
-                        cat_info = self.categorize_tender(title)
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': f"Ausschreibung Hessen: {title}",
-                            'budget': None,
-                            'deadline': datetime.utcnow() + timedelta(days=30),
-                            'location': 'Hessen',
-                            'project_type': 'Public Tender',
-                            'contracting_authority': 'Land Hessen',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'HAD Hessen',
-                            'platform_url': 'https://www.had.de',
-                            'country': 'Germany',
-                        })
-        
-        return tenders
-
-    async def scrape_brandenburg(self) -> list:
-        """Scrape Brandenburg - multiple sources"""
-        tenders = []
-        urls = [
-            "https://vergabemarktplatz.brandenburg.de/VMPSatellite/public/search",
-            "https://www.aumass.de/ausschreibungen/brandenburg"
-        ]
-        
-        for url in urls:
-            html = await self.fetch_page(url)
-            if html:
-                soup = BeautifulSoup(html, 'lxml')
-                items = soup.select('table tr, .publication-item, .searchResult, article')
-                logger.info(f"Brandenburg ({url}): Found {len(items)} items")
-                
-                for item in items:
-                    title_elem = item.select_one('a, .title')
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        if len(title) > 15 and self.is_relevant_tender(title):
-                            cat_info = self.categorize_tender(title)
-                            
-                            tenders.append({
-                                'title': title,
-                                'description': f"Ausschreibung Brandenburg: {title}",
-                                'budget': None,
-                                'deadline': datetime.utcnow() + timedelta(days=30),
-                                'location': 'Brandenburg',
-                                'project_type': 'Public Tender',
-                                'contracting_authority': 'Land Brandenburg',
-                                'category': cat_info['category'] or 'Projektmanagement',
-                                'building_typology': cat_info['building_typology'],
-                                'platform_source': 'Vergabemarktplatz Brandenburg',
-                                'platform_url': url,
-                                'country': 'Germany',
-                            })
-            
-            await asyncio.sleep(0.5)
-        
-        return tenders
-
-    async def scrape_niedersachsen(self) -> list:
-        """Scrape Niedersachsen"""
-        tenders = []
-        url = "https://vergabe.niedersachsen.de/NetServer/PublicationSearchControllerServlet"
-        
-        html = await self.fetch_page(url)
-        if html:
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('table tr, .publication-item, article')
-            logger.info(f"Niedersachsen: Found {len(items)} items")
-            
-            for item in items:
-                title_elem = item.select_one('a, .title')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 15 and self.is_relevant_tender(title):
-                        cat_info = self.categorize_tender(title)
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': f"Ausschreibung Niedersachsen: {title}",
-                            'budget': None,
-                            'deadline': datetime.utcnow() + timedelta(days=30),
-                            'location': 'Niedersachsen',
-                            'project_type': 'Public Tender',
-                            'contracting_authority': 'Land Niedersachsen',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'Vergabe Niedersachsen',
-                            'platform_url': 'https://vergabe.niedersachsen.de',
-                            'country': 'Germany',
-                        })
-        
-        return tenders
-
-    async def scrape_rheinland_pfalz(self) -> list:
-        """Scrape Rheinland-Pfalz - multiple sources"""
-        tenders = []
-        urls = [
-            "https://www.vergabe.rlp.de/VMPSatellite/public/search",
-            "https://www.rlp.vergabekommunal.de/"
-        ]
-        
-        for url in urls:
-            html = await self.fetch_page(url)
-            if html:
-                soup = BeautifulSoup(html, 'lxml')
-                items = soup.select('table tr, .publication-item, .searchResult, article')
-                logger.info(f"Rheinland-Pfalz ({url}): Found {len(items)} items")
-                
-                for item in items:
-                    title_elem = item.select_one('a, .title')
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        if len(title) > 15 and self.is_relevant_tender(title):
-                            cat_info = self.categorize_tender(title)
-                            
-                            tenders.append({
-                                'title': title,
-                                'description': f"Ausschreibung Rheinland-Pfalz: {title}",
-                                'budget': None,
-                                'deadline': datetime.utcnow() + timedelta(days=30),
-                                'location': 'Rheinland-Pfalz',
-                                'project_type': 'Public Tender',
-                                'contracting_authority': 'Land Rheinland-Pfalz',
-                                'category': cat_info['category'] or 'Projektmanagement',
-                                'building_typology': cat_info['building_typology'],
-                                'platform_source': 'Vergabe Rheinland-Pfalz',
-                                'platform_url': url,
-                                'country': 'Germany',
-                            })
-            
-            await asyncio.sleep(0.5)
-        
-        return tenders
-
-    async def scrape_other_states(self) -> list:
-        """Scrape other German states"""
-        tenders = []
-        state_urls = {
-            'Saarland': 'https://vergabe.saarland/NetServer/PublicationSearchControllerServlet',
-            'Sachsen-Anhalt': 'https://www.evergabe.sachsen-anhalt.de/NetServer/PublicationSearchControllerServlet',
-            'Schleswig-Holstein': 'https://www.e-vergabe-sh.de/NetServer/PublicationSearchControllerServlet',
-            'Sachsen': 'https://www.sachsen-vergabe.de/vergabe/bekanntmachung/',
-            'Bremen': 'https://www.vergabe.bremen.de/NetServer/PublicationSearchControllerServlet',
-            'Thüringen': 'https://www.thueringen.de/vergabe/',
-        }
-        
-        for state, url in state_urls.items():
-            html = await self.fetch_page(url)
-            if html:
-                soup = BeautifulSoup(html, 'lxml')
-                items = soup.select('table tr, .publication-item, article')
-                logger.info(f"{state}: Found {len(items)} items")
-                
-                for item in items:
-                    title_elem = item.select_one('a, .title')
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        if len(title) > 15 and self.is_relevant_tender(title):
-                            cat_info = self.categorize_tender(title)
-                            
-                            tenders.append({
-                                'title': title,
-                                'description': f"Ausschreibung {state}: {title}",
-                                'budget': None,
-                                'deadline': datetime.utcnow() + timedelta(days=30),
-                                'location': state,
-                                'project_type': 'Public Tender',
-                                'contracting_authority': f'Land {state}',
-                                'category': cat_info['category'] or 'Projektmanagement',
-                                'building_typology': cat_info['building_typology'],
-                                'platform_source': f'Vergabe {state}',
-                                'platform_url': url,
-                                'country': 'Germany',
-                            })
-            
-            await asyncio.sleep(0.5)
-        
-        return tenders
-
-    # ==================== HOSPITAL/KLINIK PLATFORMS ====================
-
-    async def scrape_hospitals(self) -> list:
-        """Scrape hospital tender platforms"""
-        tenders = []
-        hospital_urls = {
-            'Charité': 'https://vergabeplattform.charite.de',
-            'Vivantes': 'https://www.vivantes.de/unternehmen/ausschreibungen',
-            'UKE Hamburg': 'https://www.uke.de/organisationsstruktur/tochtergesellschaften/kfe/ausschreibungen',
-            'Pfalzklinikum': 'https://www.pfalzklinikum.de/ueber-uns/ausschreibungen',
-            'KMG Kliniken': 'https://kmg-kliniken.de/ausschreibungen-und-vergaben',
-            'Klinikverbund Südwest': 'https://www.klinikverbund-suedwest.de/der-klinikverbund-suedwest/ansprechpartner/gebaeudemanagement-technische-infrastruktur/ausschreibungen',
-            'Sana Kliniken': 'https://www.sana.de/',
-            'Helios Kliniken': 'https://www.helios-gesundheit.de/',
-            'Asklepios Kliniken': 'https://www.asklepios.com',
-        }
-        
-        for hospital, url in hospital_urls.items():
-            html = await self.fetch_page(url)
-            if html:
-                soup = BeautifulSoup(html, 'lxml')
-                items = soup.select('table tr, .tender-item, article, .ausschreibung, .search-result')
-                logger.info(f"{hospital}: Found {len(items)} items")
-                
-                for item in items:
-                    title_elem = item.select_one('a, .title, h2, h3')
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        if len(title) > 15 and self.is_relevant_tender(title):
-                            link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                            if link and not link.startswith('http'):
-                                link = f"{url.rstrip('/')}/{link.lstrip('/')}"
-                            
-                            cat_info = self.categorize_tender(title)
-                            
-                            tenders.append({
-                                'title': title,
-                                'description': f"{hospital} Ausschreibung: {title}",
-                                'budget': None,
-                                'deadline': datetime.utcnow() + timedelta(days=30),
-                                'location': 'Deutschland',
-                                'project_type': 'Hospital Tender',
-                                'contracting_authority': hospital,
-                                'category': cat_info['category'] or 'Projektmanagement',
-                                'building_typology': 'Healthcare',
-                                'platform_source': hospital,
-                                'platform_url': url,
-                                'direct_link': link,
-                                'country': 'Germany',
-                            })
-            
-            await asyncio.sleep(0.5)
-        
-        return tenders
-
-    async def scrape_fraunhofer(self) -> list:
-        """Scrape Fraunhofer Gesellschaft"""
-        tenders = []
-        url = "https://vergabe.fraunhofer.de/"
-        
-        html = await self.fetch_page(url)
-        if html:
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('table tr, .tender-item, article, .ausschreibung')
-            logger.info(f"Fraunhofer: Found {len(items)} items")
-            
-            for item in items:
-                title_elem = item.select_one('a, .title, h2, h3')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 15 and self.is_relevant_tender(title):
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        
-                        cat_info = self.categorize_tender(title)
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': f"Fraunhofer Ausschreibung: {title}",
-                            'budget': None,
-                            'deadline': datetime.utcnow() + timedelta(days=30),
-                            'location': 'Deutschland',
-                            'project_type': 'Research Institution Tender',
-                            'contracting_authority': 'Fraunhofer Gesellschaft',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'Fraunhofer',
-                            'platform_url': url,
-                            'direct_link': link,
-                            'country': 'Germany',
-                        })
-        
-        return tenders
-
-    # ==================== ADDITIONAL GERMAN PLATFORMS (USER REQUESTED) ====================
-
-    async def scrape_tender_impulse(self) -> list:
-        """Scrape Tender Impulse - Germany Tenders Public Projects"""
-        tenders = []
-        urls = [
-            "https://www.tenderimpulse.com/germany-tenders",
-            "https://www.tenderimpulse.com/germany-public-projects"
-        ]
-        
-        for url in urls:
-            html = await self.fetch_page(url)
-            if html:
-                soup = BeautifulSoup(html, 'lxml')
-                items = soup.select('.tender-item, .project-item, article, table tr, .search-result, .card')
-                logger.info(f"Tender Impulse ({url}): Found {len(items)} items")
-                
-                for item in items:
-                    title_elem = item.select_one('a, h2, h3, .title, .tender-title')
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        if len(title) > 15 and self.is_relevant_tender(title):
-                            link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                            if link and not link.startswith('http'):
-                                link = f"https://www.tenderimpulse.com{link}"
-                            
-                            desc_elem = item.select_one('.description, p, .summary')
-                            description = desc_elem.get_text(strip=True) if desc_elem else ""
-                            
-                            cat_info = self.categorize_tender(title, description)
-                            budget = self.extract_budget(f"{title} {description}")
-                            
-                            tenders.append({
-                                'title': title,
-                                'description': description or f"Tender Impulse: {title}",
-                                'budget': budget,
-                                'deadline': self.extract_deadline(f"{title} {description}"),
-                                'location': 'Deutschland',
-                                'project_type': 'Public Project',
-                                'contracting_authority': 'Public Authority Germany',
-                                'category': cat_info['category'] or 'Projektmanagement',
-                                'building_typology': cat_info['building_typology'],
-                                'platform_source': 'Tender Impulse',
-                                'platform_url': 'https://www.tenderimpulse.com',
-                                'direct_link': link,
-                                'country': 'Germany',
-                            })
-            
-            await asyncio.sleep(0.5)
-        
-        return tenders
-
-    async def scrape_vergabe24(self) -> list:
-        """Scrape vergabe24.de"""
-        tenders = []
-        url = "https://www.vergabe24.de/"
-        
-        html = await self.fetch_page(url)
-        if html:
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('.tender-item, .vergabe-item, article, table tr, .search-result, .ausschreibung')
-            logger.info(f"vergabe24.de: Found {len(items)} items")
-            
-            for item in items:
-                title_elem = item.select_one('a, h2, h3, .title')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 15 and self.is_relevant_tender(title):
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://www.vergabe24.de{link}"
-                        
-                        cat_info = self.categorize_tender(title)
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': f"vergabe24 Ausschreibung: {title}",
-                            'budget': None,
-                            'deadline': datetime.utcnow() + timedelta(days=30),
-                            'location': 'Deutschland',
-                            'project_type': 'Public Tender',
-                            'contracting_authority': 'Öffentlicher Auftraggeber',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'vergabe24',
-                            'platform_url': 'https://www.vergabe24.de',
-                            'direct_link': link,
-                            'country': 'Germany',
-                        })
-        
-        return tenders
-
-    async def scrape_dtad(self) -> list:
-        """Scrape dtad.de - Deutscher Tender-Ausschreibungsdienst"""
-        tenders = []
-        url = "https://www.dtad.de/"
-        
-        html = await self.fetch_page(url)
-        if html:
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('.tender-item, .ausschreibung, article, table tr, .search-result, .project-card')
-            logger.info(f"DTAD: Found {len(items)} items")
-            
-            for item in items:
-                title_elem = item.select_one('a, h2, h3, .title, .tender-title')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 15 and self.is_relevant_tender(title):
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://www.dtad.de{link}"
-                        
-                        cat_info = self.categorize_tender(title)
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': f"DTAD Ausschreibung: {title}",
-                            'budget': None,
-                            'deadline': datetime.utcnow() + timedelta(days=30),
-                            'location': 'Deutschland',
-                            'project_type': 'Public Tender',
-                            'contracting_authority': 'Öffentlicher Auftraggeber',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'DTAD',
-                            'platform_url': 'https://www.dtad.de',
-                            'direct_link': link,
-                            'country': 'Germany',
-                        })
-        
-        return tenders
-
-    async def scrape_cwc_tenders(self) -> list:
-        """Scrape CWC Tenders Germany"""
-        tenders = []
-        url = "https://www.cwctenders.com/de/index.php"
-        
-        html = await self.fetch_page(url)
-        if html:
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('.tender-item, article, table tr, .search-result, .tender-row')
-            logger.info(f"CWC Tenders: Found {len(items)} items")
-            
-            for item in items:
-                title_elem = item.select_one('a, h2, h3, .title')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 15 and self.is_relevant_tender(title):
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://www.cwctenders.com{link}"
-                        
-                        cat_info = self.categorize_tender(title)
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': f"CWC Tender: {title}",
-                            'budget': None,
-                            'deadline': datetime.utcnow() + timedelta(days=30),
-                            'location': 'Deutschland',
-                            'project_type': 'Public Tender',
-                            'contracting_authority': 'Public Authority',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'CWC Tenders',
-                            'platform_url': 'https://www.cwctenders.com',
-                            'direct_link': link,
-                            'country': 'Germany',
-                        })
-        
-        return tenders
-
-    async def scrape_bidding_source(self) -> list:
-        """Scrape BiddingSource Germany"""
-        tenders = []
-        url = "https://www.biddingsource.com/tenders/"
-        
-        html = await self.fetch_page(url)
-        if html:
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('.tender-item, article, table tr, .search-result, .card, .tender-card')
-            logger.info(f"BiddingSource: Found {len(items)} items")
-            
-            for item in items:
-                title_elem = item.select_one('a, h2, h3, .title, .tender-title')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 15 and self.is_relevant_tender(title):
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://www.biddingsource.com{link}"
-                        
-                        cat_info = self.categorize_tender(title)
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': f"BiddingSource: {title}",
-                            'budget': None,
-                            'deadline': datetime.utcnow() + timedelta(days=30),
-                            'location': 'Deutschland',
-                            'project_type': 'Public Tender',
-                            'contracting_authority': 'Public Authority',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'BiddingSource',
-                            'platform_url': 'https://www.biddingsource.com',
-                            'direct_link': link,
-                            'country': 'Germany',
-                        })
-        
-        return tenders
-
-    async def scrape_a24_salescloud(self) -> list:
-        """Scrape A24 Sales Cloud"""
-        tenders = []
-        url = "https://a24salescloud.de/"
-        
-        html = await self.fetch_page(url)
-        if html:
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('.tender-item, article, table tr, .search-result, .project-card, .ausschreibung')
-            logger.info(f"A24 Sales Cloud: Found {len(items)} items")
-            
-            for item in items:
-                title_elem = item.select_one('a, h2, h3, .title')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 15 and self.is_relevant_tender(title):
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://a24salescloud.de{link}"
-                        
-                        cat_info = self.categorize_tender(title)
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': f"A24 Sales Cloud: {title}",
-                            'budget': None,
-                            'deadline': datetime.utcnow() + timedelta(days=30),
-                            'location': 'Deutschland',
-                            'project_type': 'Public Tender',
-                            'contracting_authority': 'Öffentlicher Auftraggeber',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'A24 Sales Cloud',
-                            'platform_url': 'https://a24salescloud.de',
-                            'direct_link': link,
-                            'country': 'Germany',
-                        })
-        
-        return tenders
-
-    async def scrape_berlin_procurement(self) -> list:
-        """Scrape Berlin Procurement Cooperation platforms"""
-        tenders = []
-        urls = [
-            "https://my.vergabeplattform.berlin.de/",
-            "https://www.berlin.de/vergabeplattform/"
-        ]
-        
-        for url in urls:
-            html = await self.fetch_page(url)
-            if html:
-                soup = BeautifulSoup(html, 'lxml')
-                items = soup.select('.tender-item, article, table tr, .search-result, .vergabe-item, .modul-teaser')
-                logger.info(f"Berlin Procurement ({url}): Found {len(items)} items")
-                
-                for item in items:
-                    title_elem = item.select_one('a, h2, h3, .title')
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        if len(title) > 15 and self.is_relevant_tender(title):
-                            link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                            if link and not link.startswith('http'):
-                                link = f"https://www.berlin.de{link}"
-                            
-                            cat_info = self.categorize_tender(title)
-                            
-                            tenders.append({
-                                'title': title,
-                                'description': f"Berlin Procurement: {title}",
-                                'budget': None,
-                                'deadline': datetime.utcnow() + timedelta(days=30),
-                                'location': 'Berlin',
-                                'project_type': 'Public Tender',
-                                'contracting_authority': 'Land Berlin',
-                                'category': cat_info['category'] or 'Projektmanagement',
-                                'building_typology': cat_info['building_typology'],
-                                'platform_source': 'Berlin Procurement Cooperation',
-                                'platform_url': url,
-                                'direct_link': link,
-                                'country': 'Germany',
-                            })
-            
-            await asyncio.sleep(0.5)
-        
-        return tenders
-
-    async def scrape_lzbw(self) -> list:
-        """Scrape LZBW - Logistikzentrum Baden-Württemberg"""
-        tenders = []
-        url = "https://www.lzbw.de/ausschreibungen"
-        
-        html = await self.fetch_page(url)
-        if html:
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('.tender-item, article, table tr, .search-result, .ausschreibung, .content-item')
-            logger.info(f"LZBW: Found {len(items)} items")
-            
-            for item in items:
-                title_elem = item.select_one('a, h2, h3, .title')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 15 and self.is_relevant_tender(title):
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://www.lzbw.de{link}"
-                        
-                        cat_info = self.categorize_tender(title)
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': f"LZBW Ausschreibung: {title}",
-                            'budget': None,
-                            'deadline': datetime.utcnow() + timedelta(days=30),
-                            'location': 'Baden-Württemberg',
-                            'project_type': 'State Tender',
-                            'contracting_authority': 'Logistikzentrum Baden-Württemberg',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'LZBW',
-                            'platform_url': 'https://www.lzbw.de',
-                            'direct_link': link,
-                            'country': 'Germany',
-                        })
-        
-        return tenders
-
-    async def scrape_de_baunetzwerk(self) -> list:
-        """Scrape D&E BauNetzwerk"""
-        tenders = []
-        url = "https://www.de-baunetzwerk.de/"
-        
-        html = await self.fetch_page(url)
-        if html:
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('.tender-item, .project-item, article, table tr, .search-result, .bauvorhaben')
-            logger.info(f"D&E BauNetzwerk: Found {len(items)} items")
-            
-            for item in items:
-                title_elem = item.select_one('a, h2, h3, .title, .project-title')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 15 and self.is_relevant_tender(title):
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://www.de-baunetzwerk.de{link}"
-                        
-                        desc_elem = item.select_one('.description, p, .summary')
-                        description = desc_elem.get_text(strip=True) if desc_elem else ""
-                        
-                        cat_info = self.categorize_tender(title, description)
-                        budget = self.extract_budget(f"{title} {description}")
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': description or f"D&E BauNetzwerk: {title}",
-                            'budget': budget,
-                            'deadline': self.extract_deadline(f"{title} {description}"),
-                            'location': 'Deutschland',
-                            'project_type': 'Construction Project',
-                            'contracting_authority': 'Bauherr',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'D&E BauNetzwerk',
-                            'platform_url': 'https://www.de-baunetzwerk.de',
-                            'direct_link': link,
-                            'country': 'Germany',
-                        })
-        
-        return tenders
-
-    async def scrape_global_tenders_germany(self) -> list:
-        """Scrape Global Tenders - Germany section"""
-        tenders = []
-        url = "https://www.globaltenders.com/tenders-by-country/germany-tenders/"
-        
-        html = await self.fetch_page(url)
-        if html:
-            soup = BeautifulSoup(html, 'lxml')
-            items = soup.select('.tender-item, article, table tr, .search-result, .tender-row, .card')
-            logger.info(f"Global Tenders Germany: Found {len(items)} items")
-            
-            for item in items:
-                title_elem = item.select_one('a, h2, h3, .title, .tender-title')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if len(title) > 15 and self.is_relevant_tender(title):
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://www.globaltenders.com{link}"
-                        
-                        cat_info = self.categorize_tender(title)
-                        
-                        tenders.append({
-                            'title': title,
-                            'description': f"Global Tenders: {title}",
-                            'budget': None,
-                            'deadline': datetime.utcnow() + timedelta(days=30),
-                            'location': 'Deutschland',
-                            'project_type': 'Public Tender',
-                            'contracting_authority': 'Public Authority Germany',
-                            'category': cat_info['category'] or 'Projektmanagement',
-                            'building_typology': cat_info['building_typology'],
-                            'platform_source': 'Global Tenders Germany',
-                            'platform_url': 'https://www.globaltenders.com',
-                            'direct_link': link,
-                            'country': 'Germany',
-                        })
-        
-        return tenders
-
-    async def scrape_aumass(self) -> list:
-        """Scrape AUMASS Ausschreibungen"""
-        tenders = []
-        urls = [
-            "https://www.aumass.de/ausschreibungen/",
-            "https://www.aumass.de/ausschreibungen/brandenburg"
-        ]
-        
-        for url in urls:
-            html = await self.fetch_page(url)
-            if html:
-                soup = BeautifulSoup(html, 'lxml')
-                items = soup.select('.tender-item, article, table tr, .search-result, .ausschreibung-item')
-                logger.info(f"AUMASS ({url}): Found {len(items)} items")
-                
-                for item in items:
-                    title_elem = item.select_one('a, h2, h3, .title')
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        if len(title) > 15 and self.is_relevant_tender(title):
-                            link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                            if link and not link.startswith('http'):
-                                link = f"https://www.aumass.de{link}"
-                            
-                            cat_info = self.categorize_tender(title)
-                            
-                            tenders.append({
-                                'title': title,
-                                'description': f"AUMASS Ausschreibung: {title}",
-                                'budget': None,
-                                'deadline': datetime.utcnow() + timedelta(days=30),
-                                'location': 'Deutschland',
-                                'project_type': 'Public Tender',
-                                'contracting_authority': 'Öffentlicher Auftraggeber',
-                                'category': cat_info['category'] or 'Projektmanagement',
-                                'building_typology': cat_info['building_typology'],
-                                'platform_source': 'AUMASS',
-                                'platform_url': 'https://www.aumass.de',
-                                'direct_link': link,
-                                'country': 'Germany',
-                            })
-            
-            await asyncio.sleep(0.5)
-        
-        return tenders
-
-    async def scrape_additional_hospitals(self) -> list:
-        """Scrape additional hospital platforms from user's list"""
-        tenders = []
-        additional_hospital_urls = {
-            'Ammerland Klinik': 'https://www.ammerland-klinik.de/ausschreibungen',
-        }
-        
-        for hospital, url in additional_hospital_urls.items():
-            html = await self.fetch_page(url)
-            if html:
-                soup = BeautifulSoup(html, 'lxml')
-                items = soup.select('table tr, .tender-item, article, .ausschreibung, .search-result')
-                logger.info(f"{hospital}: Found {len(items)} items")
-                
-                for item in items:
-                    title_elem = item.select_one('a, .title, h2, h3')
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        if len(title) > 15 and self.is_relevant_tender(title):
-                            link = title_elem.get('href', '') if title_elem.name == 'a' else ''
-                            if link and not link.startswith('http'):
-                                link = f"{url.rstrip('/')}/{link.lstrip('/')}"
-                            
-                            cat_info = self.categorize_tender(title)
-                            
-                            tenders.append({
-                                'title': title,
-                                'description': f"{hospital} Ausschreibung: {title}",
-                                'budget': None,
-                                'deadline': datetime.utcnow() + timedelta(days=30),
-                                'location': 'Deutschland',
-                                'project_type': 'Hospital Tender',
-                                'contracting_authority': hospital,
-                                'category': cat_info['category'] or 'Projektmanagement',
-                                'building_typology': 'Healthcare',
-                                'platform_source': hospital,
-                                'platform_url': url,
-                                'direct_link': link,
-                                'country': 'Germany',
-                            })
-            
-            await asyncio.sleep(0.5)
-        
-        return tenders
-
-    # ==================== SWISS PLATFORM ====================
-
-    async def scrape_simap_switzerland(self) -> list:
-        """Scrape simap.ch Switzerland using API and Playwright for Swiss public tenders
-        Only returns tenders from 2026 onwards with proper date filtering"""
+    # ==================== SWISS PLATFORM ====================
+
+    async def scrape_simap_switzerland(self) -> list:
+        """Scrape simap.ch Switzerland using API and Playwright for Swiss public tenders
+        Only returns tenders from 2026 onwards with proper date filtering"""
         tenders = []
         seen_tender_ids = set()
         
@@ -2031,7 +1636,8 @@ class ComprehensiveScraper:
         return tenders
     
     async def _scrape_simap_api(self) -> list:
-        """Try to scrape simap.ch using their API"""
+        """Try to scrape simap.ch using their API
+        Both endpoints are fetched concurrently over a single HTTP/2 connection."""
         tenders = []
         
         try:
@@ -2041,65 +1647,79 @@ class ComprehensiveScraper:
                 "https://www.simap.ch/api/v1/notices?status=open",
             ]
             
-            async with aiohttp.ClientSession() as session:
-                for api_url in api_urls:
-                    try:
-                        async with session.get(api_url, timeout=30, headers={
-                            'Accept': 'application/json',
-                            'User-Agent': 'Mozilla/5.0 (compatible; TenderBot/1.0)'
-                        }) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                
-                                items = data if isinstance(data, list) else data.get('data', data.get('items', data.get('notices', [])))
-                                
-                                for item in items[:50]:
-                                    try:
-                                        title = item.get('title', item.get('name', ''))
-                                        if not title or not self.is_relevant_tender(title):
-                                            continue
-                                        
-                                        # Extract deadline
-                                        deadline_str = item.get('deadline', item.get('submission_deadline', item.get('end_date', '')))
-                                        deadline = self._parse_date(deadline_str) if deadline_str else datetime(2026, 12, 31)
-                                        
-                                        # Filter by year
-                                        if deadline and deadline.year < 2026:
-                                            continue
-                                        
-                                        notice_id = item.get('id', item.get('notice_id', item.get('reference', '')))
-                                        
-                                        cat_info = self.categorize_tender(title)
-                                        
-                                        tenders.append({
-                                            'title': title,
-                                            'description': item.get('description', item.get('summary', title))[:500],
-                                            'tender_id': str(notice_id),
-                                            'budget': item.get('estimated_value', item.get('budget', 'Nicht angegeben')),
-                                            'deadline': deadline,
-                                            'location': item.get('location', item.get('place', 'Schweiz')),
-                                            'project_type': 'Public Tender',
-                                            'contracting_authority': item.get('contracting_authority', item.get('buyer', item.get('organization', 'Schweizer Behörde'))),
-                                            'category': cat_info['category'] or 'Bauwesen',
-                                            'building_typology': cat_info['building_typology'],
-                                            'platform_source': 'simap.ch (Schweiz)',
-                                            'platform_url': 'https://www.simap.ch',
-                                            'direct_link': f"https://www.simap.ch/notice/{notice_id}" if notice_id else 'https://www.simap.ch',
-                                            'country': 'Switzerland',
-                                        })
-                                    except Exception as e:
-                                        logger.debug(f"Error parsing simap API item: {e}")
-                                        continue
-                                        
-                    except Exception as e:
-                        logger.debug(f"simap.ch API error for {api_url}: {e}")
-                        continue
+            async with httpx.AsyncClient(http2=True, timeout=30, headers={
+                'Accept': 'application/json',
+                'User-Agent': 'Mozilla/5.0 (compatible; TenderBot/1.0)'
+            }) as client:
+                responses = await asyncio.gather(
+                    *(client.get(api_url) for api_url in api_urls),
+                    return_exceptions=True
+                )
+            
+            for api_url, response in zip(api_urls, responses):
+                if isinstance(response, Exception):
+                    logger.debug(f"simap.ch API error for {api_url}: {response}")
+                    continue
+                if response.status_code != 200:
+                    continue
+                self._page_fetched()
+                try:
+                    data = orjson.loads(response.content)
+                except ValueError as e:
+                    logger.debug(f"simap.ch API error for {api_url}: {e}")
+                    continue
+                tenders.extend(self._parse_simap_notices(data))
                         
         except Exception as e:
             logger.warning(f"simap.ch API scraping failed: {e}")
         
         return tenders
     
+    def _parse_simap_notices(self, data) -> list:
+        """Convert a simap.ch API payload into tender dicts"""
+        tenders = []
+        items = data if isinstance(data, list) else data.get('data', data.get('items', data.get('notices', [])))
+        
+        for item in items[:50]:
+            try:
+                title = item.get('title', item.get('name', ''))
+                if not title or not self.is_relevant_tender(title):
+                    continue
+                
+                # Extract deadline
+                deadline_str = item.get('deadline', item.get('submission_deadline', item.get('end_date', '')))
+                deadline = self._parse_date(deadline_str) if deadline_str else datetime(2026, 12, 31)
+                
+                # Filter by year
+                if deadline and deadline.year < 2026:
+                    continue
+                
+                notice_id = item.get('id', item.get('notice_id', item.get('reference', '')))
+                
+                cat_info = self.categorize_tender(title)
+                
+                tenders.append({
+                    'title': title,
+                    'description': item.get('description', item.get('summary', title))[:500],
+                    'tender_id': str(notice_id),
+                    'budget': item.get('estimated_value', item.get('budget', 'Nicht angegeben')),
+                    'deadline': deadline,
+                    'location': item.get('location', item.get('place', 'Schweiz')),
+                    'project_type': 'Public Tender',
+                    'contracting_authority': item.get('contracting_authority', item.get('buyer', item.get('organization', 'Schweizer Behörde'))),
+                    'category': cat_info['category'] or 'Bauwesen',
+                    'building_typology': cat_info['building_typology'],
+                    'platform_source': 'simap.ch (Schweiz)',
+                    'platform_url': 'https://www.simap.ch',
+                    'direct_link': f"https://www.simap.ch/notice/{notice_id}" if notice_id else 'https://www.simap.ch',
+                    'country': 'Switzerland',
+                })
+            except Exception as e:
+                logger.debug(f"Error parsing simap API item: {e}")
+                continue
+        
+        return tenders
+    
     async def _scrape_simap_web(self) -> list:
         """Scrape simap.ch using Playwright browser automation"""
         tenders = []
@@ -2120,7 +1740,9 @@ class ComprehensiveScraper:
                 for term in search_terms[:4]:  # Limit to 4 terms
                     try:
                         # Navigate to simap.ch
-                        await page.goto('https://www.simap.ch/de', wait_until='domcontentloaded', timeout=30000)
+                        response = await page.goto('https://www.simap.ch/de', wait_until='domcontentloaded', timeout=30000)
+                        if response and response.ok:
+                            self._page_fetched()
                         await page.wait_for_timeout(3000)
                         
                         # Take screenshot for debugging
@@ -2154,7 +1776,9 @@ class ComprehensiveScraper:
                         
                         if not search_found:
                             # Try direct URL
-                            await page.goto(f'https://www.simap.ch/de/ausschreibungen?q={term}', wait_until='domcontentloaded', timeout=30000)
+                            response = await page.goto(f'https://www.simap.ch/de/ausschreibungen?q={term}', wait_until='domcontentloaded', timeout=30000)
+                            if response and response.ok:
+                                self._page_fetched()
                             await page.wait_for_timeout(3000)
                         
                         # Look for tender listings
@@ -2320,211 +1944,252 @@ class ComprehensiveScraper:
 
     # ==================== MAIN SCRAPE ====================
 
-    async def scrape_all(self) -> int:
-        """Scrape all platforms and save to database with deduplication"""
-        async with aiohttp.ClientSession() as session:
+    def _create_session(self) -> aiohttp.ClientSession:
+        """One session for all scrapers of a run: pooled keep-alive connections,
+        cached DNS lookups and the default headers/timeout set once"""
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=8,
+            ttl_dns_cache=300,
+            # AsyncResolver (c-ares) when aiodns is installed, else getaddrinfo in a thread
+            resolver=aiohttp.resolver.DefaultResolver(),
+            keepalive_timeout=30,
+            ssl=False,
+            enable_cleanup_closed=True,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+    
+    async def _ensure_indexes(self):
+        """Create the indexes the save phase relies on, once per process: the title
+        lookup and the unique source_id index (same options as server.py startup),
+        plus the category/platform_source fields the reports group by"""
+        if ComprehensiveScraper._indexes_ready:
+            return
+        await self.db.tenders.create_index("source_id", unique=True, sparse=True)
+        await self.db.tenders.create_index("title")
+        await self.db.tenders.create_index("category")
+        await self.db.tenders.create_index("platform_source")
+        ComprehensiveScraper._indexes_ready = True
+    
+    async def _insert_tenders(self, tenders: list) -> int:
+        """Insert new tenders in one unordered batch. Documents rejected by the
+        unique source_id index are skipped without stopping the rest.
+        Returns the number of tenders inserted."""
+        if not tenders:
+            return 0
+        
+        failed = set()
+        try:
+            await self.db.tenders.insert_many(tenders, ordered=False)
+        except BulkWriteError as e:
+            failed = {error['index'] for error in e.details.get('writeErrors', [])}
+            logger.warning("%d tenders rejected on insert", len(failed))
+        
+        added = [tender for i, tender in enumerate(tenders) if i not in failed]
+        for tender in added:
+            logger.info("Added: %s...", tender['title'][:50])
+        return len(added)
+    
+    async def _run_scraper(self, label: str, scraper, timeout: float = None) -> list:
+        """Run a single platform scraper within its time budget (None: unbounded) once a
+        scraper slot is free; failures yield no tenders. Only a scraper that fetched at
+        least one page is checkpointed: fetch_page turns an unreachable platform into
+        empty pages, which must not count as a completed scrape."""
+        # Runs in its own task under run_all's gather, so this only labels its own fetches
+        CURRENT_SCRAPER.set(label)
+        async with self._scraper_semaphore:
+            try:
+                tenders = await asyncio.wait_for(scraper(), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning("%s: timed out after %ss", label, timeout)
+                return []
+            except Exception as e:
+                logger.error("%s scraping error: %s", label, e)
+                return []
+        logger.info("%s: %d tenders", label, len(tenders))
+        if label in self._fetched_scrapers:
+            self._completed_scrapers[label] = tenders
+        else:
+            logger.warning("%s: no page fetched, not checkpointed", label)
+        return tenders
+    
+    async def _recent_checkpoints(self) -> dict:
+        """Platforms whose tenders were saved within CHECKPOINT_MAX_AGE: label -> the
+        title/country/platform_source of the tenders that run scraped from it"""
+        since = datetime.utcnow() - self.CHECKPOINT_MAX_AGE
+        docs = await self.db.scrape_checkpoints.find(
+            {'last_ok': {'$gte': since}}, {'tenders': 1}
+        ).to_list(None)
+        return {doc['_id']: doc.get('tenders', []) for doc in docs}
+    
+    async def _save_checkpoints(self, completed: dict, saved_at: datetime):
+        """Record that these platforms' tenders are saved, so the next runs can skip
+        them, together with the tenders later runs deduplicate against"""
+        if completed:
+            await self.db.scrape_checkpoints.bulk_write([
+                UpdateOne({'_id': label}, {'$set': {
+                    'last_ok': saved_at,
+                    'tenders': [
+                        {
+                            'title': tender['title'],
+                            'country': tender.get('country', 'Germany'),
+                            'platform_source': tender['platform_source'],
+                        }
+                        for tender in tenders
+                    ],
+                }}, upsert=True)
+                for label, tenders in completed.items()
+            ], ordered=False)
+    
+    async def run_all(self, skip: set = frozenset()) -> list:
+        """Run all platform scrapers concurrently, at most MAX_CONCURRENT_SCRAPERS at a time.
+        Each one talks to a different host, so they are gathered instead of awaited one by one.
+        Scrapers whose label is in skip are left out.
+        Results are returned in platform order so deduplication stays deterministic."""
+        # Bund.de (one search per keyword and CPV code), DTVP and Ausschreibungen
+        # Deutschland (PAGES_TO_SCRAPE pages, per state for the latter) fetch page after
+        # page with rate-limit sleeps; a time budget would discard everything they
+        # parsed so far, so like TED and simap they run without one
+        scrapers = [
+            ('Bund.de', self.scrape_bund_de, None),
+            ('DTVP', self.scrape_dtvp, None),
+            ('Ausschreibungen Deutschland', self.scrape_ausschreibungen_deutschland, None),
+            ('Bayern', self.scrape_bayern, self.SCRAPER_TIMEOUT),
+        ]
+        scrapers += [
+            (platform['name'], functools.partial(self._scrape_platform, platform), self.SCRAPER_TIMEOUT)
+            for platform in self.PLATFORMS
+        ]
+        # TED walks every CPV code (per country) in a browser and simap falls back
+        # to a browser too, so these run without the per-platform time budget
+        scrapers += [
+            ('TED Europa (Germany)', self.scrape_ted_europa, None),
+            ('TED Europa (International)', self.scrape_ted_international, None),
+            ('simap.ch', self.scrape_simap_switzerland, None),
+        ]
+        if skip:
+            scrapers = [entry for entry in scrapers if entry[0] not in skip]
+            logger.info("Skipping %d recently scraped platforms", len(skip))
+        
+        results = await asyncio.gather(
+            *(self._run_scraper(label, scraper, timeout) for label, scraper, timeout in scrapers),
+            return_exceptions=True
+        )
+        
+        all_tenders = []
+        for (label, _, _), tenders in zip(scrapers, results):
+            if isinstance(tenders, BaseException):
+                logger.error("%s scraping error: %s", label, tenders)
+                continue
+            for tender in tenders:
+                tender['source_id'] = tender_source_id(tender['platform_source'], tender['title'])
+            all_tenders.extend(tenders)
+        return all_tenders
+    
+    async def scrape_all(self, skip_recent: bool = False) -> int:
+        """Scrape all platforms and save to database with deduplication.
+        With skip_recent (the every-minute scheduler), platforms checkpointed within
+        CHECKPOINT_MAX_AGE are not scraped again; the tenders they returned last time
+        still take part in deduplication, so a near-duplicate from another platform is
+        dropped just as if they had been scraped."""
+        async with self._create_session() as session:
             self.session = session
+            self._completed_scrapers = {}
+            self._fetched_scrapers = set()
             
             all_tenders = []
             
             logger.info("Starting comprehensive scrape of ALL platforms...")
             
-            # ========== GERMAN FEDERAL PLATFORMS ==========
-            logger.info("\n=== German Federal Platforms ===")
-            
-            bund_tenders = await self.scrape_bund_de()
-            all_tenders.extend(bund_tenders)
-            logger.info(f"Bund.de: {len(bund_tenders)} tenders")
-            
-            evergabe_tenders = await self.scrape_evergabe_online()
-            all_tenders.extend(evergabe_tenders)
-            logger.info(f"e-Vergabe Online: {len(evergabe_tenders)} tenders")
-            
-            dtvp_tenders = await self.scrape_dtvp()
-            all_tenders.extend(dtvp_tenders)
-            logger.info(f"DTVP: {len(dtvp_tenders)} tenders")
-            
-            oeff_tenders = await self.scrape_oeffentliche_vergabe()
-            all_tenders.extend(oeff_tenders)
-            logger.info(f"Öffentliche Vergabe: {len(oeff_tenders)} tenders")
-            
-            ausch_de_tenders = await self.scrape_ausschreibungen_deutschland()
-            all_tenders.extend(ausch_de_tenders)
-            logger.info(f"Ausschreibungen Deutschland: {len(ausch_de_tenders)} tenders")
-            
-            ted_tenders = await self.scrape_ted_europa()
-            all_tenders.extend(ted_tenders)
-            logger.info(f"TED Europa (Germany): {len(ted_tenders)} tenders")
-            
-            # ========== INTERNATIONAL/EUROPEAN TENDERS ==========
-            logger.info("\n=== International CPV Code Tenders ===")
-            ted_intl_tenders = await self.scrape_ted_international()
-            all_tenders.extend(ted_intl_tenders)
-            logger.info(f"TED Europa (International): {len(ted_intl_tenders)} tenders")
-            
-            ibau_tenders = await self.scrape_ibau()
-            all_tenders.extend(ibau_tenders)
-            logger.info(f"ibau: {len(ibau_tenders)} tenders")
-            
-            evergabe_de_tenders = await self.scrape_evergabe_de()
-            all_tenders.extend(evergabe_de_tenders)
-            logger.info(f"evergabe.de: {len(evergabe_de_tenders)} tenders")
-            
-            # ========== GERMAN STATE PLATFORMS ==========
-            logger.info("\n=== German State Platforms ===")
-            
-            bayern_tenders = await self.scrape_bayern()
-            all_tenders.extend(bayern_tenders)
-            logger.info(f"Bayern: {len(bayern_tenders)} tenders")
-            
-            nrw_tenders = await self.scrape_nrw()
-            all_tenders.extend(nrw_tenders)
-            logger.info(f"NRW: {len(nrw_tenders)} tenders")
-            
-            berlin_tenders = await self.scrape_berlin()
-            all_tenders.extend(berlin_tenders)
-            logger.info(f"Berlin: {len(berlin_tenders)} tenders")
-            
-            hamburg_tenders = await self.scrape_hamburg()
-            all_tenders.extend(hamburg_tenders)
-            logger.info(f"Hamburg: {len(hamburg_tenders)} tenders")
-            
-            bw_tenders = await self.scrape_baden_wuerttemberg()
-            all_tenders.extend(bw_tenders)
-            logger.info(f"Baden-Württemberg: {len(bw_tenders)} tenders")
-            
-            hessen_tenders = await self.scrape_hessen()
-            all_tenders.extend(hessen_tenders)
-            logger.info(f"Hessen: {len(hessen_tenders)} tenders")
-            
-            brandenburg_tenders = await self.scrape_brandenburg()
-            all_tenders.extend(brandenburg_tenders)
-            logger.info(f"Brandenburg: {len(brandenburg_tenders)} tenders")
-            
-            niedersachsen_tenders = await self.scrape_niedersachsen()
-            all_tenders.extend(niedersachsen_tenders)
-            logger.info(f"Niedersachsen: {len(niedersachsen_tenders)} tenders")
-            
-            rlp_tenders = await self.scrape_rheinland_pfalz()
-            all_tenders.extend(rlp_tenders)
-            logger.info(f"Rheinland-Pfalz: {len(rlp_tenders)} tenders")
-            
-            other_state_tenders = await self.scrape_other_states()
-            all_tenders.extend(other_state_tenders)
-            logger.info(f"Other States: {len(other_state_tenders)} tenders")
-            
-            # ========== HOSPITAL PLATFORMS ==========
-            logger.info("\n=== Hospital Platforms ===")
-            
-            hospital_tenders = await self.scrape_hospitals()
-            all_tenders.extend(hospital_tenders)
-            logger.info(f"Hospitals: {len(hospital_tenders)} tenders")
-            
-            fraunhofer_tenders = await self.scrape_fraunhofer()
-            all_tenders.extend(fraunhofer_tenders)
-            logger.info(f"Fraunhofer: {len(fraunhofer_tenders)} tenders")
-            
-            # ========== ADDITIONAL USER-REQUESTED PLATFORMS ==========
-            logger.info("\n=== Additional German Platforms (User Requested) ===")
-            
-            tender_impulse_tenders = await self.scrape_tender_impulse()
-            all_tenders.extend(tender_impulse_tenders)
-            logger.info(f"Tender Impulse: {len(tender_impulse_tenders)} tenders")
-            
-            vergabe24_tenders = await self.scrape_vergabe24()
-            all_tenders.extend(vergabe24_tenders)
-            logger.info(f"vergabe24: {len(vergabe24_tenders)} tenders")
-            
-            dtad_tenders = await self.scrape_dtad()
-            all_tenders.extend(dtad_tenders)
-            logger.info(f"DTAD: {len(dtad_tenders)} tenders")
-            
-            cwc_tenders = await self.scrape_cwc_tenders()
-            all_tenders.extend(cwc_tenders)
-            logger.info(f"CWC Tenders: {len(cwc_tenders)} tenders")
-            
-            bidding_source_tenders = await self.scrape_bidding_source()
-            all_tenders.extend(bidding_source_tenders)
-            logger.info(f"BiddingSource: {len(bidding_source_tenders)} tenders")
-            
-            a24_tenders = await self.scrape_a24_salescloud()
-            all_tenders.extend(a24_tenders)
-            logger.info(f"A24 Sales Cloud: {len(a24_tenders)} tenders")
-            
-            berlin_procurement_tenders = await self.scrape_berlin_procurement()
-            all_tenders.extend(berlin_procurement_tenders)
-            logger.info(f"Berlin Procurement: {len(berlin_procurement_tenders)} tenders")
-            
-            lzbw_tenders = await self.scrape_lzbw()
-            all_tenders.extend(lzbw_tenders)
-            logger.info(f"LZBW: {len(lzbw_tenders)} tenders")
-            
-            baunetzwerk_tenders = await self.scrape_de_baunetzwerk()
-            all_tenders.extend(baunetzwerk_tenders)
-            logger.info(f"D&E BauNetzwerk: {len(baunetzwerk_tenders)} tenders")
-            
-            global_tenders = await self.scrape_global_tenders_germany()
-            all_tenders.extend(global_tenders)
-            logger.info(f"Global Tenders Germany: {len(global_tenders)} tenders")
-            
-            aumass_tenders = await self.scrape_aumass()
-            all_tenders.extend(aumass_tenders)
-            logger.info(f"AUMASS: {len(aumass_tenders)} tenders")
-            
-            additional_hospital_tenders = await self.scrape_additional_hospitals()
-            all_tenders.extend(additional_hospital_tenders)
-            logger.info(f"Additional Hospitals: {len(additional_hospital_tenders)} tenders")
-            
-            # ========== SWISS PLATFORM ==========
-            logger.info("\n=== Swiss Platforms ===")
-            
-            simap_tenders = await self.scrape_simap_switzerland()
-            all_tenders.extend(simap_tenders)
-            logger.info(f"simap.ch: {len(simap_tenders)} tenders")
+            # ========== ALL PLATFORMS (concurrent) ==========
+            logger.info("\n=== German, Hospital, TED and Swiss Platforms ===")
+            recent = await self._recent_checkpoints() if skip_recent else {}
+            all_tenders.extend(await self.run_all(skip=set(recent)))
             
             # ========== DEDUPLICATION ==========
             logger.info(f"\n=== Deduplication ===")
             logger.info(f"Total scraped before deduplication: {len(all_tenders)}")
             
-            unique_tenders = self.deduplicate_tenders(all_tenders)
+            # Skipped platforms' last results compete in deduplication but are not saved
+            seeds = [
+                {**tender, 'checkpoint_seed': True}
+                for tenders in recent.values() for tender in tenders
+            ]
+            unique_tenders = [
+                tender for tender in self.deduplicate_tenders(seeds + all_tenders)
+                if not tender.get('checkpoint_seed')
+            ]
             logger.info(f"After deduplication: {len(unique_tenders)} unique tenders")
             
             # ========== SAVE TO DATABASE ==========
-            added_count = 0
+            await self._ensure_indexes()
+            
+            # One lookup for all titles and source_ids instead of a find_one per tender
+            existing_titles, existing_ids = set(), set()
+            if unique_tenders:
+                existing = await self.db.tenders.find(
+                    {'$or': [
+                        {'title': {'$in': [tender['title'] for tender in unique_tenders]}},
+                        {'source_id': {'$in': [tender['source_id'] for tender in unique_tenders]}},
+                    ]},
+                    {'title': 1, 'source_id': 1, '_id': 0}
+                ).to_list(None)
+                for doc in existing:
+                    existing_titles.add(doc.get('title'))
+                    existing_ids.add(doc.get('source_id'))
+            
+            # Timestamps and status fields are the same for every tender of a run
+            now = datetime.utcnow()
+            common_fields = {
+                **NEW_TENDER_FIELDS,
+                'tender_date': now,
+                'scraped_at': now,
+                'created_at': now,
+                'updated_at': now,
+            }
+            
+            new_tenders = []
             for tender in unique_tenders:
-                # Check for existing in database
-                existing = await self.db.tenders.find_one({'title': tender['title']})
-                if not existing:
+                if tender['title'] not in existing_titles and tender['source_id'] not in existing_ids:
                     # Add common fields
                     tender['application_url'] = self.generate_application_url(
                         tender['title'], 
                         tender['platform_source'],
                         tender['platform_url']
                     )
+                    tender |= common_fields
+                    # Mutable fields must not be shared between documents
                     tender['participants'] = []
                     tender['contact_details'] = {}
-                    tender['tender_date'] = datetime.utcnow()
-                    tender['status'] = 'New'
-                    tender['is_applied'] = False
-                    tender['application_status'] = 'Not Applied'
                     tender['linkedin_connections'] = []
-                    tender['scraped_at'] = datetime.utcnow()
-                    tender['created_at'] = datetime.utcnow()
-                    tender['updated_at'] = datetime.utcnow()
-                    tender['source_id'] = f"{tender['platform_source']}_{hash(tender['title'])}"
                     
                     # Ensure country field
-                    if 'country' not in tender:
-                        tender['country'] = 'Germany'
+                    tender.setdefault('country', 'Germany')
                     
-                    await self.db.tenders.insert_one(tender)
-                    added_count += 1
-                    logger.info(f"Added: {tender['title'][:50]}...")
-            
+                    new_tenders.append(tender)
+                    # Later tenders of this run with the same title or id are duplicates too
+                    existing_titles.add(tender['title'])
+                    existing_ids.add(tender['source_id'])
+            
+            added_count = await self._insert_tenders(new_tenders)
+            # Only now are these platforms' results safely stored
+            await self._save_checkpoints(self._completed_scrapers, now)
             logger.info(f"\n✅ Total new tenders added: {added_count}")
             return added_count
 
 
+async def field_distribution(db, field: str) -> list:
+    """Tender counts per value of field, most frequent first"""
+    return await db.tenders.aggregate([
+        {'$group': {'_id': f'${field}', 'count': {'$sum': 1}}},
+        {'$sort': {'count': -1}}
+    ]).to_list(None)
+
+
 async def main():
     """Run the comprehensive scraper"""
     from dotenv import load_dotenv
@@ -2536,32 +2201,23 @@ async def main():
     scraper = ComprehensiveScraper(db)
     added = await scraper.scrape_all()
     
-    total = await db.tenders.count_documents({})
+    # The count and the distributions are independent queries, so run them together
+    total, categories, platforms, countries = await asyncio.gather(
+        db.tenders.count_documents({}),
+        field_distribution(db, 'category'),
+        field_distribution(db, 'platform_source'),
+        field_distribution(db, 'country'),
+    )
     print(f"\n📊 Total tenders in database: {total}")
     
-    # Show category distribution
-    print("\n=== Category Distribution ===")
-    async for doc in db.tenders.aggregate([
-        {'$group': {'_id': '$category', 'count': {'$sum': 1}}},
-        {'$sort': {'count': -1}}
-    ]):
-        print(f"  {doc['_id']}: {doc['count']}")
-    
-    # Show platform distribution
-    print("\n=== Platform Distribution ===")
-    async for doc in db.tenders.aggregate([
-        {'$group': {'_id': '$platform_source', 'count': {'$sum': 1}}},
-        {'$sort': {'count': -1}}
-    ]):
-        print(f"  {doc['_id']}: {doc['count']}")
-    
-    # Show country distribution
-    print("\n=== Country Distribution ===")
-    async for doc in db.tenders.aggregate([
-        {'$group': {'_id': '$country', 'count': {'$sum': 1}}},
-        {'$sort': {'count': -1}}
-    ]):
-        print(f"  {doc['_id']}: {doc['count']}")
+    for heading, distribution in (
+        ("Category", categories),
+        ("Platform", platforms),
+        ("Country", countries),
+    ):
+        print(f"\n=== {heading} Distribution ===")
+        for doc in distribution:
+            print(f"  {doc['_id']}: {doc['count']}")
     
     client.close()
 
@@ -7,14 +7,82 @@ Focus on NRW (Nordrhein-Westfalen) and Brandenburg regions
 
 import asyncio
 import aiohttp
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+from html_utils import select_all, select_descendant
+from pymongo import UpdateOne
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
 import re
+import unicodedata
 import logging
 
 logger = logging.getLogger(__name__)
 
+# News pages are parsed on these threads instead of the event loop
+PARSE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='developer-parse')
+
+# Investment amounts in millions or billions of euros
+BUDGET_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'(\d+(?:[\.,]\d+)?)\s*(?:Mio\.?|Millionen?)\s*(?:Euro|EUR|€)',
+        r'(\d+(?:[\.,]\d+)?)\s*(?:Mrd\.?|Milliarden?)\s*(?:Euro|EUR|€)',
+        r'(?:Euro|EUR|€)\s*(\d+(?:[\.,]\d+)?)\s*(?:Mio\.?|Millionen?)',
+        r'Investition(?:svolumen)?\s*(?:von)?\s*(?:ca\.?)?\s*(\d+(?:[\.,]\d+)?)',
+    )
+]
+BILLION_RE = re.compile(r'mrd|milliard', re.IGNORECASE)
+YEAR_RE = re.compile(r'(20[2-3]\d)')
+
+def keyword_pattern(keywords) -> re.Pattern:
+    """Case-insensitive alternation matching any of the keywords as a substring"""
+    return re.compile('|'.join(re.escape(kw) for kw in keywords), re.IGNORECASE)
+
+# Common project phases
+PHASE_PATTERNS = [
+    (phase_name, keyword_pattern(keywords)) for phase_name, keywords in (
+        ("Planung", ["planung", "geplant", "entwurf", "konzept"]),
+        ("Genehmigung", ["genehmigung", "baugenehmigung", "genehmigt"]),
+        ("Baustart", ["baustart", "baubeginn", "spatenstich", "grundsteinlegung"]),
+        ("Rohbau", ["rohbau", "rohbauarbeiten"]),
+        ("Innenausbau", ["innenausbau", "ausbau"]),
+        ("Fertigstellung", ["fertigstellung", "fertiggestellt", "bezugsfertig", "übergabe"]),
+    )
+]
+
+# Timeline of a project whose text names no phase; shared by all such projects
+DEFAULT_PHASES = (
+    {"phase": "Planung", "status": "ongoing", "progress": 50},
+    {"phase": "Genehmigung", "status": "pending", "progress": 0},
+    {"phase": "Baustart", "status": "pending", "progress": 0},
+    {"phase": "Fertigstellung", "status": "pending", "progress": 0},
+)
+
+# Checked in order; the first match wins
+STATUS_PATTERNS = [
+    ('completed', keyword_pattern(['fertiggestellt', 'abgeschlossen', 'übergeben', 'bezogen'])),
+    ('delayed', keyword_pattern(['verzöger', 'aufgeschoben', 'pausiert'])),
+    ('ongoing', keyword_pattern(['bau', 'bauarbeiten', 'fortschritt', 'rohbau', 'errichtet'])),
+]
+PROJECT_TYPE_PATTERNS = [
+    ('Residential', keyword_pattern(['wohnung', 'wohnhaus', 'residential', 'appartement', 'eigentum'])),
+    ('Commercial', keyword_pattern(['büro', 'office', 'gewerbe', 'geschäft'])),
+    ('Hospitality', keyword_pattern(['hotel', 'gastgewerbe'])),
+    ('Industrial', keyword_pattern(['logistik', 'lager', 'warehouse', 'industrie'])),
+    ('Mixed-Use', keyword_pattern(['mixed', 'quartier', 'stadtentwicklung'])),
+]
+
+# Titles without any of these are not project announcements
+PROJECT_KEYWORDS_RE = keyword_pattern([
+    'projekt', 'bau', 'neubau', 'entwicklung', 'quartier',
+    'wohnung', 'immobilie', 'grundsteinlegung', 'fertigstellung'
+])
+
+def project_key(name: str) -> str:
+    """Deduplication key for a project name: Unicode-normalized, case-folded, trimmed"""
+    return unicodedata.normalize('NFKC', name).casefold().strip()
+
 class DeveloperProjectsScraper:
     """Scraper for German property developer project announcements"""
     
@@ -30,6 +98,12 @@ class DeveloperProjectsScraper:
         "Berlin": ["Berlin", "Berlin-Mitte", "Charlottenburg", "Kreuzberg", "Prenzlauer Berg",
                   "Friedrichshain", "Neukölln", "Tempelhof", "Spandau", "Pankow"],
     }
+    # Longest names first, so "Berlin-Mitte" is reported rather than "Berlin"
+    REGION_PATTERNS = [
+        (region, keyword_pattern(sorted(cities, key=len, reverse=True)))
+        for region, cities in REGIONS.items()
+    ]
+    CITY_INDEX = {city.lower(): city for cities in REGIONS.values() for city in cities}
     
     # Major German property developers with their websites
     DEVELOPERS = [
@@ -65,9 +139,35 @@ class DeveloperProjectsScraper:
         {"name": "BUWOG", "url": "https://www.buwog.de", "type": "residential", "region": "Brandenburg"},
     ]
     
+    # Concurrent requests to one developer site
+    MAX_REQUESTS_PER_HOST = 2
+    # News pages are cut off here; articles sit near the top of the page
+    MAX_PAGE_BYTES = 2_000_000
+    HTML_CONTENT_TYPES = ('text/html', 'application/xhtml')
+    
+    # Set once the developer_projects index exists, so repeated runs skip create_index
+    _indexes_ready = False
+    
+    # News/press pages tried on every developer site
+    NEWS_PATHS = [
+        "/news", "/aktuelles", "/presse", "/pressemitteilungen",
+        "/neuigkeiten", "/projekte", "/referenzen", "/portfolio"
+    ]
+    # Sites are re-probed on all NEWS_PATHS this often; in between only paths
+    # that were not gone at the last probe are fetched
+    PATH_PROBE_INTERVAL = timedelta(days=7)
+    # Only these statuses drop a path; timeouts, DNS errors and 5xx keep it
+    GONE_STATUSES = (404, 410)
+    
     def __init__(self, db):
         self.db = db
         self.session = None
+        # developer url -> cached path document, and the paths still live this run;
+        # URLs that answered with a GONE_STATUSES code
+        self._known_paths = {}
+        self._live_paths = {}
+        self._gone_urls = set()
+        self._host_slots = {}  # host -> semaphore of MAX_REQUESTS_PER_HOST
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -75,43 +175,58 @@ class DeveloperProjectsScraper:
         }
     
     async def fetch_page(self, url: str) -> str:
-        """Fetch a page with error handling"""
+        """Fetch a page with error handling. A host slot is taken before the request,
+        so the request timeout only starts once a connection to that host is free."""
+        host = urlparse(url).netloc
+        slots = self._host_slots.get(host)
+        if slots is None:
+            slots = self._host_slots[host] = asyncio.Semaphore(self.MAX_REQUESTS_PER_HOST)
         try:
-            async with self.session.get(url, headers=self.headers, timeout=30, ssl=False) as response:
+            async with slots, self.session.get(url) as response:
                 if response.status == 200:
-                    return await response.text()
+                    if not response.headers.get('Content-Type', '').lower().startswith(self.HTML_CONTENT_TYPES):
+                        return ""
+                    return await self._read_text(response)
                 else:
+                    if response.status in self.GONE_STATUSES:
+                        self._gone_urls.add(url)
                     logger.warning(f"Failed to fetch {url}: Status {response.status}")
                     return ""
         except Exception as e:
             logger.error(f"Error fetching {url}: {e}")
             return ""
     
-    def detect_region(self, text: str) -> Optional[str]:
-        """Detect which region a project belongs to based on location text"""
-        text_lower = text.lower()
-        
-        for region, cities in self.REGIONS.items():
-            for city in cities:
-                if city.lower() in text_lower:
-                    return region
+    async def _read_text(self, response) -> str:
+        """Read the response in chunks up to MAX_PAGE_BYTES and decode it with the
+        declared charset"""
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(16384):
+            body += chunk
+            if len(body) >= self.MAX_PAGE_BYTES:
+                del body[self.MAX_PAGE_BYTES:]
+                break
+        try:
+            return body.decode(response.charset or 'utf-8', errors='replace')
+        except LookupError:
+            return body.decode('utf-8', errors='replace')
+    
+    def detect_region(self, text: str) -> Optional[Tuple[str, str]]:
+        """Detect which region a project belongs to based on location text.
+        Returns (city, region) for the first region mentioned, or None."""
+        for region, pattern in self.REGION_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                return self.CITY_INDEX[match.group(0).lower()], region
         
         return None
     
     def extract_budget(self, text: str) -> Optional[str]:
         """Extract budget/investment amount from text"""
-        patterns = [
-            r'(\d+(?:[\.,]\d+)?)\s*(?:Mio\.?|Millionen?)\s*(?:Euro|EUR|€)',
-            r'(\d+(?:[\.,]\d+)?)\s*(?:Mrd\.?|Milliarden?)\s*(?:Euro|EUR|€)',
-            r'(?:Euro|EUR|€)\s*(\d+(?:[\.,]\d+)?)\s*(?:Mio\.?|Millionen?)',
-            r'Investition(?:svolumen)?\s*(?:von)?\s*(?:ca\.?)?\s*(\d+(?:[\.,]\d+)?)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in BUDGET_PATTERNS:
+            match = pattern.search(text)
             if match:
                 amount = match.group(1).replace(',', '.')
-                if 'mrd' in text.lower() or 'milliard' in text.lower():
+                if BILLION_RE.search(text):
                     return f"€{amount} Mrd."
                 return f"€{amount} Mio."
         
@@ -125,81 +240,53 @@ class DeveloperProjectsScraper:
             "phases": []
         }
         
-        # Look for year patterns
-        year_pattern = r'(20[2-3]\d)'
-        years = re.findall(year_pattern, text)
+        # Look for year patterns; only the earliest and latest year are used.
+        # Years are all four digits, so they compare correctly as strings.
+        first_year = last_year = None
+        for match in YEAR_RE.finditer(text):
+            year = match.group(1)
+            if first_year is None or year < first_year:
+                first_year = year
+            if last_year is None or year > last_year:
+                last_year = year
         
-        if years:
-            years = sorted(set(years))
-            if len(years) >= 1:
-                timeline["start_date"] = f"01.01.{years[0]}"
-            if len(years) >= 2:
-                timeline["completion_date"] = f"31.12.{years[-1]}"
-            elif len(years) == 1:
+        if first_year:
+            timeline["start_date"] = f"01.01.{first_year}"
+            if last_year != first_year:
+                timeline["completion_date"] = f"31.12.{last_year}"
+            else:
                 # Assume 2-3 year project
-                completion_year = int(years[0]) + 2
+                completion_year = int(first_year) + 2
                 timeline["completion_date"] = f"31.12.{completion_year}"
         
-        # Common project phases
-        phase_keywords = {
-            "Planung": ["planung", "geplant", "entwurf", "konzept"],
-            "Genehmigung": ["genehmigung", "baugenehmigung", "genehmigt"],
-            "Baustart": ["baustart", "baubeginn", "spatenstich", "grundsteinlegung"],
-            "Rohbau": ["rohbau", "rohbauarbeiten"],
-            "Innenausbau": ["innenausbau", "ausbau"],
-            "Fertigstellung": ["fertigstellung", "fertiggestellt", "bezugsfertig", "übergabe"],
-        }
-        
-        text_lower = text.lower()
-        for phase_name, keywords in phase_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    timeline["phases"].append({
-                        "phase": phase_name,
-                        "status": "ongoing" if phase_name in ["Planung", "Genehmigung"] else "pending",
-                        "progress": 0
-                    })
-                    break
+        for phase_name, pattern in PHASE_PATTERNS:
+            if pattern.search(text):
+                timeline["phases"].append({
+                    "phase": phase_name,
+                    "status": "ongoing" if phase_name in ["Planung", "Genehmigung"] else "pending",
+                    "progress": 0
+                })
         
         # Set default phases if none found
         if not timeline["phases"]:
-            timeline["phases"] = [
-                {"phase": "Planung", "status": "ongoing", "progress": 50},
-                {"phase": "Genehmigung", "status": "pending", "progress": 0},
-                {"phase": "Baustart", "status": "pending", "progress": 0},
-                {"phase": "Fertigstellung", "status": "pending", "progress": 0},
-            ]
+            timeline["phases"] = DEFAULT_PHASES
         
         return timeline
     
     def determine_project_status(self, text: str) -> str:
         """Determine project status from text"""
-        text_lower = text.lower()
-        
-        if any(kw in text_lower for kw in ['fertiggestellt', 'abgeschlossen', 'übergeben', 'bezogen']):
-            return 'completed'
-        elif any(kw in text_lower for kw in ['verzöger', 'aufgeschoben', 'pausiert']):
-            return 'delayed'
-        elif any(kw in text_lower for kw in ['bau', 'bauarbeiten', 'fortschritt', 'rohbau', 'errichtet']):
-            return 'ongoing'
-        else:
-            return 'planning'
+        for status, pattern in STATUS_PATTERNS:
+            if pattern.search(text):
+                return status
+        return 'planning'
     
     def determine_project_type(self, text: str, developer_type: str) -> str:
         """Determine project type from text"""
-        text_lower = text.lower()
+        for project_type, pattern in PROJECT_TYPE_PATTERNS:
+            if pattern.search(text):
+                return project_type
         
-        if any(kw in text_lower for kw in ['wohnung', 'wohnhaus', 'residential', 'appartement', 'eigentum']):
-            return 'Residential'
-        elif any(kw in text_lower for kw in ['büro', 'office', 'gewerbe', 'geschäft']):
-            return 'Commercial'
-        elif any(kw in text_lower for kw in ['hotel', 'gastgewerbe']):
-            return 'Hospitality'
-        elif any(kw in text_lower for kw in ['logistik', 'lager', 'warehouse', 'industrie']):
-            return 'Industrial'
-        elif any(kw in text_lower for kw in ['mixed', 'quartier', 'stadtentwicklung']):
-            return 'Mixed-Use'
-        elif developer_type == 'residential':
+        if developer_type == 'residential':
             return 'Residential'
         elif developer_type == 'commercial':
             return 'Commercial'
@@ -210,123 +297,203 @@ class DeveloperProjectsScraper:
         """Scrape project news from a developer's website"""
         projects = []
         
-        # Common news/press page paths
-        news_paths = [
-            "/news", "/aktuelles", "/presse", "/pressemitteilungen", 
-            "/neuigkeiten", "/projekte", "/referenzen", "/portfolio"
+        # Defaults shared by every project of this scrape
+        scraped_at = datetime.utcnow()
+        default_start = scraped_at.strftime('%Y-%m-%d')
+        default_completion = (scraped_at + timedelta(days=730)).strftime('%Y-%m-%d')
+        
+        # Fetch all news/press pages at once; they are parsed in path order below
+        paths = self._paths_to_fetch(developer['url'])
+        urls = [f"{developer['url']}{path}" for path in paths]
+        pages = await asyncio.gather(*(self.fetch_page(url) for url in urls))
+        self._live_paths[developer['url']] = [
+            path for path, url in zip(paths, urls) if url not in self._gone_urls
         ]
         
-        for path in news_paths:
-            url = f"{developer['url']}{path}"
-            html = await self.fetch_page(url)
-            
-            if html:
-                soup = BeautifulSoup(html, 'lxml')
+        # Paths that redirect to the same page (e.g. /news and /aktuelles) are parsed once
+        loop = asyncio.get_running_loop()
+        seen_pages = set()
+        for url, html in zip(urls, pages):
+            if html and html not in seen_pages:
+                seen_pages.add(html)
+                projects.extend(await loop.run_in_executor(
+                    PARSE_POOL, self._parse_news_page, html, url, developer,
+                    scraped_at, default_start, default_completion
+                ))
+        
+        return projects
+    
+    def _parse_news_page(self, html: str, url: str, developer: Dict, scraped_at: datetime,
+                         default_start: str, default_completion: str) -> List[Dict]:
+        """Extract project announcements from one news page. Runs in PARSE_POOL, so it
+        only reads its arguments and the class-level pattern tables."""
+        projects = []
+        tree = LexborHTMLParser(html)
+        
+        # Look for news/project articles
+        articles = select_all(tree, 'article, .news-item, .project-item, .card, .teaser, [class*="news"], [class*="project"]')
+        
+        for article in articles[:10]:  # Limit per page
+            try:
+                # Extract title
+                title_elem = select_descendant(article, 'h1, h2, h3, h4, .title, .headline')
+                title = title_elem.text(strip=True) if title_elem else None
                 
-                # Look for news/project articles
-                articles = soup.select('article, .news-item, .project-item, .card, .teaser, [class*="news"], [class*="project"]')
+                if not title or len(title) < 10:
+                    continue
                 
-                for article in articles[:10]:  # Limit per page
-                    try:
-                        # Extract title
-                        title_elem = article.select_one('h1, h2, h3, h4, .title, .headline')
-                        title = title_elem.get_text(strip=True) if title_elem else None
-                        
-                        if not title or len(title) < 10:
-                            continue
-                        
-                        # Skip if not project-related
-                        project_keywords = ['projekt', 'bau', 'neubau', 'entwicklung', 'quartier', 
-                                          'wohnung', 'immobilie', 'grundsteinlegung', 'fertigstellung']
-                        if not any(kw in title.lower() for kw in project_keywords):
-                            continue
-                        
-                        # Extract description
-                        desc_elem = article.select_one('p, .description, .excerpt, .summary, .text')
-                        description = desc_elem.get_text(strip=True) if desc_elem else title
-                        
-                        # Extract link
-                        link_elem = article.select_one('a[href]')
-                        link = link_elem.get('href', '') if link_elem else ''
-                        if link and not link.startswith('http'):
-                            link = f"{developer['url']}{link}"
-                        
-                        # Combine text for analysis
-                        full_text = f"{title} {description}"
-                        
-                        # Detect region
-                        region = self.detect_region(full_text) or developer.get('region', 'Germany')
-                        
-                        # Skip if not in target regions (NRW or Brandenburg) unless it's a major project
-                        budget = self.extract_budget(full_text)
-                        
-                        # Extract timeline
-                        timeline = self.extract_timeline(full_text)
-                        
-                        # Determine status
-                        status = self.determine_project_status(full_text)
-                        
-                        # Determine project type
-                        project_type = self.determine_project_type(full_text, developer.get('type', 'mixed'))
-                        
-                        # Extract location from text
-                        location = region
-                        for region_name, cities in self.REGIONS.items():
-                            for city in cities:
-                                if city.lower() in full_text.lower():
-                                    location = f"{city}, {region_name}"
-                                    break
-                        
-                        project = {
-                            'developer_name': developer['name'],
-                            'developer_url': developer['url'],
-                            'project_name': title,
-                            'description': description[:500] if description else f"Projekt von {developer['name']}",
-                            'location': location,
-                            'region': region if region in ['NRW', 'Brandenburg', 'Berlin'] else 'Other',
-                            'budget': budget,
-                            'project_type': project_type,
-                            'status': status,
-                            'start_date': timeline.get('start_date') or datetime.utcnow().strftime('%Y-%m-%d'),
-                            'expected_completion': timeline.get('completion_date') or (datetime.utcnow() + timedelta(days=730)).strftime('%Y-%m-%d'),
-                            'timeline_phases': timeline.get('phases', []),
-                            'source_url': link or url,
-                            'scraped_at': datetime.utcnow(),
-                        }
-                        
-                        projects.append(project)
-                        
-                    except Exception as e:
-                        logger.debug(f"Error parsing article from {developer['name']}: {e}")
-                        continue
+                # Skip if not project-related
+                if not PROJECT_KEYWORDS_RE.search(title):
+                    continue
                 
-                await asyncio.sleep(0.3)  # Rate limiting
+                # Extract description
+                desc_elem = select_descendant(article, 'p, .description, .excerpt, .summary, .text')
+                description = desc_elem.text(strip=True) if desc_elem else title
+                
+                # Extract link
+                link_elem = select_descendant(article, 'a[href]')
+                link = (link_elem.attributes.get('href') or '') if link_elem else ''
+                if link and not link.startswith('http'):
+                    link = f"{developer['url']}{link}"
+                
+                # Combine text for analysis
+                full_text = f"{title} {description}"
+                
+                # Detect region and location
+                place = self.detect_region(full_text)
+                if place:
+                    city, region = place
+                    location = f"{city}, {region}"
+                else:
+                    region = location = developer.get('region', 'Germany')
+                
+                # Skip if not in target regions (NRW or Brandenburg) unless it's a major project
+                budget = self.extract_budget(full_text)
+                
+                # Extract timeline
+                timeline = self.extract_timeline(full_text)
+                
+                # Determine status
+                status = self.determine_project_status(full_text)
+                
+                # Determine project type
+                project_type = self.determine_project_type(full_text, developer.get('type', 'mixed'))
+                
+                project = {
+                    'developer_name': developer['name'],
+                    'developer_url': developer['url'],
+                    'project_name': title,
+                    'description': description[:500] if description else f"Projekt von {developer['name']}",
+                    'location': location,
+                    'region': region if region in ['NRW', 'Brandenburg', 'Berlin'] else 'Other',
+                    'budget': budget,
+                    'project_type': project_type,
+                    'status': status,
+                    'start_date': timeline.get('start_date') or default_start,
+                    'expected_completion': timeline.get('completion_date') or default_completion,
+                    'timeline_phases': timeline.get('phases', []),
+                    'source_url': link or url,
+                    'scraped_at': scraped_at,
+                }
+                
+                projects.append(project)
+                
+            except Exception as e:
+                logger.debug(f"Error parsing article from {developer['name']}: {e}")
+                continue
         
         return projects
     
+    def _probe_due(self, developer_url: str) -> bool:
+        """Whether a developer's site has not been probed within PATH_PROBE_INTERVAL"""
+        known = self._known_paths.get(developer_url)
+        return not (known and known.get('probed_at')
+                    and known['probed_at'] > datetime.utcnow() - self.PATH_PROBE_INTERVAL)
+    
+    def _paths_to_fetch(self, developer_url: str) -> List[str]:
+        """All NEWS_PATHS when the site is due for a probe, else its cached live paths"""
+        if self._probe_due(developer_url):
+            return self.NEWS_PATHS
+        live_paths = self._known_paths[developer_url]['live_paths']
+        return [path for path in self.NEWS_PATHS if path in live_paths]
+    
+    async def _load_known_paths(self):
+        """Read the live news paths found for each developer by earlier runs"""
+        docs = await self.db.developer_scraper_paths.find(
+            {'_id': {'$in': [developer['url'] for developer in self.DEVELOPERS]}}
+        ).to_list(None)
+        self._known_paths = {doc['_id']: doc for doc in docs}
+    
+    async def _save_live_paths(self):
+        """Store this run's live paths. A full probe that found live paths resets the
+        probe time; when no path is left, the next run probes again."""
+        now = datetime.utcnow()
+        operations = []
+        for developer_url, live_paths in self._live_paths.items():
+            if not live_paths:
+                update = {'$set': {'live_paths': live_paths, 'probed_at': None}}
+            elif self._probe_due(developer_url):
+                update = {'$set': {'live_paths': live_paths, 'probed_at': now}}
+            else:
+                update = {'$set': {'live_paths': live_paths}}
+            operations.append(UpdateOne({'_id': developer_url}, update, upsert=True))
+        if operations:
+            await self.db.developer_scraper_paths.bulk_write(operations, ordered=False)
+    
+    def _create_session(self) -> aiohttp.ClientSession:
+        """One session for all developers of a run: pooled keep-alive connections,
+        cached DNS lookups and the default headers/timeout set once. Each developer
+        is a different host; at most 2 connections per host keep any single site
+        from being hammered by the concurrent fetches, and limit=64 caps in-flight
+        requests across all developers."""
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=self.MAX_REQUESTS_PER_HOST,
+            ttl_dns_cache=300,
+            resolver=aiohttp.resolver.DefaultResolver(),
+            enable_cleanup_closed=True,
+            ssl=False,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+    
+    async def _scrape_one(self, developer: Dict) -> List[Dict]:
+        """Scrape one developer; errors are logged and yield no projects"""
+        logger.info(f"Scraping {developer['name']}...")
+        try:
+            projects = await self.scrape_developer_news(developer)
+        except Exception as e:
+            logger.error(f"Error scraping {developer['name']}: {e}")
+            return []
+        logger.info(f"  Found {len(projects)} projects from {developer['name']}")
+        return projects
+    
     async def scrape_all_developers(self) -> List[Dict]:
         """Scrape projects from all developers"""
         all_projects = []
         
-        async with aiohttp.ClientSession() as session:
+        await self._load_known_paths()
+        self._live_paths = {}
+        self._gone_urls = set()
+        self._host_slots = {}
+        async with self._create_session() as session:
             self.session = session
             
-            for developer in self.DEVELOPERS:
-                logger.info(f"Scraping {developer['name']}...")
-                try:
-                    projects = await self.scrape_developer_news(developer)
-                    all_projects.extend(projects)
-                    logger.info(f"  Found {len(projects)} projects from {developer['name']}")
-                except Exception as e:
-                    logger.error(f"Error scraping {developer['name']}: {e}")
-                
-                await asyncio.sleep(0.5)  # Rate limiting between developers
+            # Results come back in DEVELOPERS order, so deduplication stays deterministic
+            results = await asyncio.gather(*(self._scrape_one(developer) for developer in self.DEVELOPERS))
+            for projects in results:
+                all_projects.extend(projects)
+        
+        await self._save_live_paths()
         
-        # Deduplicate by project name
+        # Deduplicate by full project name
         seen_names = set()
         unique_projects = []
         for project in all_projects:
-            name_key = project['project_name'].lower()[:50]
+            name_key = project_key(project['project_name'])
             if name_key not in seen_names:
                 seen_names.add(name_key)
                 unique_projects.append(project)
@@ -334,34 +501,40 @@ class DeveloperProjectsScraper:
         logger.info(f"Total unique developer projects found: {len(unique_projects)}")
         return unique_projects
     
+    async def _ensure_indexes(self):
+        """Index the (developer, project) key the upserts match on, once per process"""
+        if DeveloperProjectsScraper._indexes_ready:
+            return
+        await self.db.developer_projects.create_index([('developer_name', 1), ('project_name', 1)])
+        DeveloperProjectsScraper._indexes_ready = True
+    
     async def save_projects(self, projects: List[Dict]) -> int:
-        """Save projects to database"""
-        added = 0
+        """Save projects to database in one unordered bulk write: new projects are
+        inserted, existing ones get their status and timeline updated.
+        Returns the number of new projects."""
+        if not projects:
+            return 0
+        
+        await self._ensure_indexes()
         
+        now = datetime.utcnow()
+        operations = []
         for project in projects:
-            # Check if project already exists
-            existing = await self.db.developer_projects.find_one({
-                'project_name': project['project_name'],
-                'developer_name': project['developer_name']
-            })
-            
-            if not existing:
-                project['created_at'] = datetime.utcnow()
-                project['updated_at'] = datetime.utcnow()
-                await self.db.developer_projects.insert_one(project)
-                added += 1
-            else:
-                # Update existing project
-                await self.db.developer_projects.update_one(
-                    {'_id': existing['_id']},
-                    {'$set': {
-                        'status': project['status'],
-                        'timeline_phases': project['timeline_phases'],
-                        'updated_at': datetime.utcnow()
-                    }}
-                )
+            updates = {
+                'status': project['status'],
+                'timeline_phases': project['timeline_phases'],
+                'updated_at': now,
+            }
+            new_fields = {key: value for key, value in project.items() if key not in updates}
+            new_fields['created_at'] = now
+            operations.append(UpdateOne(
+                {'developer_name': project['developer_name'], 'project_name': project['project_name']},
+                {'$set': updates, '$setOnInsert': new_fields},
+                upsert=True
+            ))
         
-        return added
+        result = await self.db.developer_projects.bulk_write(operations, ordered=False)
+        return result.upserted_count
     
     async def run(self) -> int:
         """Run the full scraping process"""
@@ -374,238 +547,236 @@ class DeveloperProjectsScraper:
         return added
 
 
-# Sample/seed data for immediate display
+# Sample/seed data for immediate display, built once at import
+SAMPLE_DEVELOPER_PROJECTS = (
+    # NRW Projects
+    {
+        "developer_name": "CESA Group",
+        "project_name": "Quartier Belsenpark Düsseldorf",
+        "description": "Entwicklung eines neuen Stadtquartiers mit 500 Wohnungen und Gewerbeflächen im Düsseldorfer Hafen. Nachhaltige Bauweise mit Fokus auf erneuerbare Energien.",
+        "location": "Düsseldorf, NRW",
+        "region": "NRW",
+        "budget": "€180 Mio.",
+        "project_type": "Mixed-Use",
+        "status": "ongoing",
+        "start_date": "2024-03-01",
+        "expected_completion": "2027-06-30",
+        "timeline_phases": [
+            {"phase": "Planung", "status": "completed", "progress": 100},
+            {"phase": "Genehmigung", "status": "completed", "progress": 100},
+            {"phase": "Baustart", "status": "completed", "progress": 100},
+            {"phase": "Rohbau", "status": "ongoing", "progress": 45},
+            {"phase": "Fertigstellung", "status": "pending", "progress": 0},
+        ],
+        "source_url": "https://www.cesa-group.de/projekte",
+    },
+    {
+        "developer_name": "Vonovia",
+        "project_name": "Wohnquartier Köln-Mülheim",
+        "description": "Neubau von 320 energieeffizienten Mietwohnungen mit KfW-40 Standard. Grüne Innenhöfe und moderne Mobilitätskonzepte.",
+        "location": "Köln, NRW",
+        "region": "NRW",
+        "budget": "€95 Mio.",
+        "project_type": "Residential",
+        "status": "planning",
+        "start_date": "2025-01-15",
+        "expected_completion": "2028-03-31",
+        "timeline_phases": [
+            {"phase": "Planung", "status": "ongoing", "progress": 75},
+            {"phase": "Genehmigung", "status": "pending", "progress": 20},
+            {"phase": "Baustart", "status": "pending", "progress": 0},
+            {"phase": "Fertigstellung", "status": "pending", "progress": 0},
+        ],
+        "source_url": "https://www.vonovia.de/projekte",
+    },
+    {
+        "developer_name": "Instone Real Estate",
+        "project_name": "Rheinpark Residence Duisburg",
+        "description": "Exklusives Wohnprojekt direkt am Rhein mit 180 Eigentumswohnungen und Penthäusern. Premium-Ausstattung und Rheinblick.",
+        "location": "Duisburg, NRW",
+        "region": "NRW",
+        "budget": "€120 Mio.",
+        "project_type": "Residential",
+        "status": "ongoing",
+        "start_date": "2024-06-01",
+        "expected_completion": "2026-12-31",
+        "timeline_phases": [
+            {"phase": "Planung", "status": "completed", "progress": 100},
+            {"phase": "Genehmigung", "status": "completed", "progress": 100},
+            {"phase": "Baustart", "status": "completed", "progress": 100},
+            {"phase": "Rohbau", "status": "ongoing", "progress": 60},
+            {"phase": "Innenausbau", "status": "pending", "progress": 10},
+        ],
+        "source_url": "https://www.instone.de/projekte",
+    },
+    {
+        "developer_name": "Ten Brinke",
+        "project_name": "Business Park Essen-Rüttenscheid",
+        "description": "Moderner Bürokomplex mit 25.000 m² Gewerbefläche. DGNB Gold Zertifizierung angestrebt. Flexible Grundrisse für verschiedene Nutzer.",
+        "location": "Essen, NRW",
+        "region": "NRW",
+        "budget": "€85 Mio.",
+        "project_type": "Commercial",
+        "status": "planning",
+        "start_date": "2025-04-01",
+        "expected_completion": "2027-09-30",
+        "timeline_phases": [
+            {"phase": "Planung", "status": "ongoing", "progress": 60},
+            {"phase": "Genehmigung", "status": "pending", "progress": 0},
+            {"phase": "Baustart", "status": "pending", "progress": 0},
+            {"phase": "Fertigstellung", "status": "pending", "progress": 0},
+        ],
+        "source_url": "https://www.tenbrinke.com/projekte",
+    },
+    {
+        "developer_name": "LEG Immobilien",
+        "project_name": "Wohnanlage Dortmund-Phoenix",
+        "description": "Revitalisierung des Phoenix-See Areals mit 240 modernen Mietwohnungen. Barrierefreie Zugänge und Smart-Home Technologie.",
+        "location": "Dortmund, NRW",
+        "region": "NRW",
+        "budget": "€72 Mio.",
+        "project_type": "Residential",
+        "status": "ongoing",
+        "start_date": "2024-02-01",
+        "expected_completion": "2026-08-31",
+        "timeline_phases": [
+            {"phase": "Planung", "status": "completed", "progress": 100},
+            {"phase": "Genehmigung", "status": "completed", "progress": 100},
+            {"phase": "Baustart", "status": "completed", "progress": 100},
+            {"phase": "Rohbau", "status": "completed", "progress": 100},
+            {"phase": "Innenausbau", "status": "ongoing", "progress": 35},
+        ],
+        "source_url": "https://www.leg-wohnen.de/projekte",
+    },
+    
+    # Brandenburg Projects
+    {
+        "developer_name": "HOWOGE",
+        "project_name": "Wohnquartier Potsdam-Babelsberg",
+        "description": "Entwicklung eines nachhaltigen Wohnquartiers mit 400 Wohnungen und sozialer Infrastruktur. Nahe dem Filmpark Babelsberg.",
+        "location": "Potsdam, Brandenburg",
+        "region": "Brandenburg",
+        "budget": "€145 Mio.",
+        "project_type": "Residential",
+        "status": "ongoing",
+        "start_date": "2024-01-15",
+        "expected_completion": "2027-04-30",
+        "timeline_phases": [
+            {"phase": "Planung", "status": "completed", "progress": 100},
+            {"phase": "Genehmigung", "status": "completed", "progress": 100},
+            {"phase": "Baustart", "status": "completed", "progress": 100},
+            {"phase": "Rohbau", "status": "ongoing", "progress": 30},
+            {"phase": "Fertigstellung", "status": "pending", "progress": 0},
+        ],
+        "source_url": "https://www.howoge.de/projekte",
+    },
+    {
+        "developer_name": "Degewo",
+        "project_name": "Stadtquartier Cottbus-Süd",
+        "description": "Neues Stadtquartier mit 280 Wohnungen, Kindergarten und Nahversorgung. Energieeffiziente Bauweise nach KfW-55 Standard.",
+        "location": "Cottbus, Brandenburg",
+        "region": "Brandenburg",
+        "budget": "€88 Mio.",
+        "project_type": "Mixed-Use",
+        "status": "planning",
+        "start_date": "2025-06-01",
+        "expected_completion": "2028-12-31",
+        "timeline_phases": [
+            {"phase": "Planung", "status": "ongoing", "progress": 80},
+            {"phase": "Genehmigung", "status": "pending", "progress": 15},
+            {"phase": "Baustart", "status": "pending", "progress": 0},
+            {"phase": "Fertigstellung", "status": "pending", "progress": 0},
+        ],
+        "source_url": "https://www.degewo.de/projekte",
+    },
+    {
+        "developer_name": "BUWOG",
+        "project_name": "Wohnen am Griebnitzsee",
+        "description": "Premium-Wohnanlage mit 120 Eigentumswohnungen und direktem Seezugang. Hochwertige Ausstattung und großzügige Balkone.",
+        "location": "Potsdam-Babelsberg, Brandenburg",
+        "region": "Brandenburg",
+        "budget": "€65 Mio.",
+        "project_type": "Residential",
+        "status": "ongoing",
+        "start_date": "2024-04-01",
+        "expected_completion": "2026-10-31",
+        "timeline_phases": [
+            {"phase": "Planung", "status": "completed", "progress": 100},
+            {"phase": "Genehmigung", "status": "completed", "progress": 100},
+            {"phase": "Baustart", "status": "completed", "progress": 100},
+            {"phase": "Rohbau", "status": "ongoing", "progress": 70},
+            {"phase": "Innenausbau", "status": "pending", "progress": 5},
+        ],
+        "source_url": "https://www.buwog.de/projekte",
+    },
+    {
+        "developer_name": "Gewobag",
+        "project_name": "Wohnpark Falkensee",
+        "description": "Familienfreundliche Wohnanlage mit 200 Mietwohnungen am Stadtrand. Großzügige Grünflächen und Spielplätze.",
+        "location": "Falkensee, Brandenburg",
+        "region": "Brandenburg",
+        "budget": "€55 Mio.",
+        "project_type": "Residential",
+        "status": "planning",
+        "start_date": "2025-03-01",
+        "expected_completion": "2027-08-31",
+        "timeline_phases": [
+            {"phase": "Planung", "status": "ongoing", "progress": 65},
+            {"phase": "Genehmigung", "status": "pending", "progress": 0},
+            {"phase": "Baustart", "status": "pending", "progress": 0},
+            {"phase": "Fertigstellung", "status": "pending", "progress": 0},
+        ],
+        "source_url": "https://www.gewobag.de/projekte",
+    },
+    {
+        "developer_name": "STADT UND LAND",
+        "project_name": "Quartier Bernau-Friedenstal",
+        "description": "Neuentwicklung eines Wohnquartiers mit 350 Wohnungen und Gewerbeeinheiten. S-Bahn Anbindung nach Berlin.",
+        "location": "Bernau, Brandenburg",
+        "region": "Brandenburg",
+        "budget": "€110 Mio.",
+        "project_type": "Mixed-Use",
+        "status": "ongoing",
+        "start_date": "2024-05-15",
+        "expected_completion": "2027-11-30",
+        "timeline_phases": [
+            {"phase": "Planung", "status": "completed", "progress": 100},
+            {"phase": "Genehmigung", "status": "completed", "progress": 100},
+            {"phase": "Baustart", "status": "completed", "progress": 100},
+            {"phase": "Rohbau", "status": "ongoing", "progress": 25},
+            {"phase": "Fertigstellung", "status": "pending", "progress": 0},
+        ],
+        "source_url": "https://www.stadtundland.de/projekte",
+    },
+    {
+        "developer_name": "WBM",
+        "project_name": "Wohnanlage Oranienburg-Nord",
+        "description": "Bezahlbarer Wohnraum mit 160 Wohnungen für Familien und Senioren. Energetisch optimierte Bauweise.",
+        "location": "Oranienburg, Brandenburg",
+        "region": "Brandenburg",
+        "budget": "€42 Mio.",
+        "project_type": "Residential",
+        "status": "planning",
+        "start_date": "2025-09-01",
+        "expected_completion": "2028-02-28",
+        "timeline_phases": [
+            {"phase": "Planung", "status": "ongoing", "progress": 40},
+            {"phase": "Genehmigung", "status": "pending", "progress": 0},
+            {"phase": "Baustart", "status": "pending", "progress": 0},
+            {"phase": "Fertigstellung", "status": "pending", "progress": 0},
+        ],
+        "source_url": "https://www.wbm.de/projekte",
+    },
+)
+
+
 def get_sample_developer_projects() -> List[Dict]:
     """Generate sample developer projects for NRW and Brandenburg regions"""
-    
-    sample_projects = [
-        # NRW Projects
-        {
-            "developer_name": "CESA Group",
-            "project_name": "Quartier Belsenpark Düsseldorf",
-            "description": "Entwicklung eines neuen Stadtquartiers mit 500 Wohnungen und Gewerbeflächen im Düsseldorfer Hafen. Nachhaltige Bauweise mit Fokus auf erneuerbare Energien.",
-            "location": "Düsseldorf, NRW",
-            "region": "NRW",
-            "budget": "€180 Mio.",
-            "project_type": "Mixed-Use",
-            "status": "ongoing",
-            "start_date": "2024-03-01",
-            "expected_completion": "2027-06-30",
-            "timeline_phases": [
-                {"phase": "Planung", "status": "completed", "progress": 100},
-                {"phase": "Genehmigung", "status": "completed", "progress": 100},
-                {"phase": "Baustart", "status": "completed", "progress": 100},
-                {"phase": "Rohbau", "status": "ongoing", "progress": 45},
-                {"phase": "Fertigstellung", "status": "pending", "progress": 0},
-            ],
-            "source_url": "https://www.cesa-group.de/projekte",
-        },
-        {
-            "developer_name": "Vonovia",
-            "project_name": "Wohnquartier Köln-Mülheim",
-            "description": "Neubau von 320 energieeffizienten Mietwohnungen mit KfW-40 Standard. Grüne Innenhöfe und moderne Mobilitätskonzepte.",
-            "location": "Köln, NRW",
-            "region": "NRW",
-            "budget": "€95 Mio.",
-            "project_type": "Residential",
-            "status": "planning",
-            "start_date": "2025-01-15",
-            "expected_completion": "2028-03-31",
-            "timeline_phases": [
-                {"phase": "Planung", "status": "ongoing", "progress": 75},
-                {"phase": "Genehmigung", "status": "pending", "progress": 20},
-                {"phase": "Baustart", "status": "pending", "progress": 0},
-                {"phase": "Fertigstellung", "status": "pending", "progress": 0},
-            ],
-            "source_url": "https://www.vonovia.de/projekte",
-        },
-        {
-            "developer_name": "Instone Real Estate",
-            "project_name": "Rheinpark Residence Duisburg",
-            "description": "Exklusives Wohnprojekt direkt am Rhein mit 180 Eigentumswohnungen und Penthäusern. Premium-Ausstattung und Rheinblick.",
-            "location": "Duisburg, NRW",
-            "region": "NRW",
-            "budget": "€120 Mio.",
-            "project_type": "Residential",
-            "status": "ongoing",
-            "start_date": "2024-06-01",
-            "expected_completion": "2026-12-31",
-            "timeline_phases": [
-                {"phase": "Planung", "status": "completed", "progress": 100},
-                {"phase": "Genehmigung", "status": "completed", "progress": 100},
-                {"phase": "Baustart", "status": "completed", "progress": 100},
-                {"phase": "Rohbau", "status": "ongoing", "progress": 60},
-                {"phase": "Innenausbau", "status": "pending", "progress": 10},
-            ],
-            "source_url": "https://www.instone.de/projekte",
-        },
-        {
-            "developer_name": "Ten Brinke",
-            "project_name": "Business Park Essen-Rüttenscheid",
-            "description": "Moderner Bürokomplex mit 25.000 m² Gewerbefläche. DGNB Gold Zertifizierung angestrebt. Flexible Grundrisse für verschiedene Nutzer.",
-            "location": "Essen, NRW",
-            "region": "NRW",
-            "budget": "€85 Mio.",
-            "project_type": "Commercial",
-            "status": "planning",
-            "start_date": "2025-04-01",
-            "expected_completion": "2027-09-30",
-            "timeline_phases": [
-                {"phase": "Planung", "status": "ongoing", "progress": 60},
-                {"phase": "Genehmigung", "status": "pending", "progress": 0},
-                {"phase": "Baustart", "status": "pending", "progress": 0},
-                {"phase": "Fertigstellung", "status": "pending", "progress": 0},
-            ],
-            "source_url": "https://www.tenbrinke.com/projekte",
-        },
-        {
-            "developer_name": "LEG Immobilien",
-            "project_name": "Wohnanlage Dortmund-Phoenix",
-            "description": "Revitalisierung des Phoenix-See Areals mit 240 modernen Mietwohnungen. Barrierefreie Zugänge und Smart-Home Technologie.",
-            "location": "Dortmund, NRW",
-            "region": "NRW",
-            "budget": "€72 Mio.",
-            "project_type": "Residential",
-            "status": "ongoing",
-            "start_date": "2024-02-01",
-            "expected_completion": "2026-08-31",
-            "timeline_phases": [
-                {"phase": "Planung", "status": "completed", "progress": 100},
-                {"phase": "Genehmigung", "status": "completed", "progress": 100},
-                {"phase": "Baustart", "status": "completed", "progress": 100},
-                {"phase": "Rohbau", "status": "completed", "progress": 100},
-                {"phase": "Innenausbau", "status": "ongoing", "progress": 35},
-            ],
-            "source_url": "https://www.leg-wohnen.de/projekte",
-        },
-        
-        # Brandenburg Projects
-        {
-            "developer_name": "HOWOGE",
-            "project_name": "Wohnquartier Potsdam-Babelsberg",
-            "description": "Entwicklung eines nachhaltigen Wohnquartiers mit 400 Wohnungen und sozialer Infrastruktur. Nahe dem Filmpark Babelsberg.",
-            "location": "Potsdam, Brandenburg",
-            "region": "Brandenburg",
-            "budget": "€145 Mio.",
-            "project_type": "Residential",
-            "status": "ongoing",
-            "start_date": "2024-01-15",
-            "expected_completion": "2027-04-30",
-            "timeline_phases": [
-                {"phase": "Planung", "status": "completed", "progress": 100},
-                {"phase": "Genehmigung", "status": "completed", "progress": 100},
-                {"phase": "Baustart", "status": "completed", "progress": 100},
-                {"phase": "Rohbau", "status": "ongoing", "progress": 30},
-                {"phase": "Fertigstellung", "status": "pending", "progress": 0},
-            ],
-            "source_url": "https://www.howoge.de/projekte",
-        },
-        {
-            "developer_name": "Degewo",
-            "project_name": "Stadtquartier Cottbus-Süd",
-            "description": "Neues Stadtquartier mit 280 Wohnungen, Kindergarten und Nahversorgung. Energieeffiziente Bauweise nach KfW-55 Standard.",
-            "location": "Cottbus, Brandenburg",
-            "region": "Brandenburg",
-            "budget": "€88 Mio.",
-            "project_type": "Mixed-Use",
-            "status": "planning",
-            "start_date": "2025-06-01",
-            "expected_completion": "2028-12-31",
-            "timeline_phases": [
-                {"phase": "Planung", "status": "ongoing", "progress": 80},
-                {"phase": "Genehmigung", "status": "pending", "progress": 15},
-                {"phase": "Baustart", "status": "pending", "progress": 0},
-                {"phase": "Fertigstellung", "status": "pending", "progress": 0},
-            ],
-            "source_url": "https://www.degewo.de/projekte",
-        },
-        {
-            "developer_name": "BUWOG",
-            "project_name": "Wohnen am Griebnitzsee",
-            "description": "Premium-Wohnanlage mit 120 Eigentumswohnungen und direktem Seezugang. Hochwertige Ausstattung und großzügige Balkone.",
-            "location": "Potsdam-Babelsberg, Brandenburg",
-            "region": "Brandenburg",
-            "budget": "€65 Mio.",
-            "project_type": "Residential",
-            "status": "ongoing",
-            "start_date": "2024-04-01",
-            "expected_completion": "2026-10-31",
-            "timeline_phases": [
-                {"phase": "Planung", "status": "completed", "progress": 100},
-                {"phase": "Genehmigung", "status": "completed", "progress": 100},
-                {"phase": "Baustart", "status": "completed", "progress": 100},
-                {"phase": "Rohbau", "status": "ongoing", "progress": 70},
-                {"phase": "Innenausbau", "status": "pending", "progress": 5},
-            ],
-            "source_url": "https://www.buwog.de/projekte",
-        },
-        {
-            "developer_name": "Gewobag",
-            "project_name": "Wohnpark Falkensee",
-            "description": "Familienfreundliche Wohnanlage mit 200 Mietwohnungen am Stadtrand. Großzügige Grünflächen und Spielplätze.",
-            "location": "Falkensee, Brandenburg",
-            "region": "Brandenburg",
-            "budget": "€55 Mio.",
-            "project_type": "Residential",
-            "status": "planning",
-            "start_date": "2025-03-01",
-            "expected_completion": "2027-08-31",
-            "timeline_phases": [
-                {"phase": "Planung", "status": "ongoing", "progress": 65},
-                {"phase": "Genehmigung", "status": "pending", "progress": 0},
-                {"phase": "Baustart", "status": "pending", "progress": 0},
-                {"phase": "Fertigstellung", "status": "pending", "progress": 0},
-            ],
-            "source_url": "https://www.gewobag.de/projekte",
-        },
-        {
-            "developer_name": "STADT UND LAND",
-            "project_name": "Quartier Bernau-Friedenstal",
-            "description": "Neuentwicklung eines Wohnquartiers mit 350 Wohnungen und Gewerbeeinheiten. S-Bahn Anbindung nach Berlin.",
-            "location": "Bernau, Brandenburg",
-            "region": "Brandenburg",
-            "budget": "€110 Mio.",
-            "project_type": "Mixed-Use",
-            "status": "ongoing",
-            "start_date": "2024-05-15",
-            "expected_completion": "2027-11-30",
-            "timeline_phases": [
-                {"phase": "Planung", "status": "completed", "progress": 100},
-                {"phase": "Genehmigung", "status": "completed", "progress": 100},
-                {"phase": "Baustart", "status": "completed", "progress": 100},
-                {"phase": "Rohbau", "status": "ongoing", "progress": 25},
-                {"phase": "Fertigstellung", "status": "pending", "progress": 0},
-            ],
-            "source_url": "https://www.stadtundland.de/projekte",
-        },
-        {
-            "developer_name": "WBM",
-            "project_name": "Wohnanlage Oranienburg-Nord",
-            "description": "Bezahlbarer Wohnraum mit 160 Wohnungen für Familien und Senioren. Energetisch optimierte Bauweise.",
-            "location": "Oranienburg, Brandenburg",
-            "region": "Brandenburg",
-            "budget": "€42 Mio.",
-            "project_type": "Residential",
-            "status": "planning",
-            "start_date": "2025-09-01",
-            "expected_completion": "2028-02-28",
-            "timeline_phases": [
-                {"phase": "Planung", "status": "ongoing", "progress": 40},
-                {"phase": "Genehmigung", "status": "pending", "progress": 0},
-                {"phase": "Baustart", "status": "pending", "progress": 0},
-                {"phase": "Fertigstellung", "status": "pending", "progress": 0},
-            ],
-            "source_url": "https://www.wbm.de/projekte",
-        },
+    now = datetime.utcnow()
+    return [
+        {**project, 'created_at': now, 'updated_at': now, 'scraped_at': now}
+        for project in SAMPLE_DEVELOPER_PROJECTS
     ]
-    
-    # Add timestamps
-    for project in sample_projects:
-        project['created_at'] = datetime.utcnow()
-        project['updated_at'] = datetime.utcnow()
-        project['scraped_at'] = datetime.utcnow()
-    
-    return sample_projects
 
 
 async def seed_developer_projects(db) -> int:
@@ -616,7 +787,7 @@ async def seed_developer_projects(db) -> int:
     # Insert sample projects
     projects = get_sample_developer_projects()
     if projects:
-        await db.developer_projects.insert_many(projects)
+        await db.developer_projects.insert_many(projects, ordered=False)
     
     logger.info(f"Seeded {len(projects)} developer projects")
     return len(projects)
@@ -0,0 +1,25 @@
+"""
+HTML helpers shared by the scrapers
+Selector wrappers around selectolax's Lexbor backend
+"""
+
+
+def select_all(node, selector: str) -> list:
+    """Elements matching selector in document order, each listed once. Lexbor lists
+    an element once per selector of a group that it matches."""
+    seen = set()
+    matches = []
+    for match in node.css(selector):
+        if match.mem_id not in seen:
+            seen.add(match.mem_id)
+            matches.append(match)
+    return matches
+
+
+def select_descendant(node, selector: str):
+    """First descendant matching selector, or None. Unlike css_first, never
+    returns node itself, which css results list first when it matches."""
+    match = node.css_first(selector)
+    if match is not None and match == node:
+        return next((match for match in node.css(selector) if match != node), None)
+    return match
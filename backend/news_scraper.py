@@ -14,6 +14,9 @@ import hashlib
 
 logger = logging.getLogger(__name__)
 
+# Tree builder for every page; html.parser is several times slower
+HTML_PARSER = 'lxml'
+
 class NewsScraperBase:
     """Base scraper class for news portals"""
     
@@ -170,6 +173,7 @@ class BauNetzScraper(NewsScraperBase):
     async def scrape(self, max_results: int = 20) -> List[Dict]:
         """Scrape news from BauNetz"""
         news = []
+        scraped_at = datetime.utcnow()
         
         try:
             urls = [
@@ -185,12 +189,12 @@ class BauNetzScraper(NewsScraperBase):
                     ) as response:
                         if response.status == 200:
                             html = await response.text()
-                            soup = BeautifulSoup(html, 'lxml')
+                            soup = BeautifulSoup(html, HTML_PARSER)
                             
                             articles = soup.select('article, .news-item, .meldung, .teaser')
                             
                             for article in articles[:max_results]:
-                                item = self._parse_article(article)
+                                item = self._parse_article(article, scraped_at)
                                 if item:
                                     news.append(item)
                 except Exception as e:
@@ -201,7 +205,7 @@ class BauNetzScraper(NewsScraperBase):
         
         return news[:max_results]
     
-    def _parse_article(self, article) -> Optional[Dict]:
+    def _parse_article(self, article, scraped_at: datetime) -> Optional[Dict]:
         """Parse a single news article"""
         title_elem = article.select_one('h2, h3, h4, .title, a')
         if not title_elem:
@@ -242,7 +246,7 @@ class BauNetzScraper(NewsScraperBase):
             "published_at": published_at,
             "category": category,
             "relevance_score": relevance,
-            "scraped_at": datetime.utcnow(),
+            "scraped_at": scraped_at,
             "source_id": self.generate_news_id(title, "baunetz"),
         }
 
@@ -255,6 +259,7 @@ class ImmobilienZeitungScraper(NewsScraperBase):
     async def scrape(self, max_results: int = 20) -> List[Dict]:
         """Scrape news from Immobilien Zeitung"""
         news = []
+        scraped_at = datetime.utcnow()
         
         try:
             urls = [
@@ -270,12 +275,12 @@ class ImmobilienZeitungScraper(NewsScraperBase):
                     ) as response:
                         if response.status == 200:
                             html = await response.text()
-                            soup = BeautifulSoup(html, 'lxml')
+                            soup = BeautifulSoup(html, HTML_PARSER)
                             
                             articles = soup.select('article, .teaser, .news-item, .list-item')
                             
                             for article in articles[:max_results]:
-                                item = self._parse_article(article)
+                                item = self._parse_article(article, scraped_at)
                                 if item:
                                     news.append(item)
                 except Exception as e:
@@ -286,7 +291,7 @@ class ImmobilienZeitungScraper(NewsScraperBase):
         
         return news[:max_results]
     
-    def _parse_article(self, article) -> Optional[Dict]:
+    def _parse_article(self, article, scraped_at: datetime) -> Optional[Dict]:
         """Parse a single news article"""
         title_elem = article.select_one('h2, h3, h4, .title, a')
         if not title_elem:
@@ -324,7 +329,7 @@ class ImmobilienZeitungScraper(NewsScraperBase):
             "published_at": published_at,
             "category": category,
             "relevance_score": relevance,
-            "scraped_at": datetime.utcnow(),
+            "scraped_at": scraped_at,
             "source_id": self.generate_news_id(title, "iz"),
         }
 
@@ -337,6 +342,7 @@ class DBZScraper(NewsScraperBase):
     async def scrape(self, max_results: int = 20) -> List[Dict]:
         """Scrape news from DBZ"""
         news = []
+        scraped_at = datetime.utcnow()
         
         try:
             async with self.session.get(
@@ -345,12 +351,12 @@ class DBZScraper(NewsScraperBase):
             ) as response:
                 if response.status == 200:
                     html = await response.text()
-                    soup = BeautifulSoup(html, 'lxml')
+                    soup = BeautifulSoup(html, HTML_PARSER)
                     
                     articles = soup.select('article, .news-item, .teaser')
                     
                     for article in articles[:max_results]:
-                        item = self._parse_article(article)
+                        item = self._parse_article(article, scraped_at)
                         if item:
                             news.append(item)
                             
@@ -359,7 +365,7 @@ class DBZScraper(NewsScraperBase):
         
         return news
     
-    def _parse_article(self, article) -> Optional[Dict]:
+    def _parse_article(self, article, scraped_at: datetime) -> Optional[Dict]:
         """Parse article from DBZ"""
         title_elem = article.select_one('h2, h3, h4, .title, a')
         if not title_elem:
@@ -391,10 +397,10 @@ class DBZScraper(NewsScraperBase):
             "summary": summary or f"Bauzeitschrift: {title}",
             "source": "Deutsche BauZeitschrift",
             "url": link or self.BASE_URL,
-            "published_at": datetime.utcnow(),
+            "published_at": scraped_at,
             "category": category,
             "relevance_score": relevance,
-            "scraped_at": datetime.utcnow(),
+            "scraped_at": scraped_at,
             "source_id": self.generate_news_id(title, "dbz"),
         }
 
@@ -407,6 +413,7 @@ class HandelsblattScraper(NewsScraperBase):
     async def scrape(self, max_results: int = 15) -> List[Dict]:
         """Scrape construction/real estate news from Handelsblatt"""
         news = []
+        scraped_at = datetime.utcnow()
         
         try:
             urls = [
@@ -422,12 +429,12 @@ class HandelsblattScraper(NewsScraperBase):
                     ) as response:
                         if response.status == 200:
                             html = await response.text()
-                            soup = BeautifulSoup(html, 'lxml')
+                            soup = BeautifulSoup(html, HTML_PARSER)
                             
                             articles = soup.select('article, .vhb-teaser, .teaser')
                             
                             for article in articles[:max_results]:
-                                item = self._parse_article(article)
+                                item = self._parse_article(article, scraped_at)
                                 if item:
                                     news.append(item)
                 except Exception as e:
@@ -438,7 +445,7 @@ class HandelsblattScraper(NewsScraperBase):
         
         return news[:max_results]
     
-    def _parse_article(self, article) -> Optional[Dict]:
+    def _parse_article(self, article, scraped_at: datetime) -> Optional[Dict]:
         """Parse article from Handelsblatt"""
         title_elem = article.select_one('h2, h3, h4, .vhb-teaser__headline, a')
         if not title_elem:
@@ -470,10 +477,10 @@ class HandelsblattScraper(NewsScraperBase):
             "summary": summary or f"Wirtschaftsnachrichten: {title}",
             "source": "Handelsblatt",
             "url": link or self.BASE_URL,
-            "published_at": datetime.utcnow(),
+            "published_at": scraped_at,
             "category": category,
             "relevance_score": relevance,
-            "scraped_at": datetime.utcnow(),
+            "scraped_at": scraped_at,
             "source_id": self.generate_news_id(title, "handelsblatt"),
         }
 
@@ -486,6 +493,7 @@ class BaublattScraper(NewsScraperBase):
     async def scrape(self, max_results: int = 15) -> List[Dict]:
         """Scrape news from Baublatt"""
         news = []
+        scraped_at = datetime.utcnow()
         
         try:
             async with self.session.get(
@@ -494,12 +502,12 @@ class BaublattScraper(NewsScraperBase):
             ) as response:
                 if response.status == 200:
                     html = await response.text()
-                    soup = BeautifulSoup(html, 'lxml')
+                    soup = BeautifulSoup(html, HTML_PARSER)
                     
                     articles = soup.select('article, .news-item, .teaser, .post')
                     
                     for article in articles[:max_results]:
-                        item = self._parse_article(article)
+                        item = self._parse_article(article, scraped_at)
                         if item:
                             news.append(item)
                             
@@ -508,7 +516,7 @@ class BaublattScraper(NewsScraperBase):
         
         return news
     
-    def _parse_article(self, article) -> Optional[Dict]:
+    def _parse_article(self, article, scraped_at: datetime) -> Optional[Dict]:
         """Parse article from Baublatt"""
         title_elem = article.select_one('h2, h3, h4, .title, a')
         if not title_elem:
@@ -540,10 +548,10 @@ class BaublattScraper(NewsScraperBase):
             "summary": summary or f"Baunachrichten: {title}",
             "source": "Baublatt",
             "url": link or self.BASE_URL,
-            "published_at": datetime.utcnow(),
+            "published_at": scraped_at,
             "category": category,
             "relevance_score": relevance,
-            "scraped_at": datetime.utcnow(),
+            "scraped_at": scraped_at,
             "source_id": self.generate_news_id(title, "baublatt"),
         }
 
@@ -556,6 +564,7 @@ class PropertyMagazineScraper(NewsScraperBase):
     async def scrape(self, max_results: int = 15) -> List[Dict]:
         """Scrape news from Property Magazine"""
         news = []
+        scraped_at = datetime.utcnow()
         
         try:
             async with self.session.get(
@@ -564,12 +573,12 @@ class PropertyMagazineScraper(NewsScraperBase):
             ) as response:
                 if response.status == 200:
                     html = await response.text()
-                    soup = BeautifulSoup(html, 'lxml')
+                    soup = BeautifulSoup(html, HTML_PARSER)
                     
                     articles = soup.select('article, .news-item, .teaser')
                     
                     for article in articles[:max_results]:
-                        item = self._parse_article(article)
+                        item = self._parse_article(article, scraped_at)
                         if item:
                             news.append(item)
                             
@@ -578,7 +587,7 @@ class PropertyMagazineScraper(NewsScraperBase):
         
         return news
     
-    def _parse_article(self, article) -> Optional[Dict]:
+    def _parse_article(self, article, scraped_at: datetime) -> Optional[Dict]:
         """Parse article"""
         title_elem = article.select_one('h2, h3, h4, .title, a')
         if not title_elem:
@@ -610,10 +619,10 @@ class PropertyMagazineScraper(NewsScraperBase):
             "summary": summary or f"Immobilien News: {title}",
             "source": "Property Magazine",
             "url": link or self.BASE_URL,
-            "published_at": datetime.utcnow(),
+            "published_at": scraped_at,
             "category": category,
             "relevance_score": relevance,
-            "scraped_at": datetime.utcnow(),
+            "scraped_at": scraped_at,
             "source_id": self.generate_news_id(title, "propertymag"),
         }
 
@@ -626,6 +635,7 @@ class EntwicklungsstadtScraper(NewsScraperBase):
     async def scrape(self, max_results: int = 20) -> List[Dict]:
         """Scrape news from Entwicklungsstadt.de"""
         news = []
+        scraped_at = datetime.utcnow()
         seen_urls = set()
         
         # Scrape main page and city-specific sections
@@ -645,7 +655,7 @@ class EntwicklungsstadtScraper(NewsScraperBase):
                 ) as response:
                     if response.status == 200:
                         html = await response.text()
-                        soup = BeautifulSoup(html, 'lxml')
+                        soup = BeautifulSoup(html, HTML_PARSER)
                         
                         # Find all article links
                         all_links = soup.find_all('a', href=True)
@@ -668,7 +678,7 @@ class EntwicklungsstadtScraper(NewsScraperBase):
                                 continue
                             seen_urls.add(href)
                             
-                            item = self._parse_link(link, href)
+                            item = self._parse_link(link, href, scraped_at)
                             if item:
                                 news.append(item)
                             
@@ -683,7 +693,7 @@ class EntwicklungsstadtScraper(NewsScraperBase):
         
         return news[:max_results]
     
-    def _parse_link(self, link_elem, url: str) -> Optional[Dict]:
+    def _parse_link(self, link_elem, url: str, scraped_at: datetime) -> Optional[Dict]:
         """Parse article from link element"""
         title = self.clean_text(link_elem.get_text())
         if not title or len(title) < 20:
@@ -730,10 +740,10 @@ class EntwicklungsstadtScraper(NewsScraperBase):
             "summary": f"Stadtentwicklung und Bauprojekte: {title}",
             "source": "Entwicklungsstadt",
             "url": url,
-            "published_at": datetime.utcnow(),
+            "published_at": scraped_at,
             "category": category,
             "relevance_score": relevance,
-            "scraped_at": datetime.utcnow(),
+            "scraped_at": scraped_at,
             "source_id": self.generate_news_id(title, "entwicklungsstadt"),
         }
 
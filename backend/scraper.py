@@ -5,44 +5,245 @@ Scrapes public tender data from official German government portals
 
 import aiohttp
 import asyncio
-from bs4 import BeautifulSoup
+from dataclasses import dataclass
+import functools
+from selectolax.lexbor import LexborHTMLParser
+from html_utils import select_all, select_descendant
 from datetime import datetime, timedelta
 import logging
+import orjson
 import re
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
+from urllib.parse import quote_plus, urljoin, urlparse
 import hashlib
 
 logger = logging.getLogger(__name__)
 
+# Construction/project management terms; tenders without any are not relevant
+RELEVANCE_KEYWORDS = [
+    'bau', 'construction', 'neubau', 'umbau', 'sanierung', 'renovierung',
+    'architektur', 'architect', 'planung', 'planning', 'ingenieur', 'engineer',
+    'hochbau', 'tiefbau', 'gebäude', 'building', 'projekt', 'project',
+    'immobilie', 'real estate', 'facility', 'facilities', 'infrastruktur',
+    'wettbewerb', 'competition', 'controlling', 'management'
+]
+
+# Service categories, checked in order (the first match wins)
+CATEGORY_KEYWORDS = {
+    # Integrierte Projektabwicklung (German term for IPA)
+    "Integrierte Projektabwicklung": ['integrierte projektabwicklung', 'ipa verfahren', 'allianzvertrag', 'projektallianzen'],
+    "Integrated Project Management": ['integrated project management', 'integriertes projektmanagement', 'gesamtprojektmanagement'],
+    "PMO": ['pmo', 'project management office', 'projektmanagementbüro', 'projektbüro'],
+    "Wettbewerbsbegleitung": ['wettbewerbsbegleitung', 'wettbewerb', 'competition management', 'architekturwettbewerb', 'vergabewettbewerb'],
+    "Finanzcontrolling": ['finanzcontrolling', 'financial controlling', 'finanzsteuerung', 'budgetcontrolling', 'kostencontrolling'],
+    "Agiles Projektmanagement": ['agil', 'agile', 'scrum', 'kanban', 'agiles projektmanagement', 'agile project'],
+    "Projekt Coaching": ['projekt coaching', 'project coaching', 'projektcoaching', 'bauherrenberatung', 'projektberatung'],
+    "Nutzermanagement": ['nutzermanagement', 'user management', 'nutzerbetreuung', 'nutzerkoordination', 'stakeholder management'],
+    "Krisenmanagement": ['krisenmanagement', 'crisis management', 'konfliktmanagement', 'claim management', 'claimmanagement'],
+    "Vertragsmanagement": ['vertragsmanagement', 'contract management', 'vertragssteuerung', 'nachtragsmanagement', 'vertragscontrolling'],
+    "Risikomanagement": ['risikomanagement', 'risk management', 'risikoanalyse', 'risikobewertung', 'risikosteuerung'],
+    "Lean Management": ['lean', 'lean construction', 'lean management', 'prozessoptimierung'],
+    "Bauüberwachung": ['bauüberwachung', 'construction supervision', 'bauleitung', 'bauaufsicht', 'baubegleitung', 'objektüberwachung'],
+    "Kostenmanagement": ['kostenmanagement', 'cost management', 'kostensteuerung', 'kostenkontrolle', 'kalkulation'],
+    "Projektmanagement": ['projektmanagement', 'project management', 'projektsteuerung', 'projektleitung'],
+    "Beschaffungsmanagement": ['beschaffung', 'procurement', 'einkauf', 'vergabemanagement'],
+}
+
+# Building typologies, checked in order (the first match wins)
+TYPOLOGY_KEYWORDS = {
+    "Healthcare": ['krankenhaus', 'klinik', 'hospital', 'medizin', 'gesundheit', 'pflege', 'praxis', 'ambulanz'],
+    "Data Center": ['rechenzentrum', 'data center', 'datacenter', 'serverraum', 'it-infrastruktur'],
+    "Residential": ['wohn', 'residential', 'apartment', 'wohnung', 'mehrfamilienhaus', 'einfamilienhaus', 'siedlung'],
+    "Commercial": ['büro', 'office', 'gewerbe', 'commercial', 'geschäftshaus', 'verwaltung'],
+    "Mixed-Use": ['mixed', 'gemischt', 'quartier'],
+    "Industrial": ['industrie', 'industrial', 'fabrik', 'werk', 'produktion', 'lager', 'logistik'],
+    "Infrastructure": ['infrastruktur', 'brücke', 'tunnel', 'straße', 'autobahn', 'schiene', 'bahn', 'verkehr'],
+    "Education": ['schule', 'universität', 'bildung', 'education', 'hochschule', 'gymnasium', 'campus'],
+    "Sports": ['sport', 'stadion', 'arena', 'schwimmbad', 'turnhalle'],
+    "Hospitality": ['hotel', 'gastro', 'restaurant', 'hospitality'],
+}
+
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """One alternation matching any of the (lowercase) keywords as a substring"""
+    return re.compile('|'.join(re.escape(kw) for kw in keywords))
+
+
+RELEVANCE_PATTERN = _keyword_pattern(RELEVANCE_KEYWORDS)
+CATEGORY_PATTERNS = [(name, _keyword_pattern(keywords)) for name, keywords in CATEGORY_KEYWORDS.items()]
+TYPOLOGY_PATTERNS = [(name, _keyword_pattern(keywords)) for name, keywords in TYPOLOGY_KEYWORDS.items()]
+
+
+def _first_match(patterns: list, text: str) -> Optional[str]:
+    for name, pattern in patterns:
+        if pattern.search(text):
+            return name
+    return None
+
+
+# First number of a budget string, with German thousands/decimal separators
+BUDGET_NUMBER_RE = re.compile(r'[\d.,]+')
+
+# Numeric date formats, with the same field patterns strptime uses for %d, %m, %Y, %H and %M
+DMY_DATE_RE = re.compile(
+    r'(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])([./])(1[0-2]|0[1-9]|[1-9])\2(\d\d\d\d)'
+    r'(?: (2[0-3]|[0-1]\d|\d):([0-5]\d|\d))?'
+)
+ISO_DATE_RE = re.compile(r'(\d\d\d\d)-(1[0-2]|0[1-9]|[1-9])-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])')
+
+# Search URL templates, matched against the platform name in order (the first
+# match wins); lowercase needles match case-insensitively
+APPLICATION_URL_TEMPLATES = (
+    (('Bayern',), "https://www.auftraege.bayern.de/NetServer/PublicationSearchControllerServlet?searchText={q}"),
+    (('NRW',), "https://www.evergabe.nrw.de/VMPSatellite/public/search?q={q}"),
+    (('Berlin',), "https://www.berlin.de/vergabeplattform/veroeffentlichungen/bekanntmachungen/?q={q}"),
+    (('Hamburg',), "https://fbhh-evergabe.web.hamburg.de/evergabe.bieter/eva/supplierportal/fhh/subproject/search?searchText={q}"),
+    (('Sachsen-Anhalt',), "https://www.evergabe.sachsen-anhalt.de/NetServer/PublicationSearchControllerServlet?searchText={q}"),
+    (('Sachsen',), "https://www.sachsen-vergabe.de/vergabe/bekanntmachung/?search={q}"),
+    (('Baden-Württemberg', 'bw'), "https://vergabe.landbw.de/NetServer/PublicationSearchControllerServlet?searchText={q}"),
+    (('TED', 'Europa'), "https://ted.europa.eu/de/search/result?q={q}"),
+    (('Bund',), "https://www.service.bund.de/Content/DE/Ausschreibungen/Suche/Ergebnis.html?searchText={q}"),
+    # New platforms from PDF
+    (('Hessen', 'HAD'), "https://www.had.de/NetServer/PublicationSearchControllerServlet?searchText={q}"),
+    (('Niedersachsen',), "https://vergabe.niedersachsen.de/NetServer/PublicationSearchControllerServlet?searchText={q}"),
+    (('Bremen',), "https://www.vergabe.bremen.de/NetServer/PublicationSearchControllerServlet?searchText={q}"),
+    (('Brandenburg',), "https://vergabemarktplatz.brandenburg.de/VMPSatellite/public/search?q={q}"),
+    (('Rheinland-Pfalz', 'RLP'), "https://www.vergabe.rlp.de/VMPSatellite/public/search?q={q}"),
+    (('Saarland',), "https://vergabe.saarland/NetServer/PublicationSearchControllerServlet?searchText={q}"),
+    (('Schleswig-Holstein',), "https://www.e-vergabe-sh.de/NetServer/PublicationSearchControllerServlet?searchText={q}"),
+    (('Thüringen',), "https://www.portal.thueringen.de/vergabe?search={q}"),
+    # National platforms
+    (('DTVP',), "https://www.dtvp.de/Center/common/project/search.do?search={q}"),
+    (('eVergabe.de', 'Evergabe.de'), "https://www.evergabe.de/unterlagen?searchText={q}"),
+    (('Öffentliche Vergabe',), "https://www.oeffentlichevergabe.de/search?q={q}"),
+    # Switzerland
+    (('SIMAP', 'simap.ch'), "https://www.simap.ch/shabforms/COMMON/search/searchresultListAction.do?searchString={q}"),
+    # Hospital platforms
+    (('Charité',), "https://vergabeplattform.charite.de/search?q={q}"),
+    (('Vivantes',), "https://www.vivantes.de/unternehmen/ausschreibungen?search={q}"),
+    (('UKE', 'KFE'), "https://www.uke.de/organisationsstruktur/tochtergesellschaften/kfe/ausschreibungen?search={q}"),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def application_url_template(platform_source: str) -> Optional[str]:
+    """Search URL template for a platform, or None; resolved once per platform name"""
+    lowered = platform_source.lower()
+    for needles, template in APPLICATION_URL_TEMPLATES:
+        if any(needle in platform_source or needle in lowered for needle in needles):
+            return template
+    return None
+
+
+# Federal and state portals republish the same tenders, so categorization is
+# memoized on the lowercased text
+@functools.lru_cache(maxsize=4096)
+def categorize_text(text: str) -> tuple:
+    """Return (category, building_typology, is_relevant) for lowercased tender text"""
+    return (
+        _first_match(CATEGORY_PATTERNS, text) or "General",
+        _first_match(TYPOLOGY_PATTERNS, text),
+        bool(RELEVANCE_PATTERN.search(text)),
+    )
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'de-DE,de;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'br, gzip, deflate',
+}
+
+# Per-request timeout; a server that trickles data fails on sock_read instead of
+# holding the request for the whole 30 s
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10, sock_read=20)
+
+# Listing pages are cut off at this many decompressed bytes before parsing
+MAX_PAGE_BYTES = 2_000_000
+
+# Cap on HTTP requests in flight in one scraping run; bursts beyond this get
+# connection errors and rate limiting from the portals
+MAX_CONCURRENT_REQUESTS = 16
+
+
+def new_session() -> aiohttp.ClientSession:
+    """Session for one scraping run; the scrapers of the run share it, so keep-alive
+    connections and DNS lookups are reused across portals that share hosts or CDNs"""
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=20,
+        ttl_dns_cache=300,
+        keepalive_timeout=30,
+    )
+    return aiohttp.ClientSession(connector=connector, headers=DEFAULT_HEADERS)
+
+
 class TenderScraper:
     """Base scraper class for German tender portals"""
     
-    def __init__(self):
-        self.session = None
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'de-DE,de;q=0.9,en;q=0.8',
-        }
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None,
+                 request_slots: Optional[asyncio.Semaphore] = None):
+        # A session passed in is shared with other scrapers and closed by whoever
+        # created it; without one the scraper opens and closes its own
+        self.session = session
+        self._owns_session = session is None
+        # Every request is made under this semaphore; scrapers of one run share it
+        self.request_slots = request_slots
+        self.headers = DEFAULT_HEADERS
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(headers=self.headers)
+        if self._owns_session:
+            self.session = new_session()
+        if self.request_slots is None:
+            self.request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self._owns_session:
             await self.session.close()
+        self.session = None
+    
+    def _pass_times(self) -> tuple:
+        """(now, default deadline, scraped_at), sampled once per scrape pass and
+        shared by all tenders of that pass"""
+        now = datetime.now()
+        return now, now + timedelta(days=30), datetime.utcnow()
+    
+    async def _read_html(self, response) -> str:
+        """Response body, read in chunks up to MAX_PAGE_BYTES and decoded with its
+        declared charset (UTF-8 if none); undecodable bytes are replaced instead of
+        failing the whole page"""
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(16384):
+            body += chunk
+            if len(body) >= MAX_PAGE_BYTES:
+                del body[MAX_PAGE_BYTES:]
+                logger.warning(f"Truncated {response.url} at {MAX_PAGE_BYTES} bytes")
+                break
+        try:
+            return body.decode(response.charset or 'utf-8', errors='replace')
+        except LookupError:
+            return body.decode('utf-8', errors='replace')
+    
+    async def scrape_iter(self, *args, **kwargs) -> AsyncIterator[Dict]:
+        """Yield the tenders of scrape() one by one; scrapers that can produce
+        them incrementally override this"""
+        for tender in await self.scrape(*args, **kwargs):
+            yield tender
     
     def generate_tender_id(self, title: str, platform: str, deadline: str) -> str:
         """Generate unique ID for tender deduplication"""
         unique_string = f"{title}_{platform}_{deadline}"
-        return hashlib.md5(unique_string.encode()).hexdigest()[:16]
+        # 64-bit BLAKE2b digest: the same 16 hex characters as the truncated MD5 it replaces
+        return hashlib.blake2b(unique_string.encode(), digest_size=8).hexdigest()
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
         if not text:
             return ""
-        return re.sub(r'\s+', ' ', text.strip())
+        # str.split() splits on the same characters as \s, so this equals
+        # re.sub(r'\s+', ' ', text.strip()) without going through the regex engine
+        return ' '.join(text.split())
     
     def parse_german_date(self, date_str: str) -> Optional[datetime]:
         """Parse German date formats"""
@@ -50,19 +251,30 @@ class TenderScraper:
             return None
         
         date_str = self.clean_text(date_str)
-        formats = [
-            "%d.%m.%Y",
-            "%d.%m.%Y %H:%M",
-            "%Y-%m-%d",
-            "%d/%m/%Y",
-            "%d. %B %Y",
-        ]
-        
-        for fmt in formats:
+        
+        # "%d.%m.%Y", "%d.%m.%Y %H:%M", "%d/%m/%Y" and "%Y-%m-%d" without strptime's
+        # raise-and-retry per format; out-of-range dates still fail in datetime()
+        match = DMY_DATE_RE.fullmatch(date_str)
+        if match:
+            day, separator, month, year, hour, minute = match.groups()
+            if separator == '/' and hour is not None:
+                return None
+            fields = (year, month, day, hour or 0, minute or 0)
+        else:
+            match = ISO_DATE_RE.fullmatch(date_str)
+            fields = match.groups() if match else None
+        if fields:
             try:
-                return datetime.strptime(date_str, fmt)
+                return datetime(*map(int, fields))
             except ValueError:
-                continue
+                return None
+        
+        # Month names ("%d. %B %Y") are left to strptime
+        if '. ' in date_str:
+            try:
+                return datetime.strptime(date_str, "%d. %B %Y")
+            except ValueError:
+                pass
         
         return None
     
@@ -71,10 +283,10 @@ class TenderScraper:
         if not budget_str:
             return None
         
-        # Extract numbers and format
-        numbers = re.findall(r'[\d.,]+', budget_str)
-        if numbers:
-            amount = numbers[0].replace('.', '').replace(',', '.')
+        # Extract the first number and format it
+        number = BUDGET_NUMBER_RE.search(budget_str)
+        if number:
+            amount = number.group(0).replace('.', '').replace(',', '.')
             try:
                 value = float(amount)
                 if value >= 1000000:
@@ -88,162 +300,24 @@ class TenderScraper:
         
         return budget_str if budget_str else None
     
-    def categorize_tender(self, title: str, description: str) -> Dict[str, str]:
-        """Categorize tender based on content - focused on construction project management"""
+    def categorize_tender(self, title: str, description: str, relevant_only: bool = False) -> Dict[str, str]:
+        """Categorize tender based on content - focused on construction project management.
+        With relevant_only, tenders without construction terms skip the category and
+        typology scans and come back as General/None."""
         text = f"{title} {description}".lower()
-        
-        # Check if this is a relevant construction/project management tender
-        construction_keywords = [
-            'bau', 'construction', 'neubau', 'umbau', 'sanierung', 'renovierung',
-            'architektur', 'architect', 'planung', 'planning', 'ingenieur', 'engineer',
-            'hochbau', 'tiefbau', 'gebäude', 'building', 'projekt', 'project',
-            'immobilie', 'real estate', 'facility', 'facilities', 'infrastruktur',
-            'wettbewerb', 'competition', 'controlling', 'management'
-        ]
-        
-        is_relevant = any(kw in text for kw in construction_keywords)
-        
-        # Category detection - focused on construction project management services
-        category = "General"
-        
-        # Integrierte Projektabwicklung (German term for IPA)
-        if any(word in text for word in ['integrierte projektabwicklung', 'ipa verfahren', 'allianzvertrag', 'projektallianzen']):
-            category = "Integrierte Projektabwicklung"
-        # Integrated Project Management
-        elif any(word in text for word in ['integrated project management', 'integriertes projektmanagement', 'gesamtprojektmanagement']):
-            category = "Integrated Project Management"
-        # PMO - Project Management Office
-        elif any(word in text for word in ['pmo', 'project management office', 'projektmanagementbüro', 'projektbüro']):
-            category = "PMO"
-        # Wettbewerbsbegleitung - Competition Management
-        elif any(word in text for word in ['wettbewerbsbegleitung', 'wettbewerb', 'competition management', 'architekturwettbewerb', 'vergabewettbewerb']):
-            category = "Wettbewerbsbegleitung"
-        # Finanzcontrolling - Financial Controlling
-        elif any(word in text for word in ['finanzcontrolling', 'financial controlling', 'finanzsteuerung', 'budgetcontrolling', 'kostencontrolling']):
-            category = "Finanzcontrolling"
-        # Agiles Projektmanagement - Agile Project Management
-        elif any(word in text for word in ['agil', 'agile', 'scrum', 'kanban', 'agiles projektmanagement', 'agile project']):
-            category = "Agiles Projektmanagement"
-        # Projekt Coaching - Project Coaching
-        elif any(word in text for word in ['projekt coaching', 'project coaching', 'projektcoaching', 'bauherrenberatung', 'projektberatung']):
-            category = "Projekt Coaching"
-        # Nutzermanagement - User Management
-        elif any(word in text for word in ['nutzermanagement', 'user management', 'nutzerbetreuung', 'nutzerkoordination', 'stakeholder management']):
-            category = "Nutzermanagement"
-        # Krisenmanagement - Crisis Management
-        elif any(word in text for word in ['krisenmanagement', 'crisis management', 'konfliktmanagement', 'claim management', 'claimmanagement']):
-            category = "Krisenmanagement"
-        # Vertragsmanagement - Contract Management
-        elif any(word in text for word in ['vertragsmanagement', 'contract management', 'vertragssteuerung', 'nachtragsmanagement', 'vertragscontrolling']):
-            category = "Vertragsmanagement"
-        # Risikomanagement - Risk Management
-        elif any(word in text for word in ['risikomanagement', 'risk management', 'risikoanalyse', 'risikobewertung', 'risikosteuerung']):
-            category = "Risikomanagement"
-        # Lean Management
-        elif any(word in text for word in ['lean', 'lean construction', 'lean management', 'prozessoptimierung']):
-            category = "Lean Management"
-        # Construction Supervision
-        elif any(word in text for word in ['bauüberwachung', 'construction supervision', 'bauleitung', 'bauaufsicht', 'baubegleitung', 'objektüberwachung']):
-            category = "Bauüberwachung"
-        # Cost Management
-        elif any(word in text for word in ['kostenmanagement', 'cost management', 'kostensteuerung', 'kostenkontrolle', 'kalkulation']):
-            category = "Kostenmanagement"
-        # Project Management (general)
-        elif any(word in text for word in ['projektmanagement', 'project management', 'projektsteuerung', 'projektleitung']):
-            category = "Projektmanagement"
-        # Procurement
-        elif any(word in text for word in ['beschaffung', 'procurement', 'einkauf', 'vergabemanagement']):
-            category = "Beschaffungsmanagement"
-        
-        # Building typology detection - more keywords
-        building_typology = None
-        if any(word in text for word in ['krankenhaus', 'klinik', 'hospital', 'medizin', 'gesundheit', 'pflege', 'praxis', 'ambulanz']):
-            building_typology = "Healthcare"
-        elif any(word in text for word in ['rechenzentrum', 'data center', 'datacenter', 'serverraum', 'it-infrastruktur']):
-            building_typology = "Data Center"
-        elif any(word in text for word in ['wohn', 'residential', 'apartment', 'wohnung', 'mehrfamilienhaus', 'einfamilienhaus', 'siedlung']):
-            building_typology = "Residential"
-        elif any(word in text for word in ['büro', 'office', 'gewerbe', 'commercial', 'geschäftshaus', 'verwaltung']):
-            building_typology = "Commercial"
-        elif any(word in text for word in ['mixed', 'gemischt', 'quartier']):
-            building_typology = "Mixed-Use"
-        elif any(word in text for word in ['industrie', 'industrial', 'fabrik', 'werk', 'produktion', 'lager', 'logistik']):
-            building_typology = "Industrial"
-        elif any(word in text for word in ['infrastruktur', 'brücke', 'tunnel', 'straße', 'autobahn', 'schiene', 'bahn', 'verkehr']):
-            building_typology = "Infrastructure"
-        elif any(word in text for word in ['schule', 'universität', 'bildung', 'education', 'hochschule', 'gymnasium', 'campus']):
-            building_typology = "Education"
-        elif any(word in text for word in ['sport', 'stadion', 'arena', 'schwimmbad', 'turnhalle']):
-            building_typology = "Sports"
-        elif any(word in text for word in ['hotel', 'gastro', 'restaurant', 'hospitality']):
-            building_typology = "Hospitality"
-        
+        if relevant_only and not RELEVANCE_PATTERN.search(text):
+            return {"category": "General", "building_typology": None, "is_relevant": False}
+        category, building_typology, is_relevant = categorize_text(text)
         return {"category": category, "building_typology": building_typology, "is_relevant": is_relevant}
     
     def generate_application_url(self, title: str, platform_source: str, platform_url: str) -> str:
         """Generate a search URL to find the specific tender on the platform"""
-        from urllib.parse import quote_plus
-        
-        # Clean and encode the title for search
-        search_title = title[:80]  # Limit length
-        encoded_title = quote_plus(search_title)
-        
-        # Platform-specific search URLs
-        if 'Bayern' in platform_source:
-            return f"https://www.auftraege.bayern.de/NetServer/PublicationSearchControllerServlet?searchText={encoded_title}"
-        elif 'NRW' in platform_source:
-            return f"https://www.evergabe.nrw.de/VMPSatellite/public/search?q={encoded_title}"
-        elif 'Berlin' in platform_source:
-            return f"https://www.berlin.de/vergabeplattform/veroeffentlichungen/bekanntmachungen/?q={encoded_title}"
-        elif 'Hamburg' in platform_source:
-            return f"https://fbhh-evergabe.web.hamburg.de/evergabe.bieter/eva/supplierportal/fhh/subproject/search?searchText={encoded_title}"
-        elif 'Sachsen' in platform_source and 'Anhalt' not in platform_source:
-            return f"https://www.sachsen-vergabe.de/vergabe/bekanntmachung/?search={encoded_title}"
-        elif 'Baden-Württemberg' in platform_source or 'bw' in platform_source.lower():
-            return f"https://vergabe.landbw.de/NetServer/PublicationSearchControllerServlet?searchText={encoded_title}"
-        elif 'TED' in platform_source or 'Europa' in platform_source:
-            return f"https://ted.europa.eu/de/search/result?q={encoded_title}"
-        elif 'Bund' in platform_source:
-            return f"https://www.service.bund.de/Content/DE/Ausschreibungen/Suche/Ergebnis.html?searchText={encoded_title}"
-        # New platforms from PDF
-        elif 'Hessen' in platform_source or 'HAD' in platform_source:
-            return f"https://www.had.de/NetServer/PublicationSearchControllerServlet?searchText={encoded_title}"
-        elif 'Niedersachsen' in platform_source:
-            return f"https://vergabe.niedersachsen.de/NetServer/PublicationSearchControllerServlet?searchText={encoded_title}"
-        elif 'Bremen' in platform_source:
-            return f"https://www.vergabe.bremen.de/NetServer/PublicationSearchControllerServlet?searchText={encoded_title}"
-        elif 'Brandenburg' in platform_source:
-            return f"https://vergabemarktplatz.brandenburg.de/VMPSatellite/public/search?q={encoded_title}"
-        elif 'Rheinland-Pfalz' in platform_source or 'RLP' in platform_source:
-            return f"https://www.vergabe.rlp.de/VMPSatellite/public/search?q={encoded_title}"
-        elif 'Saarland' in platform_source:
-            return f"https://vergabe.saarland/NetServer/PublicationSearchControllerServlet?searchText={encoded_title}"
-        elif 'Sachsen-Anhalt' in platform_source:
-            return f"https://www.evergabe.sachsen-anhalt.de/NetServer/PublicationSearchControllerServlet?searchText={encoded_title}"
-        elif 'Schleswig-Holstein' in platform_source:
-            return f"https://www.e-vergabe-sh.de/NetServer/PublicationSearchControllerServlet?searchText={encoded_title}"
-        elif 'Thüringen' in platform_source:
-            return f"https://www.portal.thueringen.de/vergabe?search={encoded_title}"
-        # National platforms
-        elif 'DTVP' in platform_source:
-            return f"https://www.dtvp.de/Center/common/project/search.do?search={encoded_title}"
-        elif 'eVergabe.de' in platform_source or 'Evergabe.de' in platform_source:
-            return f"https://www.evergabe.de/unterlagen?searchText={encoded_title}"
-        elif 'Öffentliche Vergabe' in platform_source:
-            return f"https://www.oeffentlichevergabe.de/search?q={encoded_title}"
-        # Switzerland
-        elif 'SIMAP' in platform_source or 'simap.ch' in platform_source.lower():
-            return f"https://www.simap.ch/shabforms/COMMON/search/searchresultListAction.do?searchString={encoded_title}"
-        # Hospital platforms
-        elif 'Charité' in platform_source:
-            return f"https://vergabeplattform.charite.de/search?q={encoded_title}"
-        elif 'Vivantes' in platform_source:
-            return f"https://www.vivantes.de/unternehmen/ausschreibungen?search={encoded_title}"
-        elif 'UKE' in platform_source or 'KFE' in platform_source:
-            return f"https://www.uke.de/organisationsstruktur/tochtergesellschaften/kfe/ausschreibungen?search={encoded_title}"
-        else:
+        template = application_url_template(platform_source)
+        if template is None:
             # Fallback to platform URL
             return platform_url
+        # Clean and encode the title for search (limit length)
+        return template.format(q=quote_plus(title[:80]))
 
 
 class BundDeScraper(TenderScraper):
@@ -254,7 +328,11 @@ class BundDeScraper(TenderScraper):
     
     async def scrape(self, max_results: int = 50) -> List[Dict]:
         """Scrape tenders from Bund.de"""
-        tenders = []
+        return [tender async for tender in self.scrape_iter(max_results)]
+    
+    async def scrape_iter(self, max_results: int = 50) -> AsyncIterator[Dict]:
+        """Yield tenders from Bund.de as each listing is parsed"""
+        html = None
         
         try:
             # Note: Bund.de requires specific parameters and may have anti-bot measures
@@ -264,79 +342,81 @@ class BundDeScraper(TenderScraper):
                 'sortOrder': 'dateDesc',
             }
             
-            async with self.session.get(
+            async with self.request_slots, self.session.get(
                 f"{self.BASE_URL}/Content/DE/Ausschreibungen/Suche/Ergebnis.html",
                 params=search_params,
-                timeout=aiohttp.ClientTimeout(total=30)
+                timeout=REQUEST_TIMEOUT
             ) as response:
                 if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'lxml')
-                    
-                    # Parse tender listings
-                    tender_items = soup.select('.searchresult-item, .result-item, article')
-                    
-                    for item in tender_items[:max_results]:
-                        try:
-                            tender = self._parse_tender_item(item)
-                            if tender:
-                                tenders.append(tender)
-                        except Exception as e:
-                            logger.warning(f"Error parsing Bund.de tender: {e}")
-                            continue
+                    html = await self._read_html(response)
                 else:
                     logger.warning(f"Bund.de returned status {response.status}")
                     
         except Exception as e:
             logger.error(f"Error scraping Bund.de: {e}")
         
-        return tenders
+        if not html:
+            return
+        
+        # Parse tender listings once the response (and its request slot) is released
+        tree = LexborHTMLParser(html)
+        tender_items = select_all(tree, '.searchresult-item, .result-item, article')
+        now, default_deadline, scraped_at = self._pass_times()
+        
+        for item in tender_items[:max_results]:
+            try:
+                tender = self._parse_tender_item(item, now, default_deadline, scraped_at)
+            except Exception as e:
+                logger.warning(f"Error parsing Bund.de tender: {e}")
+                continue
+            if tender:
+                yield tender
     
-    def _parse_tender_item(self, item) -> Optional[Dict]:
+    def _parse_tender_item(self, item, now: datetime, default_deadline: datetime, scraped_at: datetime) -> Optional[Dict]:
         """Parse a single tender item from Bund.de"""
-        title_elem = item.select_one('h2, h3, .title, a')
+        title_elem = select_descendant(item, 'h2, h3, .title, a')
         if not title_elem:
             return None
         
-        title = self.clean_text(title_elem.get_text())
+        title = self.clean_text(title_elem.text())
         if not title:
             return None
         
         # Extract other fields
         description = ""
-        desc_elem = item.select_one('.description, .abstract, p')
+        desc_elem = select_descendant(item, '.description, .abstract, p')
         if desc_elem:
-            description = self.clean_text(desc_elem.get_text())
+            description = self.clean_text(desc_elem.text())
         
         # Extract deadline
-        deadline = datetime.now() + timedelta(days=30)  # Default
-        deadline_elem = item.select_one('.deadline, .date, time')
+        deadline = default_deadline
+        deadline_elem = select_descendant(item, '.deadline, .date, time')
         if deadline_elem:
-            parsed = self.parse_german_date(deadline_elem.get_text())
+            parsed = self.parse_german_date(deadline_elem.text())
             if parsed:
                 deadline = parsed
         
         # Extract location
         location = "Deutschland"
-        location_elem = item.select_one('.location, .ort')
+        location_elem = select_descendant(item, '.location, .ort')
         if location_elem:
-            location = self.clean_text(location_elem.get_text()) or location
+            location = self.clean_text(location_elem.text()) or location
         
         # Get links - both detail and application
         detail_link = ""
         application_link = ""
-        link_elem = item.select_one('a[href]')
+        link_elem = select_descendant(item, 'a[href]')
         if link_elem:
-            href = link_elem.get('href', '')
+            href = link_elem.attributes.get('href') or ''
             if href.startswith('/'):
                 detail_link = f"{self.BASE_URL}{href}"
             elif href.startswith('http'):
                 detail_link = href
         
         # Look for specific application link
-        apply_elem = item.select_one('a[href*="apply"], a[href*="bewerben"], a[href*="teilnahme"], .apply-link')
+        apply_elem = select_descendant(item, 'a[href*="apply"], a[href*="bewerben"], a[href*="teilnahme"], .apply-link')
         if apply_elem:
-            apply_href = apply_elem.get('href', '')
+            apply_href = apply_elem.attributes.get('href') or ''
             if apply_href.startswith('/'):
                 application_link = f"{self.BASE_URL}{apply_href}"
             elif apply_href.startswith('http'):
@@ -359,7 +439,7 @@ class BundDeScraper(TenderScraper):
             "contracting_authority": "Bundesrepublik Deutschland",
             "participants": [],
             "contact_details": {},
-            "tender_date": datetime.now(),
+            "tender_date": now,
             "category": categories["category"],
             "building_typology": categories["building_typology"],
             "platform_source": "Bund.de",
@@ -369,7 +449,7 @@ class BundDeScraper(TenderScraper):
             "is_applied": False,
             "application_status": "Not Applied",
             "linkedin_connections": [],
-            "scraped_at": datetime.utcnow(),
+            "scraped_at": scraped_at,
             "source_id": self.generate_tender_id(title, "bund.de", str(deadline)),
         }
 
@@ -383,6 +463,7 @@ class TEDEuropaScraper(TenderScraper):
     async def scrape(self, max_results: int = 50) -> List[Dict]:
         """Scrape German construction tenders from TED Europa"""
         tenders = []
+        api_failed = False
         
         try:
             # TED has a public API
@@ -394,18 +475,21 @@ class TEDEuropaScraper(TenderScraper):
                 'sortOrder': 'desc',
             }
             
-            async with self.session.get(
+            async with self.request_slots, self.session.get(
                 self.API_URL,
                 params=params,
-                timeout=aiohttp.ClientTimeout(total=30)
+                timeout=REQUEST_TIMEOUT
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    # orjson parses the raw body directly; malformed JSON raises
+                    # ValueError and falls back to HTML scraping like before
+                    data = orjson.loads(await response.read())
                     notices = data.get('notices', []) if isinstance(data, dict) else []
+                    now, default_deadline, scraped_at = self._pass_times()
                     
                     for notice in notices[:max_results]:
                         try:
-                            tender = self._parse_notice(notice)
+                            tender = self._parse_notice(notice, now, default_deadline, scraped_at)
                             if tender:
                                 tenders.append(tender)
                         except Exception as e:
@@ -413,12 +497,14 @@ class TEDEuropaScraper(TenderScraper):
                             continue
                 else:
                     logger.warning(f"TED API returned status {response.status}")
-                    # Fallback to HTML scraping
-                    tenders = await self._scrape_html(max_results)
+                    api_failed = True
                     
         except Exception as e:
             logger.error(f"Error scraping TED: {e}")
-            # Fallback
+            api_failed = True
+        
+        # Fallback to HTML scraping, once the API request has given up its slot
+        if api_failed:
             tenders = await self._scrape_html(max_results)
         
         return tenders
@@ -430,18 +516,19 @@ class TEDEuropaScraper(TenderScraper):
         try:
             search_url = f"{self.BASE_URL}/de/search/result?q=CY%3D%5BDE%5D"
             
-            async with self.session.get(
+            async with self.request_slots, self.session.get(
                 search_url,
-                timeout=aiohttp.ClientTimeout(total=30)
+                timeout=REQUEST_TIMEOUT
             ) as response:
                 if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'lxml')
+                    html = await self._read_html(response)
+                    tree = LexborHTMLParser(html)
                     
-                    items = soup.select('.notice-item, .search-result, article')
+                    items = select_all(tree, '.notice-item, .search-result, article')
+                    now, default_deadline, scraped_at = self._pass_times()
                     
                     for item in items[:max_results]:
-                        tender = self._parse_html_item(item)
+                        tender = self._parse_html_item(item, now, default_deadline, scraped_at)
                         if tender:
                             tenders.append(tender)
                             
@@ -450,7 +537,7 @@ class TEDEuropaScraper(TenderScraper):
         
         return tenders
     
-    def _parse_notice(self, notice: Dict) -> Optional[Dict]:
+    def _parse_notice(self, notice: Dict, now: datetime, default_deadline: datetime, scraped_at: datetime) -> Optional[Dict]:
         """Parse a TED API notice"""
         title = notice.get('title', {}).get('deu', '') or notice.get('title', {}).get('eng', '')
         if not title:
@@ -460,7 +547,7 @@ class TEDEuropaScraper(TenderScraper):
         
         # Parse deadline
         deadline_str = notice.get('submissionDeadline', '')
-        deadline = self.parse_german_date(deadline_str) or (datetime.now() + timedelta(days=30))
+        deadline = self.parse_german_date(deadline_str) or default_deadline
         
         # Get organization
         org = notice.get('buyerName', {}).get('deu', '') or 'EU Contracting Authority'
@@ -491,7 +578,7 @@ class TEDEuropaScraper(TenderScraper):
             "contracting_authority": org,
             "participants": [],
             "contact_details": {},
-            "tender_date": datetime.now(),
+            "tender_date": now,
             "category": categories["category"],
             "building_typology": categories["building_typology"],
             "platform_source": "TED Europa",
@@ -501,17 +588,17 @@ class TEDEuropaScraper(TenderScraper):
             "is_applied": False,
             "application_status": "Not Applied",
             "linkedin_connections": [],
-            "scraped_at": datetime.utcnow(),
+            "scraped_at": scraped_at,
             "source_id": self.generate_tender_id(title, "ted.europa", str(deadline)),
         }
     
-    def _parse_html_item(self, item) -> Optional[Dict]:
+    def _parse_html_item(self, item, now: datetime, default_deadline: datetime, scraped_at: datetime) -> Optional[Dict]:
         """Parse HTML item from TED search results"""
-        title_elem = item.select_one('h2, h3, .title, a')
+        title_elem = select_descendant(item, 'h2, h3, .title, a')
         if not title_elem:
             return None
         
-        title = self.clean_text(title_elem.get_text())
+        title = self.clean_text(title_elem.text())
         if not title:
             return None
         
@@ -521,13 +608,13 @@ class TEDEuropaScraper(TenderScraper):
             "title": title,
             "description": f"EU Tender: {title}",
             "budget": None,
-            "deadline": datetime.now() + timedelta(days=30),
+            "deadline": default_deadline,
             "location": "Deutschland",
             "project_type": "EU Procurement",
             "contracting_authority": "EU Contracting Authority",
             "participants": [],
             "contact_details": {},
-            "tender_date": datetime.now(),
+            "tender_date": now,
             "category": categories["category"],
             "building_typology": categories["building_typology"],
             "platform_source": "TED Europa",
@@ -536,340 +623,414 @@ class TEDEuropaScraper(TenderScraper):
             "is_applied": False,
             "application_status": "Not Applied",
             "linkedin_connections": [],
-            "scraped_at": datetime.utcnow(),
+            "scraped_at": scraped_at,
             "source_id": self.generate_tender_id(title, "ted.europa", ""),
         }
 
 
+@dataclass(frozen=True, slots=True)
+class Portal:
+    """A tender portal scraped by StateTenderScraper"""
+    key: str
+    name: str
+    url: str
+    region: str
+    application_base: str
+
+
 class StateTenderScraper(TenderScraper):
     """Generic scraper for German state tender portals"""
     
-    PORTALS = {
+    # Generic selectors for tender listings
+    ITEM_SELECTOR = (
+        '.tender-item, .ausschreibung, .search-result, '
+        '.list-item, article, .entry, tr[class*="tender"]'
+    )
+    TITLE_SELECTOR = 'h2, h3, h4, .title, a, td:first-child'
+    DESCRIPTION_SELECTOR = '.description, .abstract, p, td:nth-child(2)'
+    DEADLINE_SELECTOR = '.deadline, .date, time, td:last-child'
+    LINK_SELECTOR = 'a[href]'
+    
+    PORTALS = (
         # Bavaria
-        "bayern": {
-            "name": "Vergabe Bayern",
-            "url": "https://www.auftraege.bayern.de",
-            "region": "Bayern",
-            "application_base": "https://www.auftraege.bayern.de/NetServer/PublicationControllerServlet"
-        },
+        Portal(
+            key="bayern",
+            name="Vergabe Bayern",
+            url="https://www.auftraege.bayern.de",
+            region="Bayern",
+            application_base="https://www.auftraege.bayern.de/NetServer/PublicationControllerServlet"
+        ),
         # North Rhine-Westphalia
-        "nrw": {
-            "name": "e-Vergabe NRW", 
-            "url": "https://www.evergabe.nrw.de",
-            "region": "Nordrhein-Westfalen",
-            "application_base": "https://www.evergabe.nrw.de/VMPSatellite/public/bekanntmachung"
-        },
+        Portal(
+            key="nrw",
+            name="e-Vergabe NRW",
+            url="https://www.evergabe.nrw.de",
+            region="Nordrhein-Westfalen",
+            application_base="https://www.evergabe.nrw.de/VMPSatellite/public/bekanntmachung"
+        ),
         # Berlin
-        "berlin": {
-            "name": "Vergabeplattform Berlin",
-            "url": "https://www.berlin.de/vergabeplattform",
-            "region": "Berlin",
-            "application_base": "https://www.berlin.de/vergabeplattform/veroeffentlichungen/bekanntmachungen/"
-        },
+        Portal(
+            key="berlin",
+            name="Vergabeplattform Berlin",
+            url="https://www.berlin.de/vergabeplattform",
+            region="Berlin",
+            application_base="https://www.berlin.de/vergabeplattform/veroeffentlichungen/bekanntmachungen/"
+        ),
         # Hamburg
-        "hamburg": {
-            "name": "Hamburg Vergabe",
-            "url": "https://fbhh-evergabe.web.hamburg.de/evergabe.bieter/eva/supplierportal/fhh/tabs/home",
-            "region": "Hamburg",
-            "application_base": "https://fbhh-evergabe.web.hamburg.de/evergabe.bieter/eva/supplierportal/fhh/subproject/search"
-        },
+        Portal(
+            key="hamburg",
+            name="Hamburg Vergabe",
+            url="https://fbhh-evergabe.web.hamburg.de/evergabe.bieter/eva/supplierportal/fhh/tabs/home",
+            region="Hamburg",
+            application_base="https://fbhh-evergabe.web.hamburg.de/evergabe.bieter/eva/supplierportal/fhh/subproject/search"
+        ),
         # Saxony
-        "sachsen": {
-            "name": "Sachsen Vergabe",
-            "url": "https://www.sachsen-vergabe.de",
-            "region": "Sachsen",
-            "application_base": "https://www.sachsen-vergabe.de/vergabe/bekanntmachung/"
-        },
+        Portal(
+            key="sachsen",
+            name="Sachsen Vergabe",
+            url="https://www.sachsen-vergabe.de",
+            region="Sachsen",
+            application_base="https://www.sachsen-vergabe.de/vergabe/bekanntmachung/"
+        ),
         # Baden-Württemberg
-        "bw": {
-            "name": "Vergabe Baden-Württemberg",
-            "url": "https://vergabe.landbw.de",
-            "region": "Baden-Württemberg",
-            "application_base": "https://vergabe.landbw.de/NetServer/PublicationControllerServlet"
-        },
+        Portal(
+            key="bw",
+            name="Vergabe Baden-Württemberg",
+            url="https://vergabe.landbw.de",
+            region="Baden-Württemberg",
+            application_base="https://vergabe.landbw.de/NetServer/PublicationControllerServlet"
+        ),
         # Hesse
-        "hessen": {
-            "name": "HAD Hessen",
-            "url": "https://www.had.de",
-            "region": "Hessen",
-            "application_base": "https://www.had.de/NetServer/PublicationSearchControllerServlet"
-        },
+        Portal(
+            key="hessen",
+            name="HAD Hessen",
+            url="https://www.had.de",
+            region="Hessen",
+            application_base="https://www.had.de/NetServer/PublicationSearchControllerServlet"
+        ),
         # Lower Saxony
-        "niedersachsen": {
-            "name": "Vergabe Niedersachsen",
-            "url": "https://vergabe.niedersachsen.de",
-            "region": "Niedersachsen",
-            "application_base": "https://vergabe.niedersachsen.de/NetServer/PublicationSearchControllerServlet"
-        },
+        Portal(
+            key="niedersachsen",
+            name="Vergabe Niedersachsen",
+            url="https://vergabe.niedersachsen.de",
+            region="Niedersachsen",
+            application_base="https://vergabe.niedersachsen.de/NetServer/PublicationSearchControllerServlet"
+        ),
         # Bremen
-        "bremen": {
-            "name": "Vergabe Bremen",
-            "url": "https://www.vergabe.bremen.de",
-            "region": "Bremen",
-            "application_base": "https://www.vergabe.bremen.de/NetServer/PublicationSearchControllerServlet"
-        },
+        Portal(
+            key="bremen",
+            name="Vergabe Bremen",
+            url="https://www.vergabe.bremen.de",
+            region="Bremen",
+            application_base="https://www.vergabe.bremen.de/NetServer/PublicationSearchControllerServlet"
+        ),
         # Brandenburg
-        "brandenburg": {
-            "name": "Vergabemarktplatz Brandenburg",
-            "url": "https://vergabemarktplatz.brandenburg.de",
-            "region": "Brandenburg",
-            "application_base": "https://vergabemarktplatz.brandenburg.de/VMPSatellite/public/search"
-        },
+        Portal(
+            key="brandenburg",
+            name="Vergabemarktplatz Brandenburg",
+            url="https://vergabemarktplatz.brandenburg.de",
+            region="Brandenburg",
+            application_base="https://vergabemarktplatz.brandenburg.de/VMPSatellite/public/search"
+        ),
         # Rhineland-Palatinate
-        "rlp": {
-            "name": "Vergabe Rheinland-Pfalz",
-            "url": "https://www.vergabe.rlp.de",
-            "region": "Rheinland-Pfalz",
-            "application_base": "https://www.vergabe.rlp.de/VMPSatellite/public/search"
-        },
+        Portal(
+            key="rlp",
+            name="Vergabe Rheinland-Pfalz",
+            url="https://www.vergabe.rlp.de",
+            region="Rheinland-Pfalz",
+            application_base="https://www.vergabe.rlp.de/VMPSatellite/public/search"
+        ),
         # Saarland
-        "saarland": {
-            "name": "Vergabe Saarland",
-            "url": "https://vergabe.saarland",
-            "region": "Saarland",
-            "application_base": "https://vergabe.saarland/NetServer/PublicationSearchControllerServlet"
-        },
+        Portal(
+            key="saarland",
+            name="Vergabe Saarland",
+            url="https://vergabe.saarland",
+            region="Saarland",
+            application_base="https://vergabe.saarland/NetServer/PublicationSearchControllerServlet"
+        ),
         # Saxony-Anhalt
-        "sachsen_anhalt": {
-            "name": "eVergabe Sachsen-Anhalt",
-            "url": "https://www.evergabe.sachsen-anhalt.de",
-            "region": "Sachsen-Anhalt",
-            "application_base": "https://www.evergabe.sachsen-anhalt.de/NetServer/PublicationSearchControllerServlet"
-        },
+        Portal(
+            key="sachsen_anhalt",
+            name="eVergabe Sachsen-Anhalt",
+            url="https://www.evergabe.sachsen-anhalt.de",
+            region="Sachsen-Anhalt",
+            application_base="https://www.evergabe.sachsen-anhalt.de/NetServer/PublicationSearchControllerServlet"
+        ),
         # Schleswig-Holstein
-        "sh": {
-            "name": "e-Vergabe Schleswig-Holstein",
-            "url": "https://www.e-vergabe-sh.de",
-            "region": "Schleswig-Holstein",
-            "application_base": "https://www.e-vergabe-sh.de/NetServer/PublicationSearchControllerServlet"
-        },
+        Portal(
+            key="sh",
+            name="e-Vergabe Schleswig-Holstein",
+            url="https://www.e-vergabe-sh.de",
+            region="Schleswig-Holstein",
+            application_base="https://www.e-vergabe-sh.de/NetServer/PublicationSearchControllerServlet"
+        ),
         # Thuringia
-        "thueringen": {
-            "name": "Vergabe Thüringen",
-            "url": "https://www.portal.thueringen.de",
-            "region": "Thüringen",
-            "application_base": "https://www.portal.thueringen.de/vergabe"
-        }
-    }
+        Portal(
+            key="thueringen",
+            name="Vergabe Thüringen",
+            url="https://www.portal.thueringen.de",
+            region="Thüringen",
+            application_base="https://www.portal.thueringen.de/vergabe"
+        ),
+    )
+    
+    # Position of each portal in PORTALS by key
+    PORTAL_INDEX = {portal.key: i for i, portal in enumerate(PORTALS)}
     
     # Additional national platforms
-    NATIONAL_PORTALS = {
-        "dtvp": {
-            "name": "Deutsches Vergabeportal (DTVP)",
-            "url": "https://www.dtvp.de",
-            "region": "Deutschland",
-            "application_base": "https://www.dtvp.de/Center"
-        },
-        "evergabe": {
-            "name": "e-Vergabe",
-            "url": "https://www.evergabe.de",
-            "region": "Deutschland",
-            "application_base": "https://www.evergabe.de/unterlagen"
-        },
-        "oeffentliche": {
-            "name": "Öffentliche Vergabe",
-            "url": "https://www.oeffentlichevergabe.de",
-            "region": "Deutschland",
-            "application_base": "https://www.oeffentlichevergabe.de/search"
-        },
-        "ausschreibungen_de": {
-            "name": "Ausschreibungen Deutschland",
-            "url": "https://ausschreibungen-deutschland.de",
-            "region": "Deutschland",
-            "application_base": "https://ausschreibungen-deutschland.de/search"
-        }
-    }
+    NATIONAL_PORTALS = (
+        Portal(
+            key="dtvp",
+            name="Deutsches Vergabeportal (DTVP)",
+            url="https://www.dtvp.de",
+            region="Deutschland",
+            application_base="https://www.dtvp.de/Center"
+        ),
+        Portal(
+            key="evergabe",
+            name="e-Vergabe",
+            url="https://www.evergabe.de",
+            region="Deutschland",
+            application_base="https://www.evergabe.de/unterlagen"
+        ),
+        Portal(
+            key="oeffentliche",
+            name="Öffentliche Vergabe",
+            url="https://www.oeffentlichevergabe.de",
+            region="Deutschland",
+            application_base="https://www.oeffentlichevergabe.de/search"
+        ),
+        Portal(
+            key="ausschreibungen_de",
+            name="Ausschreibungen Deutschland",
+            url="https://ausschreibungen-deutschland.de",
+            region="Deutschland",
+            application_base="https://ausschreibungen-deutschland.de/search"
+        ),
+    )
     
     # Hospital/Klinikum platforms
-    HOSPITAL_PORTALS = {
-        "charite": {
-            "name": "Charité Vergabeplattform",
-            "url": "https://vergabeplattform.charite.de",
-            "region": "Berlin",
-            "application_base": "https://vergabeplattform.charite.de"
-        },
-        "vivantes": {
-            "name": "Vivantes",
-            "url": "https://www.vivantes.de",
-            "region": "Berlin",
-            "application_base": "https://www.vivantes.de/unternehmen/ausschreibungen"
-        },
-        "uke": {
-            "name": "UKE Hamburg (KFE)",
-            "url": "https://www.uke.de/organisationsstruktur/tochtergesellschaften/kfe/ausschreibungen",
-            "region": "Hamburg",
-            "application_base": "https://www.uke.de/organisationsstruktur/tochtergesellschaften/kfe/ausschreibungen"
-        }
-    }
+    HOSPITAL_PORTALS = (
+        Portal(
+            key="charite",
+            name="Charité Vergabeplattform",
+            url="https://vergabeplattform.charite.de",
+            region="Berlin",
+            application_base="https://vergabeplattform.charite.de"
+        ),
+        Portal(
+            key="vivantes",
+            name="Vivantes",
+            url="https://www.vivantes.de",
+            region="Berlin",
+            application_base="https://www.vivantes.de/unternehmen/ausschreibungen"
+        ),
+        Portal(
+            key="uke",
+            name="UKE Hamburg (KFE)",
+            url="https://www.uke.de/organisationsstruktur/tochtergesellschaften/kfe/ausschreibungen",
+            region="Hamburg",
+            application_base="https://www.uke.de/organisationsstruktur/tochtergesellschaften/kfe/ausschreibungen"
+        ),
+    )
     
     # Switzerland platform
-    SWISS_PORTALS = {
-        "simap": {
-            "name": "SIMAP.ch",
-            "url": "https://www.simap.ch",
-            "region": "Schweiz",
-            "application_base": "https://www.simap.ch/shabforms/COMMON/search/searchresultListAction.do"
-        }
-    }
+    SWISS_PORTALS = (
+        Portal(
+            key="simap",
+            name="SIMAP.ch",
+            url="https://www.simap.ch",
+            region="Schweiz",
+            application_base="https://www.simap.ch/shabforms/COMMON/search/searchresultListAction.do"
+        ),
+    )
     
     async def scrape(self, state: str = None, max_results: int = 20) -> List[Dict]:
         """Scrape tenders from state portals"""
         tenders = []
         
-        portals = {state: self.PORTALS[state]} if state and state in self.PORTALS else self.PORTALS
+        index = self.PORTAL_INDEX.get(state) if state else None
+        portals = (self.PORTALS[index],) if index is not None else self.PORTALS
         
-        for state_key, portal in portals.items():
-            try:
-                state_tenders = await self._scrape_portal(portal, max_results)
-                tenders.extend(state_tenders)
-            except Exception as e:
-                logger.error(f"Error scraping {portal['name']}: {e}")
+        # Portals are fetched concurrently; request_slots bounds the fan-out.
+        # _scrape_portal handles its own errors and timeouts, so one portal never
+        # cancels the others, while cancelling scrape() cancels every fetch.
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(self._scrape_portal(portal, max_results)) for portal in portals]
+        for task in tasks:
+            tenders.extend(task.result())
         
         return tenders
     
-    async def _scrape_portal(self, portal: Dict, max_results: int) -> List[Dict]:
+    async def _scrape_portal(self, portal: Portal, max_results: int) -> List[Dict]:
         """Scrape a single state portal"""
         tenders = []
         
         try:
-            async with self.session.get(
-                portal["url"],
-                timeout=aiohttp.ClientTimeout(total=30),
+            async with self.request_slots, self.session.get(
+                portal.url,
+                timeout=REQUEST_TIMEOUT,
                 ssl=False  # Some state portals have certificate issues
             ) as response:
                 if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'lxml')
-                    
-                    # Generic selectors for tender listings
-                    items = soup.select(
-                        '.tender-item, .ausschreibung, .search-result, '
-                        '.list-item, article, .entry, tr[class*="tender"]'
-                    )
+                    html = await self._read_html(response)
+                    # Links are relative to the page served after any redirects
+                    page_url = str(response.url)
+                    tree = LexborHTMLParser(html)
+                    items = select_all(tree, self.ITEM_SELECTOR)
+                    now, default_deadline, scraped_at = self._pass_times()
                     
                     for item in items[:max_results]:
-                        tender = self._parse_item(item, portal)
+                        tender = self._parse_item(item, portal, page_url, now, default_deadline, scraped_at)
                         if tender:
                             tenders.append(tender)
                 else:
-                    logger.warning(f"{portal['name']} returned status {response.status}")
+                    logger.warning(f"{portal.name} returned status {response.status}")
                     
+        except asyncio.TimeoutError:
+            logger.warning(f"{portal.name} timed out")
         except Exception as e:
-            logger.warning(f"Could not scrape {portal['name']}: {e}")
+            logger.warning(f"Could not scrape {portal.name}: {e}")
         
         return tenders
     
-    def _parse_item(self, item, portal: Dict) -> Optional[Dict]:
+    def _parse_item(self, item, portal: Portal, page_url: str, now: datetime, default_deadline: datetime, scraped_at: datetime) -> Optional[Dict]:
         """Parse a tender item from state portal"""
-        title_elem = item.select_one('h2, h3, h4, .title, a, td:first-child')
+        title_elem = select_descendant(item, self.TITLE_SELECTOR)
         if not title_elem:
             return None
         
-        title = self.clean_text(title_elem.get_text())
+        title = self.clean_text(title_elem.text())
         if not title or len(title) < 10:
             return None
         
         # Get description
         description = ""
-        desc_elem = item.select_one('.description, .abstract, p, td:nth-child(2)')
+        desc_elem = select_descendant(item, self.DESCRIPTION_SELECTOR)
         if desc_elem:
-            description = self.clean_text(desc_elem.get_text())
+            description = self.clean_text(desc_elem.text())
         
         # Categorize and check relevance
-        categories = self.categorize_tender(title, description)
+        categories = self.categorize_tender(title, description, relevant_only=True)
         
         # Skip non-relevant tenders (not construction/project related)
         if not categories.get("is_relevant", False):
             return None
         
         # Deadline
-        deadline = datetime.now() + timedelta(days=30)
-        deadline_elem = item.select_one('.deadline, .date, time, td:last-child')
+        deadline = default_deadline
+        deadline_elem = select_descendant(item, self.DEADLINE_SELECTOR)
         if deadline_elem:
-            parsed = self.parse_german_date(deadline_elem.get_text())
+            parsed = self.parse_german_date(deadline_elem.text())
             if parsed:
                 deadline = parsed
         
         # Extract detail link
-        detail_link = portal["url"]
-        link_elem = item.select_one('a[href]')
+        detail_link = portal.url
+        link_elem = select_descendant(item, self.LINK_SELECTOR)
         if link_elem:
-            href = link_elem.get('href', '')
-            if href.startswith('/'):
-                detail_link = f"{portal['url']}{href}"
-            elif href.startswith('http'):
-                detail_link = href
+            href = link_elem.attributes.get('href') or ''
+            if href:
+                # Resolved like a browser would; javascript:, mailto: and tel: links
+                # keep the portal URL
+                link = urljoin(page_url, href)
+                if urlparse(link).scheme in ('http', 'https'):
+                    detail_link = link
         
         # Generate search-based application URL for this specific tender
-        application_link = self.generate_application_url(title, portal["name"], detail_link)
+        application_link = self.generate_application_url(title, portal.name, detail_link)
         
         return {
             "title": title,
-            "description": description or f"Ausschreibung {portal['region']}: {title}",
+            "description": description or f"Ausschreibung {portal.region}: {title}",
             "budget": None,
             "deadline": deadline,
-            "location": portal["region"],
+            "location": portal.region,
             "project_type": "State Tender",
-            "contracting_authority": f"Land {portal['region']}",
+            "contracting_authority": f"Land {portal.region}",
             "participants": [],
             "contact_details": {},
-            "tender_date": datetime.now(),
+            "tender_date": now,
             "category": categories["category"],
             "building_typology": categories["building_typology"],
-            "platform_source": portal["name"],
+            "platform_source": portal.name,
             "platform_url": detail_link,
             "application_url": application_link,
             "status": "New",
             "is_applied": False,
             "application_status": "Not Applied",
             "linkedin_connections": [],
-            "scraped_at": datetime.utcnow(),
-            "source_id": self.generate_tender_id(title, portal["name"], str(deadline)),
+            "scraped_at": scraped_at,
+            "source_id": self.generate_tender_id(title, portal.name, str(deadline)),
         }
 
 
-async def scrape_all_portals(max_per_portal: int = 20) -> List[Dict]:
-    """Scrape all available tender portals"""
-    all_tenders = []
+async def merge_async(*iterators: AsyncIterator) -> AsyncIterator:
+    """Yield items from several async iterators as soon as any of them produces one"""
+    queue = asyncio.Queue()
+    finished = object()
     
-    # Scrape Bund.de
-    try:
-        async with BundDeScraper() as scraper:
-            tenders = await scraper.scrape(max_per_portal)
-            all_tenders.extend(tenders)
-            logger.info(f"Scraped {len(tenders)} tenders from Bund.de")
-    except Exception as e:
-        logger.error(f"Bund.de scraping failed: {e}")
+    async def drain(iterator):
+        try:
+            async for item in iterator:
+                await queue.put(item)
+        finally:
+            await queue.put(finished)
     
-    # Scrape TED Europa
+    tasks = [asyncio.create_task(drain(iterator)) for iterator in iterators]
     try:
-        async with TEDEuropaScraper() as scraper:
-            tenders = await scraper.scrape(max_per_portal)
-            all_tenders.extend(tenders)
-            logger.info(f"Scraped {len(tenders)} tenders from TED Europa")
-    except Exception as e:
-        logger.error(f"TED scraping failed: {e}")
-    
-    # Scrape State Portals
+        remaining = len(tasks)
+        while remaining:
+            item = await queue.get()
+            if item is finished:
+                remaining -= 1
+            else:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _portal_tenders(scraper_class, label: str, session: aiohttp.ClientSession,
+                          request_slots: asyncio.Semaphore, **kwargs) -> AsyncIterator[Dict]:
+    """Tenders of one scraper; a failing scraper is logged and ends its stream"""
+    count = 0
     try:
-        async with StateTenderScraper() as scraper:
-            tenders = await scraper.scrape(max_results=max_per_portal)
-            all_tenders.extend(tenders)
-            logger.info(f"Scraped {len(tenders)} tenders from state portals")
+        async with scraper_class(session, request_slots) as scraper:
+            async for tender in scraper.scrape_iter(**kwargs):
+                count += 1
+                yield tender
+        logger.info(f"Scraped {count} tenders from {label}")
     except Exception as e:
-        logger.error(f"State portal scraping failed: {e}")
-    
-    # Deduplicate by source_id
+        logger.error(f"{label} scraping failed: {e}")
+
+
+async def iter_all_portals(max_per_portal: int = 20) -> AsyncIterator[Dict]:
+    """Yield unique tenders from all portals as they are scraped, so callers can
+    process or store them while the other portals are still being fetched"""
+    # source_id includes the platform, so duplicates only come from the same
+    # scraper and arrive in its own order
     seen = set()
-    unique_tenders = []
-    for tender in all_tenders:
-        source_id = tender.get('source_id', '')
-        if source_id and source_id not in seen:
-            seen.add(source_id)
-            unique_tenders.append(tender)
-        elif not source_id:
-            unique_tenders.append(tender)
-    
+    # Each call has its own session and request cap, so overlapping runs never
+    # close each other's connections
+    request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    async with new_session() as session:
+        async for tender in merge_async(
+            _portal_tenders(BundDeScraper, "Bund.de", session, request_slots, max_results=max_per_portal),
+            _portal_tenders(TEDEuropaScraper, "TED Europa", session, request_slots, max_results=max_per_portal),
+            _portal_tenders(StateTenderScraper, "state portals", session, request_slots, max_results=max_per_portal),
+        ):
+            source_id = tender.get('source_id', '')
+            if source_id:
+                if source_id in seen:
+                    continue
+                seen.add(source_id)
+            yield tender
+
+
+async def scrape_all_portals(max_per_portal: int = 20) -> List[Dict]:
+    """Scrape all available tender portals"""
+    unique_tenders = [tender async for tender in iter_all_portals(max_per_portal)]
     logger.info(f"Total unique tenders scraped: {len(unique_tenders)}")
     return unique_tenders
 
@@ -3495,9 +3495,9 @@ async def auto_scrape_tenders():
         
         logger.info("🔄 Auto-scrape tenders started (Comprehensive)...")
         
-        # Run comprehensive scraper
+        # Run comprehensive scraper; platforms scraped in the last few minutes are skipped
         scraper = ComprehensiveScraper(db)
-        new_count = await scraper.scrape_all()
+        new_count = await scraper.scrape_all(skip_recent=True)
         
         # Create notifications for all users about new tenders
         if new_count > 0: